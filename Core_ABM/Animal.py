@@ -0,0 +1,546 @@
+#################################################################
+# A tiny spatially-explicit individually based model class.
+# Author: Jim Graham
+# Modified by: Melissa Kimble
+# Modification Date: 4/21/2015
+#
+# What an animal does is set by the rules of its Species, so the
+# same class runs the sheep/wolf model and the HUMAN/ZOMBIE model
+# (see the Model.py of each model folder).  On each cycle an animal:
+# - Subtracts 1 from its birth and life counters
+# - Dies if its life counter is 0 (Dies)
+# - Produces offspring if its birth counter is 0 (Reproduces)
+# - Uses Ammo to kill the animals within reach (Shoots)
+# - Eats the animals within reach (Eats)
+# - Eats the animals within reach and turns each one into a new
+#   animal of its own Species (Infects)
+# - Eats Food and picks up Ammo from the grid (Forages)
+# - Moves towards (Chases) or away from (Flees) the animals within
+#   reach, or takes a random step
+#################################################################
+
+import heapq
+import math
+
+import numpy
+
+import AnimalArrays
+import Veg
+
+#################################################################
+# Global values for the class
+#################################################################
+WIDTH=10 # width of the object on the screen
+HEIGHT=10 # height of the object on the screen
+
+CHASE_DIVISOR=10 # an animal that chases moves 1/10th of the distance towards each animal
+FLEE_DIVISOR=-5 # an animal that flees moves 1/5th of the distance away from each animal
+
+PRINT_EVENTS=False # print deaths, shootings and infections as they happen (turn off for batch runs)
+
+#################################################################
+# Private function to get where an animal is in the store (to sort
+# the animals from the spatial grid by)
+#################################################################
+
+def StoreOrder(TheAnimal):
+	return(TheAnimal.StoreIndex)
+
+#################################################################
+# The values and rules that are the same for every animal of one
+# type.  One Species object is shared by all of the animals of a
+# type so the values are not copied into every animal.
+#
+# The rules are all off when the Species is created and are turned
+# on by setting them:
+#  Dies - True to die when the life counter runs out
+#  Reproduces - True to give birth when the birth counter runs out
+#  Forages - True to eat Food (or go hungry) and pick up Ammo
+#  Shoots - (Type,Distance) to use one Ammo to kill each animal of
+#   Type that is within Distance
+#  Eats - (Type,Distance) to kill each animal of Type that is
+#   within Distance and be fed
+#  Infects - (Type,Distance) like Eats, and each animal that is
+#   eaten becomes a new animal of this Species
+#  Chases - (Type,Distance) to move towards each animal of Type
+#   that is within Distance
+#  Flees - (Type,Distance) to move away from each animal of Type
+#   that is within Distance
+#  NearestTargets - 0 to take a step for every animal of the other
+#   type when chasing or fleeing (see AnimalClass.Move), or a number
+#   of animals to take one step from the nearest ones that are within
+#   reach (see AnimalClass.MoveToNearest)
+#  Seeks - 0 to only find Food and Ammo by chance, or a distance to
+#   look for the nearest cell with Food or Ammo in it when the cell
+#   the animal is in is empty, and take a step towards it before
+#   moving (see AnimalClass.Seek)
+#################################################################
+
+class Species:
+	#################################################################
+	# Initialize the new object
+	# Inputs:
+	#  Type - number for the type of animal (e.g. TYPE_HUMAN in Model.py)
+	#  Name - name of the type of animal (for printing)
+	#  FillColor - the color of the Blob
+	#  MaxBirthCycles - number of cycles before recruitment
+	#  MaxLifeCycles - maximum number of cycles between feeding
+	#  DistanceToMove - std dev of the amount the object moves on each cycle
+	#################################################################
+	def __init__(self,Type,Name,FillColor,MaxBirthCycles,MaxLifeCycles,DistanceToMove):
+		self.Type=Type
+		self.Name=Name
+		self.FillColor=FillColor
+
+		self.MaxBirthCycles=MaxBirthCycles
+		self.MaxLifeCycles=MaxLifeCycles
+
+		self.DistanceToMove=DistanceToMove
+
+		self.Dies=False
+		self.Reproduces=False
+		self.Forages=False
+		self.Shoots=None
+		self.Eats=None
+		self.Infects=None
+		self.Chases=None
+		self.Flees=None
+		self.NearestTargets=0
+		self.Seeks=0
+
+	#################################################################
+	# The ways the animal steers when it moves
+	# Output:
+	#  list of (Type,Distance,Divisor) for Chases and Flees (empty
+	#  if the animal only takes random steps)
+	#################################################################
+	def Steering(self):
+		Result=[]
+		if self.Chases!=None: Result.append((self.Chases[0],self.Chases[1],CHASE_DIVISOR))
+		if self.Flees!=None: Result.append((self.Flees[0],self.Flees[1],FLEE_DIVISOR))
+		return(Result)
+
+	#################################################################
+	# The longest distance an animal of this Species looks for other
+	# animals (0 if it never does)
+	#################################################################
+	def MaxDistance(self):
+		Result=0
+		for Rule in (self.Shoots,self.Eats,self.Infects,self.Chases,self.Flees):
+			if Rule!=None: Result=max(Result,Rule[1])
+		return(Result)
+
+#################################################################
+# The class definition
+#################################################################
+
+class AnimalClass(object):
+	# Only the values that are different for each animal are kept in
+	# the animal (no __dict__), the rest are in its Species.
+	# Type is a copy of Species.Type because it is checked so often.
+	# Id, StoreIndex and Alive are set by the AnimalStore.
+	__slots__=("TheWorld","Species","Type","CenterX","CenterY","BirthCounter","LifeCounter","Ammo",
+		"Id","StoreIndex","Alive")
+
+	#################################################################
+	# Initialize the new object
+	# Inputs:
+	#  TheWorld - the world the object lives in (provides the bounds)
+	#  CenterX - horizontal position of the object in the world
+	#  CenterY - vertical position of the object in the world
+	#  TheSpecies - the Species the object belongs to
+	#  Ammo - how much ammo the animal has
+	#################################################################
+	def __init__(self,TheWorld,CenterX,CenterY,TheSpecies,Ammo=0):
+		self.TheWorld=TheWorld
+		self.Species=TheSpecies
+		self.Type=TheSpecies.Type
+
+		self.CenterX=CenterX
+		self.CenterY=CenterY
+
+		self.BirthCounter=TheSpecies.MaxBirthCycles
+		self.LifeCounter=TheSpecies.MaxLifeCycles
+
+		self.Ammo=Ammo
+
+		self.Alive=True
+
+	#################################################################
+	# Update the state of the individual by following the rules of
+	# its Species (see the top of the file)
+	#################################################################
+	def Update(self,TheAnimals,TheFood):
+		if not self.Age(TheAnimals): return
+		self.Hunt(TheAnimals)
+		self.FeedAndMove(TheAnimals,TheFood)
+
+	#################################################################
+	# The same as Update() but times each part with the Profiler (see
+	# Profiler.py).  AnimalStore.Update picks one of them for the
+	# whole cycle, so Update() does not check for a Profiler.
+	#################################################################
+	def ProfiledUpdate(self,TheAnimals,TheFood,Profiler):
+		if not self.Age(TheAnimals): return
+		TheSpecies=self.Species
+
+		if (TheSpecies.Shoots!=None) and (self.Ammo>0):
+			StartTime=Profiler.Clock()
+			Profiler.Add("Shoot",StartTime,self.Shoot(TheAnimals))
+
+		if TheSpecies.Eats!=None:
+			StartTime=Profiler.Clock()
+			Profiler.Add("Eat",StartTime,self.Eat(TheAnimals,TheSpecies.Eats,False))
+
+		if TheSpecies.Infects!=None:
+			StartTime=Profiler.Clock()
+			Profiler.Add("Eat",StartTime,self.Eat(TheAnimals,TheSpecies.Infects,True))
+
+		self.ProfiledFeedAndMove(TheAnimals,TheFood,Profiler)
+
+	#################################################################
+	# Private function to update the counters, and die (Dies) or give
+	# birth (Reproduces).  Returns False if the animal died.
+	#################################################################
+	def Age(self,TheAnimals):
+		TheSpecies=self.Species
+
+		# update the counters
+
+		self.BirthCounter=self.BirthCounter-1
+		self.LifeCounter=self.LifeCounter-1
+
+		# check for death
+		if (self.LifeCounter<=0) and TheSpecies.Dies: # died
+			TheAnimals.Kill(self)
+			self.TheWorld.CountEvent("Deaths")
+			if self.TheWorld.TheIndex!=None: self.TheWorld.TheIndex.Remove(self)
+			if PRINT_EVENTS: print(TheSpecies.Name+" died")
+			return(False)
+
+		# See if there was a birth
+		if (self.BirthCounter<=0) and TheSpecies.Reproduces:
+			NewBorn=AnimalClass(self.TheWorld,self.CenterX,self.CenterY,TheSpecies,self.Ammo)
+			TheAnimals.Birth(NewBorn) # added to the world at the end of the cycle
+			self.TheWorld.CountEvent("Births")
+			self.BirthCounter=TheSpecies.MaxBirthCycles
+		return(True)
+
+	#################################################################
+	# Private function to shoot, eat and infect the animals within
+	# reach (Shoots, Eats and Infects)
+	#################################################################
+	def Hunt(self,TheAnimals):
+		TheSpecies=self.Species
+
+		if (TheSpecies.Shoots!=None) and (self.Ammo>0): self.Shoot(TheAnimals)
+
+		if TheSpecies.Eats!=None: self.Eat(TheAnimals,TheSpecies.Eats,False)
+
+		if TheSpecies.Infects!=None: self.Eat(TheAnimals,TheSpecies.Infects,True)
+
+	#################################################################
+	# Private function to eat Food and pick up Ammo (Forages) and then
+	# move
+	#################################################################
+	def FeedAndMove(self,TheAnimals,TheFood):
+		if self.Species.Forages: self.Forage(TheAnimals,TheFood)
+
+		# move towards or away from the other animals, or randomly
+		self.Move(TheAnimals)
+
+	#################################################################
+	# Private function that does the same as FeedAndMove() but times
+	# each part with the Profiler
+	#################################################################
+	def ProfiledFeedAndMove(self,TheAnimals,TheFood,Profiler):
+		if self.Species.Forages:
+			StartTime=Profiler.Clock()
+			self.Forage(TheAnimals,TheFood)
+			Profiler.Add("Forage",StartTime)
+
+		StartTime=Profiler.Clock()
+		Profiler.Add("Move",StartTime,self.Move(TheAnimals))
+
+	#################################################################
+	# Private function to get the animals that may be close enough
+	# to interact with.  Without a spatial grid this is every animal.
+	# The animals from the grid are put in the order they are in the
+	# store, so they are shot and eaten in the same order (and the
+	# results are the same) as without the grid.
+	#################################################################
+	def Neighbors(self,TheAnimals):
+		TheIndex=self.TheWorld.TheIndex
+		if TheIndex==None: return(TheAnimals)
+		Nearby=TheIndex.Near(self.CenterX,self.CenterY)
+		Nearby.sort(key=StoreOrder)
+		return(Nearby)
+
+	#################################################################
+	# Private function to shoot every animal within reach (Shoots).
+	# Returns the number of animals that were looked at.
+	#################################################################
+	def Shoot(self,TheAnimals):
+		TheIndex=self.TheWorld.TheIndex
+		TargetType,Distance=self.Species.Shoots
+		Nearby=self.Neighbors(TheAnimals)
+		for TheItem in Nearby: # look for animals that are close enough to shoot
+			if TheItem.Alive and TheItem.Type==TargetType:
+				DistanceX=abs(self.CenterX-TheItem.CenterX)
+				DistanceY=abs(self.CenterY-TheItem.CenterY)
+				if (DistanceX<Distance) and (DistanceY<Distance):
+					TheAnimals.Kill(TheItem)
+					if TheIndex!=None: TheIndex.Remove(TheItem)
+					self.Ammo=self.Ammo-1 # used ammo, so ammo is reduced by one.
+					TheAnimals.NumAmmo=TheAnimals.NumAmmo-1
+					self.TheWorld.CountEvent("Shots")
+					if PRINT_EVENTS: print(TheItem.Species.Name+" was shot")
+		return(len(Nearby))
+
+	#################################################################
+	# Private function to eat every animal within reach
+	# Inputs:
+	#  Rule - (Type,Distance) from Eats or Infects
+	#  Infects - True to turn each animal that is eaten into a new
+	#   animal of this Species
+	# Returns the number of animals that were looked at.
+	#################################################################
+	def Eat(self,TheAnimals,Rule,Infects):
+		TheIndex=self.TheWorld.TheIndex
+		TheSpecies=self.Species
+		TargetType,Distance=Rule
+
+		Nearby=self.Neighbors(TheAnimals)
+		for TheItem in Nearby: # look for animals that are close enough to eat
+			if TheItem.Alive and TheItem.Type==TargetType:
+				DistanceX=abs(self.CenterX-TheItem.CenterX)
+				DistanceY=abs(self.CenterY-TheItem.CenterY)
+				if (DistanceX<Distance) and (DistanceY<Distance):
+					TheAnimals.Kill(TheItem)
+					if TheIndex!=None: TheIndex.Remove(TheItem)
+					self.LifeCounter=TheSpecies.MaxLifeCycles
+					if Infects: # the animal that was eaten comes back as one of us
+						NewBorn=AnimalClass(self.TheWorld,self.CenterX,self.CenterY,TheSpecies,self.Ammo)
+						TheAnimals.Birth(NewBorn)
+						self.TheWorld.CountEvent("Infections")
+						self.BirthCounter=TheSpecies.MaxBirthCycles
+						if PRINT_EVENTS: print(TheItem.Species.Name+" was eaten, and a "+TheSpecies.Name+" was born!")
+					else:
+						self.TheWorld.CountEvent("Eaten")
+		return(len(Nearby))
+
+	#################################################################
+	# Private function to eat Food (or go hungry) and pick up Ammo
+	# from the cell the animal is in (Forages)
+	#################################################################
+	def Forage(self,TheAnimals,TheFood):
+		Taken=TheFood.Take(self.CenterX,self.CenterY) # what was in the cell (Food, Ammo or nothing)
+		if (Taken==Veg.TYPE_FOOD): # eat the food and reset life cycle.
+			self.LifeCounter=self.Species.MaxLifeCycles
+		else:
+			self.LifeCounter=self.LifeCounter-1
+		if (Taken==Veg.TYPE_AMMO): # grab the ammo and increase +1
+			self.Ammo=self.Ammo+1
+			TheAnimals.NumAmmo=TheAnimals.NumAmmo+1
+		if (Taken==Veg.EMPTY) and (self.Species.Seeks>0): # look for a cell with something in it
+			self.Seek(TheFood)
+
+	#################################################################
+	# Private function to take a step towards the middle of the
+	# nearest cell with Food or Ammo in it that is within
+	# Species.Seeks.  The step is DistanceToMove long, or ends in the
+	# middle of the cell if that is closer.
+	#################################################################
+	def Seek(self,TheFood):
+		TargetX,TargetY,Found=TheFood.NearestFull([self.CenterX],[self.CenterY],self.Species.Seeks)
+		if not Found[0]: return
+		OffsetX=TargetX[0]-self.CenterX
+		OffsetY=TargetY[0]-self.CenterY
+		Length=math.hypot(OffsetX,OffsetY)
+		Step=self.Species.DistanceToMove
+		if Length>Step:
+			OffsetX=OffsetX*Step/Length
+			OffsetY=OffsetY*Step/Length
+		self.CenterX+=OffsetX
+		self.CenterY+=OffsetY
+
+	#################################################################
+	# Private function to move the animal.
+	# For each of its Chases and Flees rules the animal takes one step
+	# for each animal of the other type: towards (or away from) it if
+	# it is within reach, and a random step if it is not.  An animal
+	# without those rules takes one random step.
+	# Whether an animal is within reach changes with every step, so
+	# every animal of the other type is looked at even with the
+	# spatial grid (which is only kept up to date here).
+	# Returns the number of animals that were looked at.
+	#################################################################
+	def Move(self,TheAnimals):
+		TheIndex=self.TheWorld.TheIndex # spatial grid of the animals (None to check every animal)
+		Random=self.TheWorld.Random.Python("Movement") # random numbers for the random steps
+		Steering=self.Species.Steering()
+
+		if (len(Steering)>0) and (self.Species.NearestTargets>0): # one step from the nearest animals
+			return(self.MoveToNearest(TheAnimals,TheIndex,Random,Steering))
+
+		if len(Steering)==0:
+			# Move self by a random amount
+			self.CenterX+=Random.gauss(0,self.Species.DistanceToMove)
+			self.CenterY+=Random.gauss(0,self.Species.DistanceToMove)
+			self.Wrap()
+			if TheIndex!=None: TheIndex.Move(self)
+			return(0)
+
+		for OtherType,Distance,Divisor in Steering:
+			for TheItem in TheAnimals:
+				if TheItem.Alive and TheItem.Type==OtherType:
+					DistanceX=abs(self.CenterX-TheItem.CenterX)
+					DistanceY=abs(self.CenterY-TheItem.CenterY)
+					if (DistanceX<Distance) and (DistanceY<Distance):
+						self.CenterX+=DistanceX/Divisor
+						self.CenterY+=DistanceY/Divisor
+					else:
+						# Move self by a random amount if the other animal is out of reach
+						self.CenterX+=Random.gauss(0,self.Species.DistanceToMove)
+						self.CenterY+=Random.gauss(0,self.Species.DistanceToMove)
+					self.Wrap()
+		if TheIndex!=None: TheIndex.Move(self)
+		return(len(TheAnimals))
+
+	#################################################################
+	# Private function to move by one step from the nearest animals
+	# (Species.NearestTargets of them) that are within reach.
+	# For each Chases and Flees rule the animal moves 1/10th of the
+	# way towards (or 1/5th of the way away from) the middle of the
+	# nearest animals of the other type.  If there are none within
+	# reach for any rule it takes one random step instead.  The
+	# animals that are out of reach do not change how far it moves,
+	# so with the spatial grid the cost of a move does not grow with
+	# the number of animals.
+	# Returns the number of animals that were looked at.
+	#################################################################
+	def MoveToNearest(self,TheAnimals,TheIndex,Random,Steering):
+		if TheIndex!=None: Nearby=TheIndex.Near(self.CenterX,self.CenterY)
+		else: Nearby=TheAnimals
+
+		StepX=0.0
+		StepY=0.0
+		Steered=False
+		for OtherType,Distance,Divisor in Steering:
+			Targets=[]
+			for TheItem in Nearby:
+				if TheItem.Alive and TheItem.Type==OtherType:
+					OffsetX=TheItem.CenterX-self.CenterX
+					OffsetY=TheItem.CenterY-self.CenterY
+					if (abs(OffsetX)<Distance) and (abs(OffsetY)<Distance):
+						Targets.append((OffsetX*OffsetX+OffsetY*OffsetY,OffsetX,OffsetY))
+			if len(Targets)>0:
+				Targets=heapq.nsmallest(self.Species.NearestTargets,Targets)
+				StepX+=sum([Target[1] for Target in Targets])/(len(Targets)*float(Divisor))
+				StepY+=sum([Target[2] for Target in Targets])/(len(Targets)*float(Divisor))
+				Steered=True
+
+		if not Steered: # Move self by a random amount
+			StepX=Random.gauss(0,self.Species.DistanceToMove)
+			StepY=Random.gauss(0,self.Species.DistanceToMove)
+		self.CenterX+=StepX
+		self.CenterY+=StepY
+		self.Wrap()
+
+		if TheIndex!=None: TheIndex.Move(self)
+		return(len(Nearby))
+
+	#################################################################
+	# Private function to put the animal back in the world if it has
+	# moved off of the edge
+	#################################################################
+	def Wrap(self):
+		self.CenterX,self.CenterY=self.TheWorld.Wrap(self.CenterX,self.CenterY)
+
+#################################################################
+# Every animal shoots, eats and infects the animals within reach
+# at once (see AnimalStore.BatchHunting), in place of the Hunt() of
+# each animal in turn.
+#
+# All of the pairs of animals that are within reach of each other
+# are found first (with the same grid as AnimalArrays.FindPairs),
+# and then each rule is done for every animal at the same time, the
+# same way as AnimalArrays.Hunt:
+# - the animals with Ammo shoot every animal within reach.  An
+#   animal that is within reach of more than one is only shot once,
+#   by the first one in Living, and each shot uses one Ammo
+# - then the animals that eat (and then the ones that infect) do the
+#   same with the animals that were not shot
+# Because nothing changes until all of the pairs for a rule are
+# found, the animals that are killed do not depend on the order the
+# animals are updated in (only on the order of Living to break
+# ties).
+# Inputs:
+#  TheWorld - the world the animals live in
+#  Living - the animals that are alive, in the order they are updated
+#################################################################
+
+def HuntAll(TheWorld,Living):
+	TheAnimals=TheWorld.TheAnimals
+	TheIndex=TheWorld.TheIndex
+	Profiler=TheWorld.Profiler
+	if len(Living)==0: return
+
+	CenterX=numpy.array([TheAnimal.CenterX for TheAnimal in Living])
+	CenterY=numpy.array([TheAnimal.CenterY for TheAnimal in Living])
+	Type=numpy.array([TheAnimal.Type for TheAnimal in Living])
+	Ammo=numpy.array([TheAnimal.Ammo for TheAnimal in Living])
+	Alive=numpy.ones(len(Living),dtype=bool)
+	AllSpecies={}
+	for TheAnimal in Living: AllSpecies[TheAnimal.Type]=TheAnimal.Species
+	AllSpecies=[AllSpecies[Key] for Key in sorted(AllSpecies.keys())]
+
+	# one hunter for each target within reach: (Hunters,Targets) index in Living of each pair
+	def Pairs(Hunters,TargetType,Distance):
+		Targets=numpy.flatnonzero(Alive&(Type==TargetType))
+		I,J=AnimalArrays.FindPairs(CenterX[Hunters],CenterY[Hunters],CenterX[Targets],CenterY[Targets],
+			Distance,TheWorld.Width,TheWorld.Height)
+		I,J=AnimalArrays.FirstPairs(I,J)
+		return(Hunters[I],Targets[J])
+
+	def Kill(Targets,Event,Message):
+		for Target in Targets.tolist():
+			TheTarget=Living[Target]
+			TheAnimals.Kill(TheTarget)
+			if TheIndex!=None: TheIndex.Remove(TheTarget)
+			if PRINT_EVENTS and (Message!=None): print(TheTarget.Species.Name+Message)
+		Alive[Targets]=False
+		TheWorld.CountEvent(Event,len(Targets))
+
+	# animals with Ammo shoot every animal that is close enough
+	for TheSpecies in AllSpecies:
+		if TheSpecies.Shoots==None: continue
+		if Profiler!=None: StartTime=Profiler.Clock()
+		TargetType,Distance=TheSpecies.Shoots
+		Hunters,Targets=Pairs(numpy.flatnonzero(Alive&(Type==TheSpecies.Type)&(Ammo>0)),TargetType,Distance)
+		Kill(Targets,"Shots"," was shot")
+		Shooters,Shots=numpy.unique(Hunters,return_counts=True)
+		Ammo[Shooters]-=Shots
+		for Shooter,NumShots in zip(Shooters.tolist(),Shots.tolist()):
+			Living[Shooter].Ammo=Living[Shooter].Ammo-NumShots # used ammo, so ammo is reduced by one for each shot.
+		TheAnimals.NumAmmo=TheAnimals.NumAmmo-len(Targets)
+		if Profiler!=None: Profiler.Add("Shoot",StartTime,len(Targets))
+
+	# animals eat every animal that is close enough (and each one
+	# becomes one of their own kind if they infect)
+	for Infects in (False,True):
+		for TheSpecies in AllSpecies:
+			Rule=TheSpecies.Infects if Infects else TheSpecies.Eats
+			if Rule==None: continue
+			if Profiler!=None: StartTime=Profiler.Clock()
+			TargetType,Distance=Rule
+			Hunters,Targets=Pairs(numpy.flatnonzero(Alive&(Type==TheSpecies.Type)),TargetType,Distance)
+			if Infects: Kill(Targets,"Infections"," was eaten, and a "+TheSpecies.Name+" was born!")
+			else: Kill(Targets,"Eaten",None)
+			for Hunter in Hunters.tolist():
+				TheHunter=Living[Hunter]
+				TheHunter.LifeCounter=TheSpecies.MaxLifeCycles
+				if Infects: # the animal that was eaten comes back as one of us
+					TheAnimals.Birth(AnimalClass(TheWorld,TheHunter.CenterX,TheHunter.CenterY,TheSpecies,TheHunter.Ammo))
+					TheHunter.BirthCounter=TheSpecies.MaxBirthCycles
+			if Profiler!=None: Profiler.Add("Eat",StartTime,len(Targets))
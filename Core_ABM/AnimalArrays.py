@@ -0,0 +1,470 @@
+#################################################################
+# All of the animals in one set of NumPy arrays.
+#
+# This does the same thing as a list of AnimalClass objects but
+# keeps each value (CenterX, CenterY, Type, BirthCounter,
+# LifeCounter, Ammo) for every animal in one array, and updates
+# all of the animals at once with array operations.  The values
+# that are the same for every animal of a type (MaxBirthCycles,
+# DistanceToMove, the rules, ...) are stored once per type (see
+# AddSpecies).
+#
+# Each cycle is run in steps, and every step is done for all of
+# the animals before the next step starts (see Animal.py for the
+# rules):
+# - Subtract 1 from the birth and life counters
+# - Animals that die (Dies) with a life counter of 0 die
+# - Animals that reproduce (Reproduces) with a birth counter of 0
+#   give birth
+# - Animals with Ammo shoot the animals within reach (Shoots)
+# - Animals eat the animals within reach (Eats), or eat them and
+#   turn each one into one of their own kind (Infects)
+# - Animals eat Food and pick up Ammo (Forages)
+# - Animals chase, flee or take a random step (see Move)
+#
+# Because the steps are done for everyone at once, an animal that
+# is within reach of two hunters is shot (or eaten) by the first
+# one (the one that is first in the arrays), just like in
+# AnimalClass.Update.
+# New animals are added at the end of the cycle and start moving
+# in the next cycle.
+#################################################################
+
+import math
+import numpy
+
+import Kernels
+import RandomStreams
+import Veg
+
+#################################################################
+# Global values
+#################################################################
+
+# the values kept for each animal (one array for each)
+VALUE_NAMES=("CenterX","CenterY","Type","BirthCounter","LifeCounter","Ammo")
+
+#################################################################
+# Find all of the pairs of animals that are within a distance of
+# each other.  Uses a grid with cells the size of the distance so
+# only the animals in the 9 cells around each animal are compared
+# (with a compiled loop if Numba is installed, see Kernels.py).
+# Inputs:
+#  X1,Y1 - locations of the first set of animals
+#  X2,Y2 - locations of the second set of animals
+#  Distance - how close the animals need to be (in X and in Y)
+#  Width,Height - size of the world
+# Output:
+#  (I,J) arrays with the index in the first and second set of
+#  each pair that is within the distance
+#################################################################
+
+def FindPairs(X1,Y1,X2,Y2,Distance,Width,Height):
+	Empty=numpy.zeros(0,dtype=numpy.intp)
+	if (len(X1)==0) or (len(X2)==0) or (Distance<=0): return(Empty,Empty)
+
+	NumColumns=max(1,int(math.ceil(Width/float(Distance))))
+	NumRows=max(1,int(math.ceil(Height/float(Distance))))
+
+	Column1=numpy.clip((X1/Distance).astype(numpy.intp),0,NumColumns-1)
+	Row1=numpy.clip((Y1/Distance).astype(numpy.intp),0,NumRows-1)
+	Column2=numpy.clip((X2/Distance).astype(numpy.intp),0,NumColumns-1)
+	Row2=numpy.clip((Y2/Distance).astype(numpy.intp),0,NumRows-1)
+
+	# sort the second set by cell so the animals in a cell are next to each other
+	Cell2=Row2*NumColumns+Column2
+	Order=numpy.argsort(Cell2,kind="stable")
+	SortedCells=Cell2[Order]
+
+	if Kernels.Active():
+		Pairs=Kernels.FindPairs(X1,Y1,Row1,Column1,X2,Y2,SortedCells,Order,NumRows,NumColumns,Distance)
+		if Pairs!=None: return(Pairs)
+
+	AllI=[]
+	AllJ=[]
+	for RowOffset in (-1,0,1):
+		for ColumnOffset in (-1,0,1):
+			Column=Column1+ColumnOffset
+			Row=Row1+RowOffset
+			Valid=(Column>=0)&(Column<NumColumns)&(Row>=0)&(Row<NumRows)
+			Cell=Row*NumColumns+Column
+			Start=numpy.searchsorted(SortedCells,Cell,"left")
+			End=numpy.searchsorted(SortedCells,Cell,"right")
+			Counts=numpy.where(Valid,End-Start,0)
+			Total=int(Counts.sum())
+			if Total==0: continue
+			# one entry for each animal in the first set and each animal in the cell
+			I=numpy.repeat(numpy.arange(len(X1)),Counts)
+			Offsets=numpy.arange(Total)-numpy.repeat(numpy.cumsum(Counts)-Counts,Counts)
+			J=Order[numpy.repeat(Start,Counts)+Offsets]
+			Close=(numpy.abs(X1[I]-X2[J])<Distance)&(numpy.abs(Y1[I]-Y2[J])<Distance)
+			AllI.append(I[Close])
+			AllJ.append(J[Close])
+
+	if len(AllI)==0: return(Empty,Empty)
+	return(numpy.concatenate(AllI),numpy.concatenate(AllJ))
+
+#################################################################
+# Private function to pick one pair for each target.  The pair
+# with the lowest first index wins.
+# Output:
+#  (I,J) with one entry for each J that is in a pair
+#################################################################
+
+def FirstPairs(I,J):
+	Order=numpy.lexsort((I,J)) # sort by J, then by I
+	I=I[Order]
+	J=J[Order]
+	First=numpy.ones(len(J),dtype=bool)
+	First[1:]=J[1:]!=J[:-1]
+	return(I[First],J[First])
+
+#################################################################
+# The class definition
+#################################################################
+
+class AnimalArrays:
+	#################################################################
+	# Initialize the new object
+	# Inputs:
+	#  Random - the RandomStreams for the run (None for a random seed)
+	#################################################################
+	def __init__(self,Random=None):
+		if Random==None: Random=RandomStreams.RandomStreams()
+		self.MoveRandom=Random.NumPy("Movement") # random numbers for the random steps
+
+		# the values for each animal
+		self.CenterX=numpy.zeros(0)
+		self.CenterY=numpy.zeros(0)
+		self.Type=numpy.zeros(0,dtype=numpy.int8)
+		self.BirthCounter=numpy.zeros(0,dtype=numpy.int32)
+		self.LifeCounter=numpy.zeros(0,dtype=numpy.int32)
+		self.Ammo=numpy.zeros(0,dtype=numpy.int32)
+
+		# the values for each type of animal, indexed by Type
+		self.Species=[] # the Animal.Species (None for the Types that are not used)
+		self.MaxBirthCycles=numpy.zeros(0,dtype=numpy.int32)
+		self.MaxLifeCycles=numpy.zeros(0,dtype=numpy.int32)
+		self.DistanceToMove=numpy.zeros(0)
+		self.Dies=numpy.zeros(0,dtype=bool)
+		self.Reproduces=numpy.zeros(0,dtype=bool)
+		self.Forages=numpy.zeros(0,dtype=bool)
+		self.Seeks=numpy.zeros(0)
+
+	#################################################################
+	# Set the values for one type of animal from an Animal.Species
+	#################################################################
+	def AddSpecies(self,TheSpecies):
+		Type=TheSpecies.Type
+		if Type>=len(self.Species): # make room for the new Type
+			Extra=Type+1-len(self.Species)
+			self.Species.extend([None]*Extra)
+			for Name in ("MaxBirthCycles","MaxLifeCycles","DistanceToMove","Dies","Reproduces","Forages","Seeks"):
+				Values=getattr(self,Name)
+				setattr(self,Name,numpy.concatenate((Values,numpy.zeros(Extra,dtype=Values.dtype))))
+		self.Species[Type]=TheSpecies
+		self.MaxBirthCycles[Type]=TheSpecies.MaxBirthCycles
+		self.MaxLifeCycles[Type]=TheSpecies.MaxLifeCycles
+		self.DistanceToMove[Type]=TheSpecies.DistanceToMove
+		self.Dies[Type]=TheSpecies.Dies
+		self.Reproduces[Type]=TheSpecies.Reproduces
+		self.Forages[Type]=TheSpecies.Forages
+		self.Seeks[Type]=TheSpecies.Seeks
+
+	#################################################################
+	# Private function to get the Species that have been added, in
+	# the order of their Type
+	#################################################################
+	def AllSpecies(self):
+		return([TheSpecies for TheSpecies in self.Species if TheSpecies!=None])
+
+	#################################################################
+	# Add new animals with full birth and life counters
+	# Inputs:
+	#  CenterX,CenterY - location of each new animal (arrays)
+	#  Type - type of the new animals (one value or an array)
+	#  Ammo - how much ammo each new animal has
+	#################################################################
+	def Add(self,CenterX,CenterY,Type,Ammo):
+		Count=len(CenterX)
+		Type=numpy.broadcast_to(numpy.asarray(Type,dtype=numpy.int8),(Count,))
+		self.CenterX=numpy.concatenate((self.CenterX,numpy.asarray(CenterX,dtype=float)))
+		self.CenterY=numpy.concatenate((self.CenterY,numpy.asarray(CenterY,dtype=float)))
+		self.Type=numpy.concatenate((self.Type,Type))
+		self.BirthCounter=numpy.concatenate((self.BirthCounter,self.MaxBirthCycles[Type]))
+		self.LifeCounter=numpy.concatenate((self.LifeCounter,self.MaxLifeCycles[Type]))
+		self.Ammo=numpy.concatenate((self.Ammo,numpy.broadcast_to(numpy.asarray(Ammo,dtype=numpy.int32),(Count,))))
+
+	#################################################################
+	# Add animals with all of their values (e.g. animals that moved
+	# in from another part of the world, see Parallel.py)
+	# Inputs:
+	#  Values - a NumPy record array (or a dictionary of arrays) with
+	#   a field for each of VALUE_NAMES
+	#################################################################
+	def Extend(self,Values):
+		for Name in VALUE_NAMES:
+			Array=getattr(self,Name)
+			setattr(self,Name,numpy.concatenate((Array,numpy.asarray(Values[Name],dtype=Array.dtype))))
+
+	def __len__(self):
+		return(len(self.Type))
+
+	#################################################################
+	# Number of animals of a Type
+	#################################################################
+	def Count(self,Type):
+		return(int(numpy.count_nonzero(self.Type==Type)))
+
+	#################################################################
+	# Total amount of Ammo that the animals are carrying
+	#################################################################
+	def TotalAmmo(self):
+		return(int(self.Ammo.sum()))
+
+	#################################################################
+	# Private function to keep only some of the animals (Mask can
+	# also be an array of indexes, to put the animals in that order)
+	#################################################################
+	def Keep(self,Mask):
+		for Name in VALUE_NAMES: setattr(self,Name,getattr(self,Name)[Mask])
+
+	#################################################################
+	# Update all of the animals for one cycle (see the top of the file)
+	# Inputs:
+	#  TheWorld - the world the animals live in (bounds and Food)
+	#################################################################
+	def Update(self,TheWorld):
+		Profiler=TheWorld.Profiler # times each step if it is set (see Profiler.py)
+		New=[] # (Parents,CenterX,CenterY,Type,Ammo) for the animals that are added at the end
+
+		Alive=self.Age(TheWorld,New)
+		self.Hunt(TheWorld,Alive,New)
+		self.Feed(TheWorld,Alive)
+
+		# remove the dead and add the new animals
+		self.Keep(Alive)
+		if Profiler!=None: StartTime=Profiler.Clock()
+		NumPairs=self.Move(TheWorld)
+		if Profiler!=None: Profiler.Add("Move",StartTime,NumPairs)
+		for Parents,CenterX,CenterY,Type,Ammo in New:
+			self.Add(CenterX,CenterY,Type,Ammo)
+
+	#################################################################
+	# Private function to update the counters, find the animals that
+	# die and the ones that give birth.  The new animals are added to
+	# New (see Update).
+	# Returns a boolean array that is False for the animals that died.
+	#################################################################
+	def Age(self,TheWorld,New):
+		# update the counters
+		self.BirthCounter-=1
+		self.LifeCounter-=1
+
+		# check for death
+		Alive=~(self.Dies[self.Type]&(self.LifeCounter<=0))
+		TheWorld.CountEvent("Deaths",len(Alive)-int(numpy.count_nonzero(Alive)))
+
+		# See if there was a birth
+		Parents=numpy.flatnonzero(Alive&self.Reproduces[self.Type]&(self.BirthCounter<=0))
+		self.BirthCounter[Parents]=self.MaxBirthCycles[self.Type[Parents]]
+		New.append((Parents,self.CenterX[Parents],self.CenterY[Parents],self.Type[Parents],self.Ammo[Parents]))
+		TheWorld.CountEvent("Births",len(Parents))
+		return(Alive)
+
+	#################################################################
+	# Private function to shoot, eat and infect the animals that are
+	# within reach.  The animals that are killed are set to False in
+	# Alive and the new animals from infections are added to New.
+	# Inputs:
+	#  Owned - None to count every animal that is killed in the
+	#   events, or a boolean array that is True for the animals to
+	#   count (see Parallel.py)
+	#################################################################
+	def Hunt(self,TheWorld,Alive,New,Owned=None):
+		Profiler=TheWorld.Profiler
+		AllSpecies=self.AllSpecies()
+
+		def CountKills(Name,Killed):
+			if Owned is None: TheWorld.CountEvent(Name,len(Killed))
+			else: TheWorld.CountEvent(Name,int(numpy.count_nonzero(Owned[Killed])))
+
+		# animals with Ammo shoot every animal that is close enough
+		for TheSpecies in AllSpecies:
+			if TheSpecies.Shoots==None: continue
+			if Profiler!=None: StartTime=Profiler.Clock()
+			TargetType,Distance=TheSpecies.Shoots
+			Shooters=numpy.flatnonzero(Alive&(self.Type==TheSpecies.Type)&(self.Ammo>0))
+			Targets=numpy.flatnonzero(Alive&(self.Type==TargetType))
+			I,J=FindPairs(self.CenterX[Shooters],self.CenterY[Shooters],self.CenterX[Targets],self.CenterY[Targets],
+				Distance,TheWorld.Width,TheWorld.Height)
+			I,J=FirstPairs(I,J)
+			Alive[Targets[J]]=False
+			CountKills("Shots",Targets[J])
+			self.Ammo-=numpy.bincount(Shooters[I],minlength=len(self)).astype(numpy.int32) # used ammo, so ammo is reduced by one.
+			if Profiler!=None: Profiler.Add("Shoot",StartTime,len(I))
+
+		# animals eat every animal that is close enough (and each one
+		# becomes one of their own kind if they infect)
+		for Infects in (False,True):
+			for TheSpecies in AllSpecies:
+				Rule=TheSpecies.Infects if Infects else TheSpecies.Eats
+				if Rule==None: continue
+				if Profiler!=None: StartTime=Profiler.Clock()
+				TargetType,Distance=Rule
+				Eaters=numpy.flatnonzero(Alive&(self.Type==TheSpecies.Type))
+				Targets=numpy.flatnonzero(Alive&(self.Type==TargetType))
+				I,J=FindPairs(self.CenterX[Eaters],self.CenterY[Eaters],self.CenterX[Targets],self.CenterY[Targets],
+					Distance,TheWorld.Width,TheWorld.Height)
+				I,J=FirstPairs(I,J)
+				Alive[Targets[J]]=False
+				Eaters=Eaters[I]
+				self.LifeCounter[Eaters]=TheSpecies.MaxLifeCycles
+				if Infects:
+					CountKills("Infections",Targets[J])
+					self.BirthCounter[Eaters]=TheSpecies.MaxBirthCycles
+					# the new animal starts where the animal that made it is
+					New.append((Eaters,self.CenterX[Eaters],self.CenterY[Eaters],TheSpecies.Type,self.Ammo[Eaters]))
+				else:
+					CountKills("Eaten",Targets[J])
+				if Profiler!=None: Profiler.Add("Eat",StartTime,len(I))
+
+	#################################################################
+	# Private function for the animals that forage (and are True in
+	# Alive) to eat Food (or go hungry) and pick up Ammo
+	#################################################################
+	def Feed(self,TheWorld,Alive):
+		Profiler=TheWorld.Profiler
+		if Profiler!=None: StartTime=Profiler.Clock()
+		Foragers=numpy.flatnonzero(Alive&self.Forages[self.Type])
+		Taken=TheWorld.TheFood.Forage(self.CenterX[Foragers],self.CenterY[Foragers]) # what each one took
+		AteFood=Taken==Veg.TYPE_FOOD
+		GotAmmo=(Taken==Veg.TYPE_AMMO).astype(numpy.int32)
+		self.LifeCounter[Foragers]=numpy.where(AteFood,self.MaxLifeCycles[self.Type[Foragers]],self.LifeCounter[Foragers]-1)
+		self.Ammo[Foragers]+=GotAmmo
+		Seekers=Foragers[(Taken==Veg.EMPTY)&(self.Seeks[self.Type[Foragers]]>0)]
+		if len(Seekers)>0: self.Seek(TheWorld,Seekers)
+		if Profiler!=None: Profiler.Add("Forage",StartTime)
+
+	#################################################################
+	# Private function for some of the animals to take a step towards
+	# the nearest cell with Food or Ammo in it (see AnimalClass.Seek)
+	# Inputs:
+	#  Seekers - index of each animal that looks for a cell
+	#################################################################
+	def Seek(self,TheWorld,Seekers):
+		for Type in numpy.unique(self.Type[Seekers]): # each type looks as far as its Species.Seeks
+			Indexes=Seekers[self.Type[Seekers]==Type]
+			TargetX,TargetY,Found=TheWorld.TheFood.NearestFull(self.CenterX[Indexes],self.CenterY[Indexes],
+				self.Seeks[Type])
+			Indexes=Indexes[Found]
+			OffsetX=TargetX[Found]-self.CenterX[Indexes]
+			OffsetY=TargetY[Found]-self.CenterY[Indexes]
+			Length=numpy.hypot(OffsetX,OffsetY)
+			Step=self.DistanceToMove[Type]
+			Far=Length>Step # the cell is more than a step away
+			OffsetX[Far]=OffsetX[Far]*Step/Length[Far]
+			OffsetY[Far]=OffsetY[Far]*Step/Length[Far]
+			self.CenterX[Indexes]+=OffsetX
+			self.CenterY[Indexes]+=OffsetY
+
+	#################################################################
+	# Private function to chase, flee or take a random step.
+	# Like AnimalClass.Move, an animal that chases or flees takes one
+	# step for each animal of the other type: 1/10th of the distance
+	# towards each one that is within reach (Chases), 1/5th of the
+	# distance away from each one that is within reach (Flees), and a
+	# random step for each one that is not.  The random steps are
+	# added up into one random step with the same spread (the sum of
+	# N steps with a std dev of DistanceToMove has a std dev of
+	# DistanceToMove*sqrt(N)), so the results are not the same as
+	# AnimalClass.Move.  An animal that does neither takes one random
+	# step.
+	# A Species with NearestTargets set takes one step from the nearest
+	# animals instead (see Animal.MoveToNearest and SteerToNearest).
+	# Inputs:
+	#  TheWorld - the world the animals are in
+	#  Counts - number of animals of each Type in the whole world (None
+	#   for the number in the arrays, see Parallel.py)
+	#  Moving - boolean array that is True for the animals that move
+	#   (None for all of them), the rest are only steered by
+	# Returns the number of pairs that were close enough to chase or flee.
+	#################################################################
+	def Move(self,TheWorld,Counts=None,Moving=None):
+		StepX=numpy.zeros(len(self))
+		StepY=numpy.zeros(len(self))
+		NumRandomSteps=numpy.zeros(len(self))
+		NumPairs=0
+
+		for TheSpecies in self.AllSpecies():
+			Movers=numpy.flatnonzero(self.Type==TheSpecies.Type)
+			if Moving is not None: Movers=Movers[Moving[Movers]]
+			Steering=TheSpecies.Steering()
+			if len(Steering)==0: NumRandomSteps[Movers]=1
+			if (len(Steering)>0) and (TheSpecies.NearestTargets>0):
+				NumPairs=NumPairs+self.SteerToNearest(TheWorld,Movers,Steering,TheSpecies.NearestTargets,StepX,StepY,NumRandomSteps)
+				continue
+			for OtherType,Distance,Divisor in Steering:
+				Others=numpy.flatnonzero(self.Type==OtherType)
+				if Counts is None: NumRandomSteps[Movers]+=len(Others)
+				else: NumRandomSteps[Movers]+=Counts[OtherType]
+				I,J=FindPairs(self.CenterX[Movers],self.CenterY[Movers],self.CenterX[Others],self.CenterY[Others],
+					Distance,TheWorld.Width,TheWorld.Height)
+				I=Movers[I]
+				J=Others[J]
+				StepX+=numpy.bincount(I,numpy.abs(self.CenterX[I]-self.CenterX[J]),len(self))/float(Divisor)
+				StepY+=numpy.bincount(I,numpy.abs(self.CenterY[I]-self.CenterY[J]),len(self))/float(Divisor)
+				NumRandomSteps-=numpy.bincount(I,minlength=len(self))
+				NumPairs=NumPairs+len(I)
+
+		Moved=numpy.arange(len(self)) if Moving is None else numpy.flatnonzero(Moving)
+		Spread=self.DistanceToMove[self.Type[Moved]]*numpy.sqrt(NumRandomSteps[Moved])
+		NormalX=self.MoveRandom.standard_normal(len(Moved))
+		NormalY=self.MoveRandom.standard_normal(len(Moved))
+		if not (Kernels.Active() and Kernels.Step(self.CenterX,self.CenterY,Moved,StepX,StepY,Spread,NormalX,NormalY)):
+			self.CenterX[Moved]+=StepX[Moved]+NormalX*Spread
+			self.CenterY[Moved]+=StepY[Moved]+NormalY*Spread
+
+		# if an animal has moved off the frame, put it on the other side
+		self.CenterX,self.CenterY=TheWorld.WrapArrays(self.CenterX,self.CenterY)
+		return(NumPairs)
+
+	#################################################################
+	# Private function to find the steps of the animals that move
+	# from the nearest animals (see Animal.MoveToNearest).  The steps
+	# are added to StepX and StepY, and NumRandomSteps is set to 1 for
+	# the animals that have no animals within reach (0 for the rest).
+	# Inputs:
+	#  TheWorld - the world the animals are in
+	#  Movers - index of each animal that moves this way
+	#  Steering - list of (Type,Distance,Divisor) from Species.Steering
+	#  NumNearest - number of nearest animals to steer by
+	# Returns the number of pairs that were close enough to chase or flee.
+	#################################################################
+	def SteerToNearest(self,TheWorld,Movers,Steering,NumNearest,StepX,StepY,NumRandomSteps):
+		Steered=numpy.zeros(len(Movers),dtype=bool)
+		NumPairs=0
+		for OtherType,Distance,Divisor in Steering:
+			Others=numpy.flatnonzero(self.Type==OtherType)
+			I,J=FindPairs(self.CenterX[Movers],self.CenterY[Movers],self.CenterX[Others],self.CenterY[Others],
+				Distance,TheWorld.Width,TheWorld.Height)
+			NumPairs=NumPairs+len(I)
+			if len(I)==0: continue
+			OffsetX=self.CenterX[Others[J]]-self.CenterX[Movers[I]]
+			OffsetY=self.CenterY[Others[J]]-self.CenterY[Movers[I]]
+
+			# keep the NumNearest closest pairs for each mover
+			Order=numpy.lexsort((J,OffsetX*OffsetX+OffsetY*OffsetY,I)) # by mover, then distance
+			I=I[Order]
+			Rank=numpy.arange(len(I))-numpy.searchsorted(I,I,"left") # 0 for each mover's closest pair
+			Keep=Order[Rank<NumNearest]
+			I=I[Rank<NumNearest]
+
+			Counts=numpy.bincount(I,minlength=len(Movers))
+			Near=Counts>0
+			StepX[Movers[Near]]+=numpy.bincount(I,OffsetX[Keep],len(Movers))[Near]/(Counts[Near]*float(Divisor))
+			StepY[Movers[Near]]+=numpy.bincount(I,OffsetY[Keep],len(Movers))[Near]/(Counts[Near]*float(Divisor))
+			Steered|=Near
+
+		NumRandomSteps[Movers]=numpy.where(Steered,0,1)
+		return(NumPairs)
@@ -0,0 +1,175 @@
+#################################################################
+# The living animals in the world.
+#
+# The animals used to be kept in a plain list.  Removing an animal
+# from a list has to search the list for it, and animals were added
+# and removed while the world was looping through the list, so some
+# animals were skipped or updated twice depending on where they were
+# in the list.
+#
+# The store fixes both problems:
+# - Each animal knows where it is in the store (StoreIndex), so it
+#   is removed by moving the last animal into its place ("swap
+#   remove") without searching.
+# - During a cycle, animals that die are only marked as dead
+#   (Alive=False) and put in a queue, and newborns are put in
+#   another queue.  Nothing is added to or removed from the store
+#   until ApplyChanges() is called at the end of the cycle, so every
+#   animal that was alive at the start of the cycle is updated
+#   exactly once and newborns start moving in the next cycle.
+#
+# Each animal also gets an Id that never changes (its StoreIndex
+# changes as other animals are removed).
+#
+# The store keeps count of the animals of each Type and the Ammo
+# they are carrying as animals are added and removed, so the
+# statistics for a cycle do not have to look at every animal.
+# Animals that pick up or use Ammo must change NumAmmo.
+#
+# Normally each animal does everything for the cycle (see
+# AnimalClass.Update) before the next animal starts, so what an
+# animal shoots or eats depends on what the animals before it in the
+# store have done.  With BatchHunting, each step is done for every
+# animal before the next step starts (like AnimalArrays): the
+# counters, deaths and births, then the shooting, eating and
+# infecting for every animal at once (Animal.HuntAll), then the
+# foraging and moving.
+#################################################################
+
+import Animal
+
+#################################################################
+# The class definition
+#################################################################
+
+class AnimalStore:
+	#################################################################
+	# Initialize the new object
+	#################################################################
+	def __init__(self):
+		self.Items=[] # the animals, in no particular order
+		self.NextId=0 # the Id for the next animal that is added
+
+		self.Counts={} # number of animals of each Type
+		self.NumAmmo=0 # total Ammo carried by the animals
+		self.Species={} # the Species for each Type in the world, including the ones that have died out
+
+		self.Births=[] # animals that were born in this cycle
+		self.Deaths=[] # animals that died in this cycle
+
+		self.BatchHunting=False # True to shoot, eat and infect for every animal at once (see Update)
+
+	#################################################################
+	# Update every animal for one cycle (see the top of the file).
+	# Called by the world before ApplyChanges().
+	#################################################################
+	def Update(self,TheWorld):
+		TheFood=TheWorld.TheFood
+		Profiler=TheWorld.Profiler # the animals time each part of their update if it is set (see Profiler.py)
+		if not self.BatchHunting:
+			if Profiler==None:
+				for TheAnimal in self.Items:
+					if TheAnimal.Alive: # skip the animals that were killed earlier in this cycle
+						TheAnimal.Update(self,TheFood)
+			else:
+				for TheAnimal in self.Items:
+					if TheAnimal.Alive: TheAnimal.ProfiledUpdate(self,TheFood,Profiler)
+			return
+
+		Living=[TheAnimal for TheAnimal in self.Items if TheAnimal.Age(self)]
+		Animal.HuntAll(TheWorld,Living)
+		if Profiler==None:
+			for TheAnimal in Living:
+				if TheAnimal.Alive: TheAnimal.FeedAndMove(self,TheFood)
+		else:
+			for TheAnimal in Living:
+				if TheAnimal.Alive: TheAnimal.ProfiledFeedAndMove(self,TheFood,Profiler)
+
+	#################################################################
+	# Add a Species to the world (see AllSpecies).  The Species of the
+	# animals that are added are also added if they are not there.
+	#################################################################
+	def AddSpecies(self,TheSpecies):
+		self.Species[TheSpecies.Type]=TheSpecies
+
+	#################################################################
+	# The Species of the world in order of Type (see Checkpoint.py)
+	#################################################################
+	def AllSpecies(self):
+		return([self.Species[Type] for Type in sorted(self.Species.keys())])
+
+	#################################################################
+	# Add an animal to the store right away (use Birth() during a cycle)
+	#################################################################
+	def Add(self,TheAnimal):
+		if TheAnimal.Type not in self.Species: self.Species[TheAnimal.Type]=TheAnimal.Species
+		TheAnimal.Id=self.NextId
+		TheAnimal.StoreIndex=len(self.Items)
+		TheAnimal.Alive=True
+		self.NextId=self.NextId+1
+		self.Items.append(TheAnimal)
+		self.Counts[TheAnimal.Type]=self.Counts.get(TheAnimal.Type,0)+1
+		self.NumAmmo=self.NumAmmo+TheAnimal.Ammo
+
+	#################################################################
+	# Remove an animal from the store right away (use Kill() during a
+	# cycle).  The last animal in the store takes its place.
+	#################################################################
+	def Remove(self,TheAnimal):
+		Index=TheAnimal.StoreIndex
+		Last=self.Items.pop()
+		if Last is not TheAnimal:
+			self.Items[Index]=Last
+			Last.StoreIndex=Index
+		TheAnimal.StoreIndex=None
+		TheAnimal.Alive=False
+		self.Counts[TheAnimal.Type]=self.Counts[TheAnimal.Type]-1
+		self.NumAmmo=self.NumAmmo-TheAnimal.Ammo
+
+	#################################################################
+	# Queue a newborn to be added at the end of the cycle
+	#################################################################
+	def Birth(self,TheAnimal):
+		self.Births.append(TheAnimal)
+
+	#################################################################
+	# Mark an animal as dead and queue it to be removed at the end of
+	# the cycle.  Returns False if the animal was already dead.
+	#################################################################
+	def Kill(self,TheAnimal):
+		if not TheAnimal.Alive: return(False)
+		TheAnimal.Alive=False
+		self.Deaths.append(TheAnimal)
+		return(True)
+
+	#################################################################
+	# Remove the animals that died and add the ones that were born
+	# in this cycle.  Called by the world at the end of each cycle.
+	#################################################################
+	def ApplyChanges(self):
+		for TheAnimal in self.Deaths:
+			self.Remove(TheAnimal)
+		self.Deaths=[]
+
+		for TheAnimal in self.Births:
+			self.Add(TheAnimal)
+		self.Births=[]
+
+	#################################################################
+	# Number of animals of a Type (not counting this cycle's births
+	# and deaths until ApplyChanges() is called)
+	#################################################################
+	def Count(self,Type):
+		return(self.Counts.get(Type,0))
+
+	#################################################################
+	# Total amount of Ammo that the animals are carrying
+	#################################################################
+	def TotalAmmo(self):
+		return(self.NumAmmo)
+
+	def __len__(self):
+		return(len(self.Items))
+
+	def __iter__(self):
+		return(iter(self.Items))
@@ -0,0 +1,252 @@
+#################################################################
+# Runs a model many times over a grid of parameters.
+#
+# Every combination of the values in the model's PARAMETER_GRID (see
+# the Model.py in the model folder) is run NUM_REPLICATES times.  The
+# runs are spread over a pool of worker processes (one per core by
+# default) and are run without a window.  Each run gets its own
+# seed, so any single run can be repeated with
+# Scenario.CreateWorld(Model,Seed).
+#
+# If START_PATH is set, every run starts from that checkpoint (see
+# Checkpoint.py) instead of a new world, so a long burn-in only has
+# to be run once.  Each run then branches off with its own seed and
+# the Species values from the parameters (the other parameters,
+# e.g. NUM_HUMAN, were set when the checkpoint was made).
+#
+# The number of each type of animal for every cycle of every run is
+# written to a CSV file with one row per run and cycle:
+#  Run,Replicate,Seed,<parameters>,Cycle,<Model.COUNT_NAMES>
+# Cycle is the cycle of the world, so the runs that start from
+# START_PATH carry on from the cycle the checkpoint was saved at.
+#
+# If a run fails (raises an error) it is reported and the rest of
+# the runs carry on.  If a worker process dies, a new worker is
+# started and the run it was working on is tried again (up to
+# MAX_ATTEMPTS times).
+#
+# Usage: python Batch.py ModelFolder [OutputFile]
+#################################################################
+
+# Import standard Python libraries
+import csv
+import itertools
+import multiprocessing
+import multiprocessing.connection
+import sys
+import traceback
+
+# Import our custom modules
+import Animal # module with the class to create the animals
+import Checkpoint # module to save the model and carry on later
+import Scenario # module to load a model and create its world
+
+#################################################################
+# Global values (modify these to set up the sweep)
+#################################################################
+
+NUM_REPLICATES=10 # number of runs for each combination of parameters
+NUM_CYCLES=500 # number of cycles in each run
+BASE_SEED=1 # the seed for each run is BASE_SEED plus the number of the run
+
+NUM_WORKERS=None # number of worker processes (None for one per core)
+MAX_ATTEMPTS=3 # number of times to start a run whose worker process died
+
+OUTPUT_FILE="Batch.csv" # where to write the results if none is given on the command line
+
+START_PATH=None # checkpoint folder to start every run from (None to start from a new world)
+
+#################################################################
+# Build the list of runs for a sweep
+# Inputs:
+#  ParameterGrid - dictionary with the values for each parameter
+#  NumReplicates - number of runs for each combination of values
+#  BaseSeed - seed of the first run
+# Output:
+#  a list with a dictionary for each run (Run, Replicate, Seed and
+#  Parameters)
+#################################################################
+
+def MakeRuns(ParameterGrid,NumReplicates,BaseSeed):
+	Names=sorted(ParameterGrid.keys())
+	Runs=[]
+	for Values in itertools.product(*[ParameterGrid[Name] for Name in Names]):
+		for Replicate in range(NumReplicates):
+			Run=len(Runs)
+			Runs.append({"Run":Run,"Replicate":Replicate,"Seed":BaseSeed+Run,
+				"Parameters":dict(zip(Names,Values))})
+	return(Runs)
+
+#################################################################
+# Run the model once.  This is called in the worker processes.
+# Inputs:
+#  Model - the Model module (see Scenario.Load)
+#  TheRun - dictionary from MakeRuns()
+#  NumCycles - number of cycles to run
+# Output:
+#  TheRun with "Counts" (a list with the counts from
+#  Model.CountAnimals for each cycle after the start), "Cycles"
+#  (the world's Cycle for each of the counts) and "Error" (None, or
+#  the error if the run failed)
+#################################################################
+
+Defaults={} # the model constants before any run changed them
+
+def RunOne(Model,TheRun,NumCycles):
+	Result=dict(TheRun)
+	Result["Counts"]=[]
+	Result["Cycles"]=[]
+	Result["Error"]=None
+	try:
+		Animal.PRINT_EVENTS=False
+
+		# worker processes are reused, so put back anything an earlier run changed
+		for Name,Value in Defaults.items(): setattr(Model,Name,Value)
+		for Name,Value in TheRun["Parameters"].items():
+			if not hasattr(Model,Name): raise ValueError("Model has no constant named "+Name)
+			if not (Name in Defaults): Defaults[Name]=getattr(Model,Name)
+			setattr(Model,Name,Value)
+
+		if START_PATH==None: TheWorld=Scenario.CreateWorld(Model,TheRun["Seed"])
+		else: TheWorld=Checkpoint.Load(START_PATH,TheRun["Seed"],Model.CreateSpecies())
+		EndCycle=TheWorld.Cycle+NumCycles
+		while TheWorld.Cycle<EndCycle:
+			TheWorld.Update()
+			Result["Counts"].append(Model.CountAnimals(TheWorld))
+			Result["Cycles"].append(TheWorld.Cycle)
+	except Exception:
+		Result["Error"]=traceback.format_exc()
+	return(Result)
+
+#################################################################
+# Private function that runs in each worker process.  Runs are
+# sent to the worker one at a time and the results sent back until
+# it is sent None.
+#################################################################
+
+def Worker(Connection,ModelFolder,NumCycles):
+	Model=Scenario.Load(ModelFolder)
+	while True:
+		TheRun=Connection.recv()
+		if TheRun==None: break
+		Connection.send(RunOne(Model,TheRun,NumCycles))
+
+#################################################################
+# Run all of the runs in a pool of worker processes
+# Inputs:
+#  ModelFolder - the model folder (see Scenario.Load)
+#  Runs - list of runs from MakeRuns()
+#  NumCycles - number of cycles in each run
+#  NumWorkers - number of worker processes (None for one per core)
+# Output:
+#  list with the result of each run (see RunOne), in the same order
+#  as Runs
+#################################################################
+
+def RunAll(ModelFolder,Runs,NumCycles,NumWorkers=None):
+	if NumWorkers==None: NumWorkers=multiprocessing.cpu_count()
+
+	Results={}
+	Attempts=dict((TheRun["Run"],0) for TheRun in Runs)
+	Waiting=list(Runs)
+	Workers={} # [process, run it is working on] for the connection to each worker
+
+	def StartWorker():
+		Connection,WorkerConnection=multiprocessing.Pipe()
+		Process=multiprocessing.Process(target=Worker,args=(WorkerConnection,ModelFolder,NumCycles))
+		Process.daemon=True
+		Process.start()
+		WorkerConnection.close() # so we see the end of the pipe if the worker dies
+		Workers[Connection]=[Process,None]
+
+	try:
+		for Count in range(min(NumWorkers,len(Runs))): StartWorker()
+
+		while len(Results)<len(Runs):
+			# give each idle worker a run
+			for Connection,Info in Workers.items():
+				if (Info[1]==None) and (len(Waiting)>0):
+					Info[1]=Waiting.pop(0)
+					Attempts[Info[1]["Run"]]+=1
+					Connection.send(Info[1])
+
+			for Connection in multiprocessing.connection.wait(list(Workers.keys())):
+				Process,TheRun=Workers[Connection]
+				try:
+					Result=Connection.recv()
+				except EOFError: # the worker process died
+					del Workers[Connection]
+					Connection.close()
+					Process.join()
+					print("Worker process for run "+format(TheRun["Run"])+" died")
+					if Attempts[TheRun["Run"]]<MAX_ATTEMPTS:
+						Waiting.insert(0,TheRun) # try the run again
+					else:
+						Result=dict(TheRun)
+						Result["Counts"]=[]
+						Result["Cycles"]=[]
+						Result["Error"]="The worker process died "+format(MAX_ATTEMPTS)+" times"
+						Results[TheRun["Run"]]=Result
+						print("Run "+format(TheRun["Run"])+" failed: "+Result["Error"])
+					if len(Waiting)>0: StartWorker()
+					continue
+				Workers[Connection][1]=None
+				Results[Result["Run"]]=Result
+				if Result["Error"]!=None: print("Run "+format(Result["Run"])+" failed:\n"+Result["Error"])
+	finally:
+		# tell the workers to stop
+		for Connection,Info in Workers.items():
+			try:
+				Connection.send(None)
+			except (IOError,OSError):
+				pass
+			Info[0].join()
+			Connection.close()
+
+	return([Results[TheRun["Run"]] for TheRun in Runs])
+
+#################################################################
+# Write the results to a CSV file (one row per run and cycle)
+# Inputs:
+#  Results - list with the result of each run (see RunAll)
+#  FileName - the CSV file to write
+#  CountNames - names of the counts (see Model.COUNT_NAMES)
+#################################################################
+
+def SaveResults(Results,FileName,CountNames):
+	Names=[]
+	for Result in Results:
+		for Name in sorted(Result["Parameters"].keys()):
+			if not (Name in Names): Names.append(Name)
+
+	TheFile=open(FileName,"w")
+	try:
+		Writer=csv.writer(TheFile,lineterminator="\n")
+		Writer.writerow(["Run","Replicate","Seed"]+Names+["Cycle"]+list(CountNames))
+		for Result in Results:
+			Start=[Result["Run"],Result["Replicate"],Result["Seed"]]+[Result["Parameters"].get(Name,"") for Name in Names]
+			for Cycle,Counts in zip(Result["Cycles"],Result["Counts"]):
+				Writer.writerow(Start+[Cycle]+list(Counts))
+	finally:
+		TheFile.close()
+
+#################################################################
+# Main
+#################################################################
+
+if __name__=="__main__":
+	if len(sys.argv)<2:
+		print("Usage: python Batch.py ModelFolder [OutputFile]")
+		sys.exit(1)
+	ModelFolder=sys.argv[1]
+	Model=Scenario.Load(ModelFolder)
+	OutputFile=OUTPUT_FILE
+	if len(sys.argv)>2: OutputFile=sys.argv[2]
+
+	Runs=MakeRuns(Model.PARAMETER_GRID,NUM_REPLICATES,BASE_SEED)
+	print("Running "+format(len(Runs))+" runs of "+format(NUM_CYCLES)+" cycles")
+	Results=RunAll(ModelFolder,Runs,NUM_CYCLES,NUM_WORKERS)
+	SaveResults(Results,OutputFile,Model.COUNT_NAMES)
+
+	NumFailed=len([Result for Result in Results if Result["Error"]!=None])
+	print("Wrote "+OutputFile+" ("+format(NumFailed)+" runs failed)")
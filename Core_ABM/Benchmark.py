@@ -0,0 +1,184 @@
+#################################################################
+# Measures how fast a model runs without a window.
+#
+# The model is run for NUM_CYCLES cycles for every combination of
+# BACKENDS (AnimalClass objects or AnimalArrays), POPULATIONS
+# (starting number of animals, split between the types of animal
+# the same way as in Model.py) and GRID_SIZES (number of Food cells
+# along each side of the world, the world is made big enough to
+# hold them).  For each combination it reports:
+#  - the cycles per second (not counting the setup)
+#  - the time spent in each phase of a cycle and the number of
+#    pairs of animals each phase looked at
+#  - the peak memory of the process
+#
+# The phases are timed with a Profiler (see Profiler.py for the
+# phases).  Animals is the whole update of the animals, and Shoot,
+# Eat, Forage and Move are the parts of it.
+#
+# Each combination is run in its own process so the peak memory is
+# for that combination only.  A combination that takes longer than
+# CASE_TIMEOUT seconds is stopped and the cycles it finished are
+# reported.
+#
+# The results are written to a JSON file (with the git commit if
+# there is one) so runs from different commits can be compared.
+#
+# Usage: python Benchmark.py ModelFolder [OutputFile]
+#################################################################
+
+# Import standard Python libraries
+import json
+import multiprocessing
+import os
+import platform
+import subprocess
+import sys
+import time
+
+import numpy
+
+# Import our custom modules
+import Animal # module with the class to create the animals
+import Profiler # module to time the phases of each cycle
+import Scenario # module to load a model and create its world
+
+#################################################################
+# Global values (modify these to change what is measured)
+#################################################################
+
+BACKENDS=("objects","arrays") # how the animals are kept (see Model.USE_ARRAYS)
+POPULATIONS=(100,1000,10000,100000,1000000) # starting number of animals
+GRID_SIZES=(50,500,4000) # number of Food cells along each side of the world
+
+NUM_CYCLES=20 # number of cycles to run for each combination
+CASE_TIMEOUT=120 # seconds before a combination is stopped
+SEED=1 # seed for every run, so each commit runs the same model
+
+OUTPUT_FILE="Benchmark.json" # where to write the results if none is given on the command line
+
+#################################################################
+# Private function to find the peak memory of this process in MB
+# (None if it cannot be found on this computer)
+#################################################################
+
+def PeakMemory():
+	try:
+		import resource
+	except ImportError:
+		return(None)
+	Peak=resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+	if sys.platform=="darwin": return(Peak/1048576.0) # in bytes
+	return(Peak/1024.0) # in kilobytes
+
+#################################################################
+# Run one combination.  This is run in its own process and sends
+# the results so far back after every cycle.
+# Inputs:
+#  Connection - the pipe to send the results back on
+#  ModelFolder - the model folder (see Scenario.Load)
+#  Backend - "objects" or "arrays"
+#  Population - starting number of animals
+#  GridSize - number of Food cells along each side of the world
+#  NumCycles - number of cycles to run
+#################################################################
+
+def RunCase(Connection,ModelFolder,Backend,Population,GridSize,NumCycles):
+	Model=Scenario.Load(ModelFolder)
+	Animal.PRINT_EVENTS=False
+	Model.USE_ARRAYS=(Backend=="arrays")
+	Size=GridSize*Model.CELL_SIZE # the world is just big enough to hold the grid
+
+	StartTime=time.time()
+	TheWorld=Scenario.CreateWorld(Model,SEED,Population,Size,Size)
+	SetupTime=time.time()-StartTime
+
+	TheWorld.Profiler=Profiler.Profiler()
+
+	Elapsed=0.0
+	for Cycle in range(NumCycles):
+		StartTime=time.time()
+		TheWorld.Update()
+		Elapsed+=time.time()-StartTime
+
+		Connection.send({"Cycles":Cycle+1,"SetupSeconds":SetupTime,"Seconds":Elapsed,
+			"CyclesPerSecond":(Cycle+1)/Elapsed if Elapsed>0 else None,
+			"Phases":dict(TheWorld.Profiler.Times),"Pairs":dict(TheWorld.Profiler.Pairs),"PeakMemoryMB":PeakMemory(),"NumAnimals":len(TheWorld.TheAnimals)})
+
+#################################################################
+# Run one combination in a new process, stopping it if it takes
+# longer than Timeout seconds
+# Output:
+#  dictionary with the results (see RunCase), and "TimedOut"
+#################################################################
+
+def MeasureCase(ModelFolder,Backend,Population,GridSize,NumCycles,Timeout):
+	Context=multiprocessing.get_context("spawn") # a fresh process, so the memory is for this case only
+	Connection,ChildConnection=Context.Pipe(False)
+	Process=Context.Process(target=RunCase,args=(ChildConnection,ModelFolder,Backend,Population,GridSize,NumCycles))
+	Process.daemon=True
+	Process.start()
+	ChildConnection.close()
+
+	Result={"Cycles":0}
+	EndTime=time.time()+Timeout
+	try:
+		while Result["Cycles"]<NumCycles:
+			if not Connection.poll(max(0,EndTime-time.time())): break
+			Result=Connection.recv()
+	except EOFError: # the process died (e.g. ran out of memory)
+		pass
+	TimedOut=Result["Cycles"]<NumCycles
+	if Process.is_alive(): Process.terminate()
+	Process.join()
+	Connection.close()
+
+	Result.update({"Backend":Backend,"Population":Population,"GridSize":GridSize,"TimedOut":TimedOut})
+	return(Result)
+
+#################################################################
+# Private function to get the git commit the code is at (None if
+# it is not in git)
+#################################################################
+
+def GitCommit():
+	try:
+		Output=subprocess.check_output(["git","rev-parse","HEAD"],cwd=os.path.dirname(os.path.abspath(__file__)),
+			stderr=subprocess.STDOUT)
+	except (OSError,subprocess.CalledProcessError):
+		return(None)
+	return(Output.decode().strip())
+
+#################################################################
+# Main
+#################################################################
+
+if __name__=="__main__":
+	if len(sys.argv)<2:
+		print("Usage: python Benchmark.py ModelFolder [OutputFile]")
+		sys.exit(1)
+	ModelFolder=sys.argv[1]
+	Model=Scenario.Load(ModelFolder)
+	OutputFile=OUTPUT_FILE
+	if len(sys.argv)>2: OutputFile=sys.argv[2]
+
+	Results={"Model":Model.NAME,"Commit":GitCommit(),"Time":time.strftime("%Y-%m-%d %H:%M:%S"),
+		"Python":platform.python_version(),"NumPy":numpy.__version__,"NumCycles":NUM_CYCLES,"Cases":[]}
+
+	for Backend in BACKENDS:
+		for GridSize in GRID_SIZES:
+			for Population in POPULATIONS:
+				Result=MeasureCase(ModelFolder,Backend,Population,GridSize,NUM_CYCLES,CASE_TIMEOUT)
+				Results["Cases"].append(Result)
+				Line=Backend+" animals="+format(Population)+" grid="+format(GridSize)+"x"+format(GridSize)
+				if Result["Cycles"]>0:
+					Line+=" cycles/s="+format(round(Result["CyclesPerSecond"],2))+" peak MB="+format(round(Result["PeakMemoryMB"] or 0,1))
+				if Result["TimedOut"]: Line+=" (stopped after "+format(Result["Cycles"])+" cycles)"
+				print(Line)
+
+	TheFile=open(OutputFile,"w")
+	try:
+		json.dump(Results,TheFile,indent=1)
+	finally:
+		TheFile.close()
+	print("Wrote "+OutputFile)
@@ -0,0 +1,238 @@
+#################################################################
+# Saves the whole state of a World so the run can be carried on
+# later.
+#
+# A checkpoint is a folder with:
+#  State.json - the size of the world, the cycle, the Species, the
+#   state of the random numbers (see RandomStreams.GetState) and
+#   anything else that is not an array
+#  <Name>.npy - one NumPy file for each array: the Food/Ammo grid
+#   (Content, RegrowAt, or the tiles that have been used for a
+#   TiledVeg) and one value for each animal (CenterX, CenterY, Type,
+#   BirthCounter, LifeCounter, Ammo and Id)
+#
+# Loading a checkpoint and running it gives exactly the same
+# results as the run that saved it.  The grid arrays are memory
+# mapped when they are loaded ("copy on write"), so a large grid is
+# only read from the disk as it is used and many runs can start
+# from the same checkpoint without each having a copy of it.
+#
+# Load(Path,Seed) starts a new branch from a checkpoint: the
+# animals and the grid are the same but the random numbers come
+# from the new Seed.  This lets many replicates share one burn-in
+# (see Batch.py).
+#
+# The Species of the world (and their rules) are saved too, so a
+# checkpoint can be loaded without knowing which model made it.
+# They include the Species that have no animals left.
+#
+# A checkpoint is written to a new folder that replaces the old
+# one when it is complete, so a run that is stopped while it is
+# saving still has the last checkpoint.
+#################################################################
+
+import json
+import os
+import shutil
+
+import numpy
+
+import Animal
+import AnimalStore
+import RandomStreams
+import TiledVeg
+import Veg
+import World
+
+#################################################################
+# Global values
+#################################################################
+
+VERSION=6 # changed when the format of the files changes
+
+# the values of a Species, in the order they are passed to Animal.Species()
+SPECIES_VALUES=("Type","Name","FillColor","MaxBirthCycles","MaxLifeCycles","DistanceToMove")
+
+# the rules of a Species (see Animal.py)
+SPECIES_RULES=("Dies","Reproduces","Forages","Shoots","Eats","Infects","Chases","Flees","NearestTargets","Seeks")
+
+# the values that are saved for each animal
+ANIMAL_VALUES=("CenterX","CenterY","Type","BirthCounter","LifeCounter","Ammo")
+
+#################################################################
+# Save a world to a checkpoint folder (replacing the folder if it
+# is there)
+#################################################################
+
+def Save(TheWorld,Path):
+	TheFood=TheWorld.TheFood
+	TheAnimals=TheWorld.TheAnimals
+
+	IndexCellSize=0
+	if TheWorld.TheIndex!=None: IndexCellSize=TheWorld.TheIndex.CellSize
+
+	State={
+		"Version":VERSION,
+		"Width":TheWorld.Width,
+		"Height":TheWorld.Height,
+		"IndexCellSize":IndexCellSize,
+		"Cycle":TheWorld.Cycle,
+		"Random":TheWorld.Random.GetState(),
+	}
+	if isinstance(TheFood,TiledVeg.TiledVeg):
+		State["Food"]={"Tiled":True,"PercentFull":TheFood.PercentFull,"RegrowCycles":TheFood.RegrowCycles,
+			"AmmoChance":TheFood.AmmoChance,"CellSize":TheFood.CellSize,"NumRows":TheFood.NumRows,
+			"NumColumns":TheFood.NumColumns,"TileSize":TheFood.TileSize,"Key":TheFood.Key,"Cycle":TheFood.Cycle,
+			"NumFull":TheFood.NumFull}
+		Arrays=TheFood.TileArrays()
+	else:
+		State["Food"]={"Tiled":False,"RegrowCycles":TheFood.RegrowCycles,
+			"AmmoChance":TheFood.AmmoChance,"CellSize":TheFood.CellSize,"Cycle":TheFood.Cycle}
+		Arrays={"Content":TheFood.Content,"RegrowAt":TheFood.RegrowAt}
+
+	if isinstance(TheAnimals,AnimalStore.AnimalStore):
+		State["Backend"]="objects"
+		State["NextId"]=TheAnimals.NextId
+		State["BatchHunting"]=TheAnimals.BatchHunting
+		Arrays["Id"]=numpy.array([TheAnimal.Id for TheAnimal in TheAnimals],dtype=numpy.int64)
+		for Name in ANIMAL_VALUES:
+			Arrays[Name]=numpy.array([getattr(TheAnimal,Name) for TheAnimal in TheAnimals])
+	else: # the animals are in arrays
+		State["Backend"]="arrays"
+		for Name in ANIMAL_VALUES: Arrays[Name]=getattr(TheAnimals,Name)
+
+	State["Species"]=[dict((Name,getattr(TheSpecies,Name)) for Name in SPECIES_VALUES+SPECIES_RULES)
+		for TheSpecies in TheAnimals.AllSpecies()]
+
+	# write everything to a new folder and then swap it for the old one
+	NewPath=Path+".new"
+	if os.path.isdir(NewPath): shutil.rmtree(NewPath)
+	os.makedirs(NewPath)
+	for Name,Array in Arrays.items():
+		numpy.save(os.path.join(NewPath,Name+".npy"),Array)
+	TheFile=open(os.path.join(NewPath,"State.json"),"w")
+	try:
+		json.dump(State,TheFile)
+	finally:
+		TheFile.close()
+
+	OldPath=Path+".old"
+	if os.path.isdir(Path): os.rename(Path,OldPath)
+	os.rename(NewPath,Path)
+	if os.path.isdir(OldPath): shutil.rmtree(OldPath)
+
+#################################################################
+# See if there is a checkpoint to load
+#################################################################
+
+def Exists(Path):
+	return(os.path.isfile(os.path.join(FindPath(Path),"State.json")))
+
+#################################################################
+# Private function to find the folder with the last complete
+# checkpoint (the old folder if the run stopped while swapping them)
+#################################################################
+
+def FindPath(Path):
+	if (not os.path.isdir(Path)) and os.path.isdir(Path+".old"): return(Path+".old")
+	return(Path)
+
+#################################################################
+# Load a world from a checkpoint folder
+# Inputs:
+#  Path - the checkpoint folder
+#  Seed - None to carry on the saved run exactly, or a seed to
+#   start a new branch of the run with new random numbers
+#  Species - None to use the saved Species, or a list of Species
+#   that replace the saved ones with the same Type
+# Output:
+#  the World, at the cycle it was saved at
+#################################################################
+
+def Load(Path,Seed=None,Species=None):
+	Path=FindPath(Path)
+	TheFile=open(os.path.join(Path,"State.json"))
+	try:
+		State=json.load(TheFile)
+	finally:
+		TheFile.close()
+	if State["Version"]!=VERSION: raise ValueError("Unknown checkpoint version "+format(State["Version"]))
+
+	def LoadArray(Name,MemoryMap=None):
+		return(numpy.load(os.path.join(Path,Name+".npy"),mmap_mode=MemoryMap))
+
+	if Seed==None: Random=RandomStreams.RandomStreams(State["Random"]["Seed"])
+	else: Random=RandomStreams.RandomStreams(Seed)
+
+	# the grid of Food/Ammo
+	Food=State["Food"]
+	if Food["Tiled"]: # only the tiles that have been used are saved (they are kept in memory)
+		TheFood=TiledVeg.TiledVeg(Food["PercentFull"],Food["RegrowCycles"],Food["NumRows"],Food["NumColumns"],Random,
+			Food["AmmoChance"],Food["CellSize"],Food["TileSize"])
+		TheFood.Restore(Food["Key"],Food["Cycle"],Food["NumFull"],dict((Name,LoadArray(Name,"c"))
+			for Name in ("TileIndex","TileContent","TileRegrow","TileCycle","RegrowCounts")))
+	else:
+		TheFood=Veg.Veg.FromArrays(Food["RegrowCycles"],Food["Cycle"],LoadArray("Content","c"),LoadArray("RegrowAt","c"),
+			Random,Food["AmmoChance"],Food["CellSize"])
+
+	SpeciesForType={}
+	for Values in State["Species"]:
+		TheSpecies=Animal.Species(*[Values[Name] for Name in SPECIES_VALUES])
+		for Name in SPECIES_RULES:
+			if Name not in Values: continue # saved before the rule was added (it is off)
+			Rule=Values[Name]
+			if isinstance(Rule,list): Rule=tuple(Rule) # JSON has no tuples
+			setattr(TheSpecies,Name,Rule)
+		SpeciesForType[TheSpecies.Type]=TheSpecies
+	if Species!=None:
+		for TheSpecies in Species: SpeciesForType[TheSpecies.Type]=TheSpecies
+
+	# the animals
+	if State["Backend"]=="arrays":
+		import AnimalArrays # only needed for this kind of world
+
+		TheWorld=World.World(State["Width"],State["Height"],TheFood,0,Random)
+		TheAnimals=AnimalArrays.AnimalArrays(Random)
+		for Type in sorted(SpeciesForType.keys()): TheAnimals.AddSpecies(SpeciesForType[Type])
+		for Name in ANIMAL_VALUES:
+			setattr(TheAnimals,Name,numpy.array(LoadArray(Name),dtype=getattr(TheAnimals,Name).dtype))
+		TheWorld.TheAnimals=TheAnimals
+	else:
+		TheWorld=World.World(State["Width"],State["Height"],TheFood,State["IndexCellSize"],Random)
+		TheAnimals=TheWorld.TheAnimals
+		for Type in sorted(SpeciesForType.keys()): TheAnimals.AddSpecies(SpeciesForType[Type])
+		Values=dict((Name,LoadArray(Name).tolist()) for Name in ANIMAL_VALUES+("Id",))
+		for Index in range(len(Values["Id"])):
+			TheAnimal=Animal.AnimalClass(TheWorld,Values["CenterX"][Index],Values["CenterY"][Index],
+				SpeciesForType[Values["Type"][Index]],Values["Ammo"][Index])
+			TheAnimal.BirthCounter=Values["BirthCounter"][Index]
+			TheAnimal.LifeCounter=Values["LifeCounter"][Index]
+			TheAnimals.Add(TheAnimal)
+			TheAnimal.Id=Values["Id"][Index]
+		TheAnimals.NextId=State["NextId"]
+		TheAnimals.BatchHunting=State.get("BatchHunting",False) # not in checkpoints saved before it was added
+
+	TheWorld.Cycle=State["Cycle"]
+	if Seed==None: Random.SetState(State["Random"])
+	return(TheWorld)
+
+#################################################################
+# An observer of the world (see World.AddObserver) that saves a
+# checkpoint every Every cycles.
+#################################################################
+
+class CheckpointWriter:
+	#################################################################
+	# Initialize the new object
+	# Inputs:
+	#  Path - the checkpoint folder
+	#  Every - number of cycles between checkpoints
+	#################################################################
+	def __init__(self,Path,Every):
+		self.Path=Path
+		self.Every=Every
+		self.StartCycle=None # the cycle the writer was added in (it is already saved or new)
+
+	def Update(self,TheWorld):
+		if self.StartCycle==None: self.StartCycle=TheWorld.Cycle
+		elif (TheWorld.Cycle%self.Every)==0: Save(TheWorld,self.Path)
@@ -0,0 +1,148 @@
+#################################################################
+# Draws a World on a Tkinter canvas.
+#
+# The display is an observer of the world (see World.AddObserver).
+# At the end of a cycle it compares the world to what is on the
+# canvas and changes only the rectangles that are different, so
+# the canvas is updated once per frame no matter how many times an
+# animal moved during the cycle.  The model itself never touches
+# the canvas.
+#
+# Rectangles are never deleted.  A rectangle that is no longer
+# needed is hidden and put in a "pool", and is shown again for the
+# next animal that needs one, so the canvas does not have to create
+# and delete items as animals are born and die.  Each cell of Food
+# has one rectangle that is hidden when the cell is empty.
+#
+# To keep a big run from being slowed down by the display, the
+# canvas can be updated every RenderEvery cycles instead of every
+# cycle.
+#
+# The display can also draw a Frame of a world that is run in
+# another process (see DrawFrame and Frames.py), which is how
+# Test.py draws the model.
+#################################################################
+
+import numpy
+
+import Animal
+import Veg
+
+#################################################################
+# Global values for the class
+#################################################################
+
+FOOD_COLORS={ # fill color for each type of Food/Ammo cell
+	Veg.TYPE_FOOD:"green",
+	Veg.TYPE_AMMO:"pale goldenrod",
+}
+
+RENDER_EVERY=1 # update the canvas every RENDER_EVERY cycles
+
+#################################################################
+# The class definition
+#################################################################
+
+class CanvasDisplay:
+	#################################################################
+	# Initialize the new object
+	# Inputs:
+	#  TheCanvas - the canvas widget that the world will appear in
+	#  RenderEvery - update the canvas every RenderEvery cycles
+	#  Colors - fill color for each Type of animal (only needed to
+	#   draw Frames, see DrawFrame)
+	#################################################################
+	def __init__(self,TheCanvas,RenderEvery=RENDER_EVERY,Colors=None):
+		self.TheCanvas=TheCanvas
+		self.RenderEvery=RenderEvery
+		self.Colors=Colors
+
+		self.AnimalItems={} # [canvas item, X, Y, fill] on the screen for the Id of each animal
+		self.FreeItems=[] # hidden animal items that can be reused
+		self.CellItems={} # canvas item for each (Row,Column) that has had Food/Ammo in it
+		self.DrawnContent=None # the Veg Content that is on the screen
+
+	#################################################################
+	# Bring the canvas up to date with the world (on every
+	# RenderEvery'th cycle)
+	#################################################################
+	def Update(self,TheWorld):
+		if (TheWorld.Cycle%self.RenderEvery)!=0: return
+		self.UpdateFood(TheWorld.TheFood.AllContent(),TheWorld.TheFood.CellSize)
+		self.UpdateAnimals([(TheAnimal.Id,TheAnimal.CenterX,TheAnimal.CenterY,TheAnimal.Species.FillColor)
+			for TheAnimal in TheWorld.TheAnimals])
+
+	#################################################################
+	# Bring the canvas up to date with a Frame from a FrameReader
+	# (see Frames.py).  Everything that is needed is copied out of
+	# the frame, so it can be released as soon as this returns.
+	# Inputs:
+	#  TheFrame - the Frame
+	#  CellSize - width and height of each cell of Food in pixels
+	#################################################################
+	def DrawFrame(self,TheFrame,CellSize):
+		Parts=TheFrame.Parts
+		if Parts[0].Content is not None: # the parts are strips of the world from left to right
+			self.UpdateFood(numpy.concatenate([ThePart.Content for ThePart in Parts],axis=1),CellSize)
+		Animals=[]
+		for ThePart in Parts:
+			Fills=[self.Colors[Type] for Type in ThePart.Type.tolist()]
+			Animals.extend(zip(ThePart.Id.tolist(),ThePart.CenterX.tolist(),ThePart.CenterY.tolist(),Fills))
+		self.UpdateAnimals(Animals)
+
+	#################################################################
+	# Private function to draw the Food/Ammo cells.  Only the cells
+	# that have changed since the last frame are redrawn.
+	# Inputs:
+	#  Content - what is in each cell (see Veg.AllContent)
+	#  CellSize - width and height of each cell in pixels
+	#################################################################
+	def UpdateFood(self,Content,CellSize):
+		if self.DrawnContent is None: self.DrawnContent=numpy.zeros(Content.shape,dtype=Content.dtype)
+		for Row,Column in numpy.argwhere(Content!=self.DrawnContent):
+			Key=(Row,Column)
+			Item=self.CellItems.get(Key)
+			if (Content[Row,Column]==Veg.EMPTY): # the cell was eaten
+				self.TheCanvas.itemconfigure(Item,state="hidden")
+			elif (Item==None): # the first time the cell has grown
+				X=Column*CellSize
+				Y=Row*CellSize
+				Item=self.TheCanvas.create_rectangle(X,Y,X+CellSize,Y+CellSize,fill=FOOD_COLORS[int(Content[Row,Column])])
+				self.TheCanvas.lower(Item)
+				self.CellItems[Key]=Item
+			else: # the cell has grown back or changed type
+				self.TheCanvas.itemconfigure(Item,state="normal",fill=FOOD_COLORS[int(Content[Row,Column])])
+		self.DrawnContent=Content.copy()
+
+	#################################################################
+	# Private function to draw the animals
+	# Inputs:
+	#  Animals - list of (Id,X,Y,Fill) for each animal
+	#################################################################
+	def UpdateAnimals(self,Animals):
+		Drawn=self.AnimalItems
+		self.AnimalItems={}
+		for Id,X,Y,Fill in Animals:
+			Info=Drawn.pop(Id,None)
+			if (Info==None): # a new animal
+				if len(self.FreeItems)>0: # reuse a hidden item
+					Item=self.FreeItems.pop()
+					self.TheCanvas.itemconfigure(Item,state="normal",fill=Fill)
+					self.TheCanvas.coords(Item,X-Animal.WIDTH/2,Y-Animal.HEIGHT/2,X+Animal.WIDTH/2,Y+Animal.HEIGHT/2)
+				else:
+					Item=self.TheCanvas.create_rectangle(X-Animal.WIDTH/2,Y-Animal.HEIGHT/2,X+Animal.WIDTH/2,Y+Animal.HEIGHT/2,fill=Fill)
+				Info=[Item,X,Y,Fill]
+			else:
+				if (Info[1]!=X) or (Info[2]!=Y): # the animal moved
+					self.TheCanvas.coords(Info[0],X-Animal.WIDTH/2,Y-Animal.HEIGHT/2,X+Animal.WIDTH/2,Y+Animal.HEIGHT/2)
+					Info[1]=X
+					Info[2]=Y
+				if Info[3]!=Fill: # a different animal has the Id (animals in arrays are numbered by their index)
+					self.TheCanvas.itemconfigure(Info[0],fill=Fill)
+					Info[3]=Fill
+			self.AnimalItems[Id]=Info
+
+		# hide the animals that died or were eaten and keep their items for reuse
+		for Info in Drawn.values():
+			self.TheCanvas.itemconfigure(Info[0],state="hidden")
+			self.FreeItems.append(Info[0])
@@ -0,0 +1,443 @@
+#################################################################
+# Shares the state of a running model with other processes.
+#
+# A FrameWriter is an observer of a world (see World.AddObserver)
+# that copies the animals (Id, CenterX, CenterY and Type) and what
+# is in each cell of Food into shared memory at the end of every
+# cycle.  A FrameReader in another process (e.g. a viewer or a
+# process that works out statistics) maps the same memory and gets
+# NumPy arrays that look straight at it, so nothing is pickled or
+# copied to read a frame.
+#
+# The writer has three "slots".  It always writes into a slot that
+# does not have the newest frame in it, and then makes that slot
+# the newest one, so a reader never sees a frame that is half
+# written.  A reader holds the slot it is reading (Acquire) until
+# it lets go of it (Release); the writer does not write over a slot
+# that is held.  With one reader there is always a slot that is
+# neither the newest nor held, so the writer never waits for it and
+# the newest frame is never more than one cycle old.  If there is
+# no free slot (more readers) the writer either skips the frame (so
+# the model does not wait for a slow reader) or waits for a reader
+# to let go (Wait).  The slots are handed over with a
+# multiprocessing Lock that is only held while the Control values
+# are changed, not while the arrays are copied.
+#
+# When the world is split between processes (see Parallel.py) each
+# part has its own writer, and a FrameReader made with the handles
+# of all of the parts gives frames with every part at the same
+# cycle.
+#
+# The slot is replaced with a bigger block of shared memory when
+# there are more animals than it has room for.
+#################################################################
+
+# Import standard Python libraries
+import math
+import multiprocessing
+import multiprocessing.resource_tracker
+import multiprocessing.shared_memory
+import os
+import time
+
+import numpy
+
+#################################################################
+# Global values
+#################################################################
+
+NUM_SLOTS=3 # frames that are kept (the newest one, one being read and one being written)
+START_CAPACITY=1024 # number of animals each slot has room for to start with
+WAIT_TIME=0.001 # seconds to sleep while waiting for a slot
+ACQUIRE_ATTEMPTS=100 # times a reader tries to get the same cycle from every part
+
+# The Control values (int64) for the writer, then CYCLE, NUM_ANIMALS,
+# GENERATION, CAPACITY and HOLDS for each slot
+PUBLISHED=0 # the slot with the newest frame in it (-1 for none yet)
+SKIPPED=1 # number of frames that were skipped because the slot was held
+FIRST_SLOT=2
+CYCLE=0 # cycle of the frame in the slot (-1 while it is being written)
+NUM_ANIMALS=1 # number of animals in the frame
+GENERATION=2 # number of times the slot's block of shared memory has been replaced
+CAPACITY=3 # number of animals the slot's block has room for
+HOLDS=4 # number of readers holding the slot
+SLOT_SIZE=5
+
+#################################################################
+# Private function to get the index of a slot's value in Control
+#################################################################
+
+def SlotValue(Slot,Value):
+	return(FIRST_SLOT+Slot*SLOT_SIZE+Value)
+
+#################################################################
+# Private function to get the name of a slot's block of shared memory
+#################################################################
+
+def BlockName(Name,Slot,Generation):
+	return(Name+"_"+format(Slot)+"_"+format(Generation))
+
+#################################################################
+# Private function to get the arrays of a frame in a slot's block
+# Output:
+#  (Id,CenterX,CenterY,Type,Content) arrays of Capacity animals
+#  (Content is None if the frames have no Food)
+#################################################################
+
+def SlotArrays(Buffer,Capacity,NumRows,NumColumns,Food):
+	Id=numpy.ndarray((Capacity,),numpy.int64,Buffer,0)
+	CenterX=numpy.ndarray((Capacity,),numpy.float64,Buffer,8*Capacity)
+	CenterY=numpy.ndarray((Capacity,),numpy.float64,Buffer,16*Capacity)
+	Type=numpy.ndarray((Capacity,),numpy.int8,Buffer,24*Capacity)
+	Content=None
+	if Food: Content=numpy.ndarray((NumRows,NumColumns),numpy.uint8,Buffer,25*Capacity)
+	return(Id,CenterX,CenterY,Type,Content)
+
+#################################################################
+# Private function to get the number of bytes a slot needs
+#################################################################
+
+def SlotSize(Capacity,NumRows,NumColumns,Food):
+	Size=25*Capacity
+	if Food: Size=Size+NumRows*NumColumns
+	return(max(Size,1))
+
+#################################################################
+# What a process needs to know to read the frames of one writer.
+# It is made before the writer and the reader processes are
+# started, and is given to both (it has the Lock in it, so it can
+# only be given to a process when the process is started).
+#################################################################
+
+class FrameHandle:
+	#################################################################
+	# Initialize the new object
+	# Inputs:
+	#  Width,Height - size of the world in pixels
+	#  CellSize - width and height of each cell of Food in pixels
+	#  NumRows,NumColumns - number of cells of Food in the frames
+	#  FirstColumn - the column of the world the first column of
+	#   cells in the frames is (for one part of a world)
+	#  Food - False to leave the Food out of the frames (e.g. for a
+	#   world that is too big to copy every cell of)
+	#################################################################
+	def __init__(self,Width,Height,CellSize,NumRows,NumColumns,FirstColumn=0,Food=True):
+		self.Name="Frames"+format(os.getpid())+"_"+os.urandom(4).hex()
+		self.Lock=multiprocessing.Lock()
+		self.Width=Width
+		self.Height=Height
+		self.CellSize=CellSize
+		self.NumRows=NumRows
+		self.NumColumns=NumColumns
+		self.FirstColumn=FirstColumn
+		self.Food=Food
+
+		# the processes that are started after this share one tracker of the shared
+		# memory, so a reader that stops does not free the writer's memory
+		multiprocessing.resource_tracker.ensure_running()
+
+#################################################################
+# Make the handle for the frames of a whole world
+#################################################################
+
+def WorldHandle(TheWorld,Food=True):
+	CellSize=TheWorld.TheFood.CellSize
+	NumRows=int(math.ceil(TheWorld.Height/float(CellSize)))
+	NumColumns=int(math.ceil(TheWorld.Width/float(CellSize)))
+	return(FrameHandle(TheWorld.Width,TheWorld.Height,CellSize,NumRows,NumColumns,0,Food))
+
+#################################################################
+# The class definition for the writer
+#################################################################
+
+class FrameWriter:
+	#################################################################
+	# Initialize the new object and make the shared memory
+	# Inputs:
+	#  Handle - the FrameHandle for the frames
+	#  Wait - True to wait for the readers to let go of a slot, False
+	#   to skip the frame
+	#################################################################
+	def __init__(self,Handle,Wait=False):
+		self.Handle=Handle
+		self.Wait=Wait
+
+		self.ControlMemory=multiprocessing.shared_memory.SharedMemory(Handle.Name,True,8*(FIRST_SLOT+NUM_SLOTS*SLOT_SIZE))
+		self.Control=numpy.ndarray((FIRST_SLOT+NUM_SLOTS*SLOT_SIZE,),numpy.int64,self.ControlMemory.buf)
+		self.Control[:]=0
+		self.Control[PUBLISHED]=-1
+
+		self.Memory=[None]*NUM_SLOTS # the block of shared memory for each slot
+		for Slot in range(NUM_SLOTS):
+			self.Control[SlotValue(Slot,CYCLE)]=-1
+			self.Control[SlotValue(Slot,GENERATION)]=-1
+			self.NewBlock(Slot,START_CAPACITY)
+
+	#################################################################
+	# Private function to replace the block of shared memory for a
+	# slot with a new one
+	#################################################################
+	def NewBlock(self,Slot,Capacity):
+		Handle=self.Handle
+		Generation=int(self.Control[SlotValue(Slot,GENERATION)])+1
+		Memory=multiprocessing.shared_memory.SharedMemory(BlockName(Handle.Name,Slot,Generation),True,
+			SlotSize(Capacity,Handle.NumRows,Handle.NumColumns,Handle.Food))
+		if self.Memory[Slot]!=None:
+			self.Memory[Slot].close()
+			self.Memory[Slot].unlink()
+		self.Memory[Slot]=Memory
+		self.Control[SlotValue(Slot,CAPACITY)]=Capacity
+		self.Control[SlotValue(Slot,GENERATION)]=Generation
+
+	#################################################################
+	# Private function to get a slot that no reader is holding to
+	# write the next frame into
+	# Output:
+	#  the slot, or None if the frame is skipped
+	#################################################################
+	def ClaimSlot(self):
+		while True:
+			self.Handle.Lock.acquire()
+			try:
+				Published=int(self.Control[PUBLISHED])
+				for Step in range(1,NUM_SLOTS):
+					Slot=(Published+Step)%NUM_SLOTS
+					if self.Control[SlotValue(Slot,HOLDS)]==0:
+						self.Control[SlotValue(Slot,CYCLE)]=-1 # so no reader takes it while it is written
+						return(Slot)
+				if not self.Wait:
+					self.Control[SKIPPED]+=1
+					return(None)
+			finally:
+				self.Handle.Lock.release()
+			time.sleep(WAIT_TIME)
+
+	#################################################################
+	# Write a frame of the world (called by the world at the end of
+	# each cycle)
+	#################################################################
+	def Update(self,TheWorld):
+		self.Write(TheWorld)
+
+	#################################################################
+	# Write a frame of the world
+	# Inputs:
+	#  TheWorld - the world
+	#  Ids - the Id of each animal when they are in arrays (None to
+	#   use their index)
+	#################################################################
+	def Write(self,TheWorld,Ids=None):
+		Slot=self.ClaimSlot()
+		if Slot==None: return
+
+		TheAnimals=TheWorld.TheAnimals
+		NumAnimals=len(TheAnimals)
+		Capacity=int(self.Control[SlotValue(Slot,CAPACITY)])
+		if NumAnimals>Capacity:
+			Capacity=max(NumAnimals,2*Capacity)
+			self.NewBlock(Slot,Capacity)
+		Handle=self.Handle
+		Id,CenterX,CenterY,Type,Content=SlotArrays(self.Memory[Slot].buf,Capacity,Handle.NumRows,
+			Handle.NumColumns,Handle.Food)
+
+		if hasattr(TheAnimals,"CenterX"): # the animals are in arrays (see AnimalArrays.py)
+			if Ids is None: Ids=numpy.arange(NumAnimals)
+			Id[:NumAnimals]=Ids
+			CenterX[:NumAnimals]=TheAnimals.CenterX
+			CenterY[:NumAnimals]=TheAnimals.CenterY
+			Type[:NumAnimals]=TheAnimals.Type
+		else: # AnimalClass objects
+			for Index,TheAnimal in enumerate(TheAnimals):
+				Id[Index]=TheAnimal.Id
+				CenterX[Index]=TheAnimal.CenterX
+				CenterY[Index]=TheAnimal.CenterY
+				Type[Index]=TheAnimal.Type
+		if Handle.Food: Content[:]=TheWorld.TheFood.AllContent()
+		Id=CenterX=CenterY=Type=Content=None
+
+		Handle.Lock.acquire()
+		try:
+			self.Control[SlotValue(Slot,CYCLE)]=TheWorld.Cycle
+			self.Control[SlotValue(Slot,NUM_ANIMALS)]=NumAnimals
+			self.Control[PUBLISHED]=Slot
+		finally:
+			Handle.Lock.release()
+
+	#################################################################
+	# Number of frames that were skipped because a reader was slow
+	#################################################################
+	def NumSkipped(self):
+		return(int(self.Control[SKIPPED]))
+
+	#################################################################
+	# Free the shared memory
+	#################################################################
+	def Close(self):
+		for Slot in range(NUM_SLOTS):
+			if self.Memory[Slot]!=None:
+				self.Memory[Slot].close()
+				self.Memory[Slot].unlink()
+				self.Memory[Slot]=None
+		if self.ControlMemory!=None:
+			self.Control=None
+			self.ControlMemory.close()
+			self.ControlMemory.unlink()
+			self.ControlMemory=None
+
+#################################################################
+# One frame from a FrameReader.  Parts has the arrays for each part
+# of the world (one part unless the world is split between
+# processes), each with:
+#  Id,CenterX,CenterY,Type - one value for each animal
+#  Content - what is in each cell of Food (None if the frames have
+#   no Food)
+#  FirstColumn - the column of the world the first column of
+#   Content is
+# The arrays look straight at the shared memory, so they must not
+# be used after the frame is released.
+#################################################################
+
+class FramePart:
+	def __init__(self,Id,CenterX,CenterY,Type,Content,FirstColumn):
+		self.Id=Id
+		self.CenterX=CenterX
+		self.CenterY=CenterY
+		self.Type=Type
+		self.Content=Content
+		self.FirstColumn=FirstColumn
+
+class Frame:
+	def __init__(self,Cycle,Parts,Slots):
+		self.Cycle=Cycle
+		self.Parts=Parts
+		self.Slots=Slots # the slot that is held for each part
+
+	#################################################################
+	# Number of animals of a Type in the frame
+	#################################################################
+	def Count(self,Type):
+		return(sum([int(numpy.count_nonzero(ThePart.Type==Type)) for ThePart in self.Parts]))
+
+#################################################################
+# The class definition for the reader
+#################################################################
+
+class FrameReader:
+	#################################################################
+	# Initialize the new object
+	# Inputs:
+	#  Handles - the FrameHandle of the writer (or a list of them, one
+	#   for each part of a world, see Parallel.py)
+	#################################################################
+	def __init__(self,Handles):
+		if isinstance(Handles,FrameHandle): Handles=[Handles]
+		self.Handles=Handles
+		self.ControlMemory=[]
+		self.Control=[]
+		for Handle in Handles:
+			Memory=multiprocessing.shared_memory.SharedMemory(Handle.Name)
+			self.ControlMemory.append(Memory)
+			self.Control.append(numpy.ndarray((FIRST_SLOT+NUM_SLOTS*SLOT_SIZE,),numpy.int64,Memory.buf))
+		self.Opened={} # (Generation,SharedMemory) for each (part,slot) that has been opened
+
+	#################################################################
+	# Private function to hold the slot with a cycle in it
+	# Output:
+	#  the slot, or None if no slot has that cycle in it
+	#################################################################
+	def Hold(self,Part,Cycle):
+		Control=self.Control[Part]
+		self.Handles[Part].Lock.acquire()
+		try:
+			for Slot in range(NUM_SLOTS):
+				if Control[SlotValue(Slot,CYCLE)]==Cycle:
+					Control[SlotValue(Slot,HOLDS)]+=1
+					return(Slot)
+		finally:
+			self.Handles[Part].Lock.release()
+		return(None)
+
+	#################################################################
+	# Private function to let go of a slot
+	#################################################################
+	def Unhold(self,Part,Slot):
+		self.Handles[Part].Lock.acquire()
+		try:
+			self.Control[Part][SlotValue(Slot,HOLDS)]-=1
+		finally:
+			self.Handles[Part].Lock.release()
+
+	#################################################################
+	# Private function to get the newest cycle a part has written
+	# (-1 for none)
+	#################################################################
+	def Newest(self,Part):
+		Control=self.Control[Part]
+		self.Handles[Part].Lock.acquire()
+		try:
+			Slot=int(Control[PUBLISHED])
+			if Slot<0: return(-1)
+			return(int(Control[SlotValue(Slot,CYCLE)]))
+		finally:
+			self.Handles[Part].Lock.release()
+
+	#################################################################
+	# Get the newest frame (the newest cycle that every part has
+	# written) and hold it until Release() is called.
+	# Inputs:
+	#  After - only return a frame for a cycle after this one
+	# Output:
+	#  the Frame, or None if there is no new frame yet
+	#################################################################
+	def Acquire(self,After=-1):
+		for Attempt in range(ACQUIRE_ATTEMPTS):
+			Cycle=min([self.Newest(Part) for Part in range(len(self.Handles))])
+			if Cycle<=After: return(None)
+
+			Slots=[]
+			for Part in range(len(self.Handles)):
+				Slot=self.Hold(Part,Cycle)
+				if Slot==None: break # the part has written over that cycle, try the newer one
+				Slots.append(Slot)
+			if len(Slots)==len(self.Handles):
+				return(Frame(Cycle,[self.PartArrays(Part,Slot) for Part,Slot in enumerate(Slots)],Slots))
+			for Part,Slot in enumerate(Slots): self.Unhold(Part,Slot)
+			time.sleep(WAIT_TIME)
+		return(None)
+
+	#################################################################
+	# Private function to get the arrays for a slot that is held
+	#################################################################
+	def PartArrays(self,Part,Slot):
+		Handle=self.Handles[Part]
+		Control=self.Control[Part]
+		Generation=int(Control[SlotValue(Slot,GENERATION)])
+		Opened=self.Opened.get((Part,Slot))
+		if (Opened==None) or (Opened[0]!=Generation): # the writer has a new block for the slot
+			if Opened!=None: Opened[1].close()
+			Opened=(Generation,multiprocessing.shared_memory.SharedMemory(BlockName(Handle.Name,Slot,Generation)))
+			self.Opened[(Part,Slot)]=Opened
+		Memory=Opened[1]
+		Capacity=int(Control[SlotValue(Slot,CAPACITY)])
+		NumAnimals=int(Control[SlotValue(Slot,NUM_ANIMALS)])
+		Id,CenterX,CenterY,Type,Content=SlotArrays(Memory.buf,Capacity,Handle.NumRows,Handle.NumColumns,Handle.Food)
+		return(FramePart(Id[:NumAnimals],CenterX[:NumAnimals],CenterY[:NumAnimals],Type[:NumAnimals],Content,
+			Handle.FirstColumn))
+
+	#################################################################
+	# Let go of a frame so the writers can use its slots again
+	#################################################################
+	def Release(self,TheFrame):
+		for Part,Slot in enumerate(TheFrame.Slots): self.Unhold(Part,Slot)
+		TheFrame.Parts=[]
+		TheFrame.Slots=[]
+
+	#################################################################
+	# Close the shared memory
+	#################################################################
+	def Close(self):
+		for Generation,Memory in self.Opened.values(): Memory.close()
+		self.Opened={}
+		self.Control=[]
+		for Memory in self.ControlMemory: Memory.close()
+		self.ControlMemory=[]
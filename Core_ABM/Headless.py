@@ -0,0 +1,131 @@
+#################################################################
+# Runs a model without a window.
+#
+# This is the same model as Test.py (see the Model.py in the model
+# folder for the model constants) but nothing is drawn, so it can be
+# run on machines without a display and runs as fast as the model
+# allows.
+#
+# Usage: python Headless.py ModelFolder [NumCycles] [arrays] [batch] [tiles] [width=N] [height=N] [cell=N] [workers=N]
+#  e.g. python Core_ABM/Headless.py Zombie_ABM 1000
+#
+# Add "arrays" to keep the animals in NumPy arrays (see
+# Model.USE_ARRAYS) instead of AnimalClass objects, "batch" for the
+# AnimalClass objects to shoot, eat and infect all at once (see
+# Model.BATCH_HUNTING), and "tiles" to
+# keep the Food in tiles that are only created when they are used
+# (see Model.USE_TILES).  width, height
+# and cell set the size of the world and of each cell of Food in
+# pixels for this run (the defaults are Model.WORLD_WIDTH,
+# Model.WORLD_HEIGHT and Model.CELL_SIZE).  workers splits the
+# world between that many processes (see Model.NUM_WORKERS and
+# Parallel.py).
+#
+# One line with the cycle and the number of each type of animal
+# (see Model.CountAnimals) is printed for every cycle, followed by
+# the run time.  All of the
+# statistics are also written to Model.STATS_FILE if it is set.
+#
+# If Model.CHECKPOINT_PATH is set, the model is saved there every
+# Model.CHECKPOINT_EVERY cycles, and a run that was stopped carries
+# on from the last checkpoint when it is started again.
+#
+# If Model.PROFILE is True, the time spent in each phase of a cycle
+# is printed at the end (see Profiler.py).
+#################################################################
+
+# Import standard Python libraries
+import sys
+import time
+
+# Import our custom modules
+import Animal # module with the class to create the animals
+import Checkpoint # module to save the model and carry on later
+import Parallel # module to split the world between processes
+import Profiler # module to time the phases of each cycle
+import Scenario # module to load a model and create its world
+import Stats # module to write the statistics for each cycle to a file
+
+#################################################################
+# Global values
+#################################################################
+
+NUM_CYCLES=1000 # number of cycles to run if none is given on the command line
+
+#################################################################
+# Run the model for a number of cycles
+# Inputs:
+#  Model - the Model module (see Scenario.Load)
+#  NumCycles - number of cycles to run
+#  TheProfiler - Profiler to time the cycles with (None to not time them)
+#  Width,Height,CellSize - size of the world and of each cell of Food
+#   (None for the sizes in the Model, see Scenario.CreateWorld)
+# Output:
+#  list with the counts from Model.CountAnimals for each cycle that was
+#  run (after the checkpoint if the run carried on from one)
+#################################################################
+
+def Run(Model,NumCycles,TheProfiler=None,Width=None,Height=None,CellSize=None):
+	if Model.NUM_WORKERS>1:
+		if Model.CHECKPOINT_PATH!=None: raise ValueError("A world that is split between processes can not be checkpointed")
+		TheWorld=Parallel.ParallelWorld(Model,Model.NUM_WORKERS,None,None,Width,Height,CellSize)
+	elif (Model.CHECKPOINT_PATH!=None) and Checkpoint.Exists(Model.CHECKPOINT_PATH):
+		TheWorld=Checkpoint.Load(Model.CHECKPOINT_PATH)
+	else:
+		TheWorld=Scenario.CreateWorld(Model,None,None,Width,Height,CellSize)
+	if Model.CHECKPOINT_PATH!=None:
+		TheWorld.AddObserver(Checkpoint.CheckpointWriter(Model.CHECKPOINT_PATH,Model.CHECKPOINT_EVERY))
+
+	TheStats=None
+	if Model.STATS_FILE!=None:
+		TheStats=Stats.StatsWriter(Model.STATS_FILE,Model.Statistics)
+		TheWorld.AddObserver(TheStats)
+
+	TheWorld.Profiler=TheProfiler
+
+	Counts=[]
+	try:
+		while TheWorld.Cycle<NumCycles:
+			TheWorld.Update()
+			Counts.append(Model.CountAnimals(TheWorld))
+	finally:
+		if TheStats!=None: TheStats.Close()
+		if TheProfiler!=None: TheProfiler.Close()
+		if isinstance(TheWorld,Parallel.ParallelWorld): TheWorld.Close()
+	return(Counts)
+
+#################################################################
+# Main
+#################################################################
+
+if __name__=="__main__":
+	if len(sys.argv)<2:
+		print("Usage: python Headless.py ModelFolder [NumCycles] [arrays] [batch] [tiles] [width=N] [height=N] [cell=N] [workers=N]")
+		sys.exit(1)
+	Model=Scenario.Load(sys.argv[1])
+	NumCycles=NUM_CYCLES
+	if len(sys.argv)>2: NumCycles=int(sys.argv[2])
+	Sizes={"width":None,"height":None,"cell":None}
+	for Option in sys.argv[3:]:
+		if Option=="arrays": Model.USE_ARRAYS=True
+		elif Option=="batch": Model.BATCH_HUNTING=True
+		elif Option=="tiles": Model.USE_TILES=True
+		elif Option.split("=")[0] in Sizes: Sizes[Option.split("=")[0]]=int(Option.split("=")[1])
+		elif Option.split("=")[0]=="workers": Model.NUM_WORKERS=int(Option.split("=")[1])
+		else: raise ValueError("Unknown option "+Option)
+
+	Animal.PRINT_EVENTS=False # keep the output to one line per cycle
+
+	TheProfiler=None
+	if Model.PROFILE: TheProfiler=Profiler.Profiler(Model.PROFILE_FILE)
+
+	StartTime=time.time()
+	Counts=Run(Model,NumCycles,TheProfiler,Sizes["width"],Sizes["height"],Sizes["cell"])
+	ElapsedTime=time.time()-StartTime
+
+	Cycle=NumCycles-len(Counts)+1 # the run may have carried on from a checkpoint
+	for TheCounts in Counts:
+		print(",".join([format(Value) for Value in (Cycle,)+tuple(TheCounts)]))
+		Cycle=Cycle+1
+	print("Ran "+format(NumCycles)+" cycles in "+format(round(ElapsedTime,3))+" seconds")
+	if TheProfiler!=None: print(TheProfiler.Summary())
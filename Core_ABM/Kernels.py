@@ -0,0 +1,193 @@
+#################################################################
+# Compiled loops for the parts of a cycle that NumPy does poorly.
+#
+# Finding the pairs of animals within reach (AnimalArrays.FindPairs)
+# checks the distance of every pair in the cells around each
+# animal, which NumPy can only do by making an array with one entry
+# for every pair it looks at.  The random steps of the animals
+# (AnimalArrays.Move) and putting the animals that have moved off of
+# the world back on at the other edge (World.WrapArrays) are done
+# with a few passes over the arrays each.
+#
+# If Numba (https://numba.pydata.org) is installed these are done
+# with loops that are compiled to machine code the first time they
+# are used (and kept in __pycache__ for the next run).  If it is
+# not installed, or USE_NUMBA is False, the NumPy code is used.
+# The loops are only used by the animals in NumPy arrays
+# (AnimalArrays.py, Parallel.py and Animal.HuntAll), and the NumPy
+# code they replace is what they are checked against: both give
+# exactly the same results for the same seed, as the loops look at
+# the pairs in the same order and the random numbers are still drawn
+# with NumPy (see test_kernels.py).  They do not make the AnimalClass
+# objects give the same results as the arrays.
+#################################################################
+
+import numpy
+
+try:
+	import numba
+except ImportError:
+	numba=None
+
+#################################################################
+# Global values
+#################################################################
+
+USE_NUMBA=True # use the compiled loops when Numba is installed (see Model.USE_NUMBA)
+
+#################################################################
+# Find out if the compiled loops are used
+# Output:
+#  True if Numba is installed and USE_NUMBA is True
+#################################################################
+
+def Active():
+	return(USE_NUMBA and (numba is not None))
+
+#################################################################
+# Private function to compile a loop with Numba (the loop is
+# returned as it is if Numba is not installed)
+#################################################################
+
+def Compile(Loop):
+	if numba is None: return(Loop)
+	return(numba.njit(cache=True)(Loop))
+
+#################################################################
+# Private function to turn off the compiled loops if Numba can not
+# compile one of them, so the NumPy code is used from then on
+#################################################################
+
+def CompileFailed(Error):
+	global USE_NUMBA
+	USE_NUMBA=False
+	print("Numba could not compile the loops, using NumPy instead ("+format(Error).splitlines()[0]+")")
+
+#################################################################
+# Private loop for FindPairs.  Goes through the 9 cells around each
+# animal of the first set in the same order as AnimalArrays.FindPairs
+# (cell offset, then animal of the first set, then animal in the
+# cell), once to count the pairs and once to fill them in.
+#################################################################
+
+def PairsLoop(X1,Y1,Row1,Column1,X2,Y2,SortedCells,Order,NumRows,NumColumns,Distance):
+	I=numpy.zeros(0,dtype=numpy.intp)
+	J=numpy.zeros(0,dtype=numpy.intp)
+	Total=0
+	for Pass in range(2):
+		if Pass==1:
+			I=numpy.zeros(Total,dtype=numpy.intp)
+			J=numpy.zeros(Total,dtype=numpy.intp)
+		Count=0
+		for RowOffset in range(-1,2):
+			for ColumnOffset in range(-1,2):
+				for Index in range(len(X1)):
+					Row=Row1[Index]+RowOffset
+					Column=Column1[Index]+ColumnOffset
+					if (Row<0) or (Row>=NumRows) or (Column<0) or (Column>=NumColumns): continue
+					Cell=Row*NumColumns+Column
+					Position=numpy.searchsorted(SortedCells,Cell)
+					while (Position<len(SortedCells)) and (SortedCells[Position]==Cell):
+						Other=Order[Position]
+						if (abs(X1[Index]-X2[Other])<Distance) and (abs(Y1[Index]-Y2[Other])<Distance):
+							if Pass==1:
+								I[Count]=Index
+								J[Count]=Other
+							Count=Count+1
+						Position=Position+1
+		Total=Count
+	return(I,J)
+
+PairsLoop=Compile(PairsLoop)
+
+#################################################################
+# Private loop for Step
+#################################################################
+
+def StepLoop(X,Y,Moved,StepX,StepY,Spread,NormalX,NormalY):
+	for Index in range(len(Moved)):
+		TheAnimal=Moved[Index]
+		X[TheAnimal]=X[TheAnimal]+(StepX[TheAnimal]+NormalX[Index]*Spread[Index])
+		Y[TheAnimal]=Y[TheAnimal]+(StepY[TheAnimal]+NormalY[Index]*Spread[Index])
+
+StepLoop=Compile(StepLoop)
+
+#################################################################
+# Private loop for Wrap
+#################################################################
+
+def WrapLoop(X,Width,MaxX):
+	Result=numpy.zeros(len(X))
+	for Index in range(len(X)):
+		if X[Index]<0: Result[Index]=MaxX
+		elif X[Index]>=Width: Result[Index]=0
+		else: Result[Index]=X[Index]
+	return(Result)
+
+WrapLoop=Compile(WrapLoop)
+
+#################################################################
+# Find all of the pairs of animals that are within a distance of
+# each other (see AnimalArrays.FindPairs, which sorts the second
+# set of animals by cell before calling this)
+# Inputs:
+#  X1,Y1 - locations of the first set of animals
+#  Row1,Column1 - cell of each animal in the first set
+#  X2,Y2 - locations of the second set of animals
+#  SortedCells - cell of each animal in the second set, in order
+#  Order - index in the second set of each entry of SortedCells
+#  NumRows,NumColumns - number of cells
+#  Distance - how close the animals need to be (in X and in Y)
+# Output:
+#  (I,J) arrays with the index in the first and second set of
+#  each pair that is within the distance, or None if the compiled
+#  loop can not be used
+#################################################################
+
+def FindPairs(X1,Y1,Row1,Column1,X2,Y2,SortedCells,Order,NumRows,NumColumns,Distance):
+	try:
+		return(PairsLoop(X1,Y1,Row1,Column1,X2,Y2,SortedCells,Order,NumRows,NumColumns,float(Distance)))
+	except numba.core.errors.NumbaError as Error:
+		CompileFailed(Error)
+		return(None)
+
+#################################################################
+# Move the animals by their steps and a random step each.  The
+# locations are changed in place.
+# Inputs:
+#  X,Y - locations of all of the animals
+#  Moved - index of each animal that moves
+#  StepX,StepY - step of each animal (for all of the animals)
+#  Spread - size of the random step of each animal that moves
+#  NormalX,NormalY - normal random numbers for each animal that moves
+# Output:
+#  True if the animals were moved, False if the compiled loop can
+#  not be used
+#################################################################
+
+def Step(X,Y,Moved,StepX,StepY,Spread,NormalX,NormalY):
+	try:
+		StepLoop(X,Y,Moved,StepX,StepY,Spread,NormalX,NormalY)
+		return(True)
+	except numba.core.errors.NumbaError as Error:
+		CompileFailed(Error)
+		return(False)
+
+#################################################################
+# Put locations that have moved off of the world back on at the
+# other edge (see World.WrapArrays)
+# Inputs:
+#  X - locations in pixels along one side of the world
+#  Size - width or height of the world
+#  Max - where a location that moves off of the start comes back on
+# Output:
+#  new array inside the world, or None if the compiled loop can
+#  not be used
+#################################################################
+
+def Wrap(X,Size,Max):
+	try:
+		return(WrapLoop(X,float(Size),float(Max)))
+	except numba.core.errors.NumbaError as Error:
+		CompileFailed(Error)
+		return(None)
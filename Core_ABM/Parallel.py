@@ -0,0 +1,662 @@
+#################################################################
+# Runs one world split between a number of processes.
+#
+# The world is cut into vertical strips ("parts"), one for each
+# worker process.  Each part has its own AnimalArrays with the
+# animals that are in its strip, its own grid of Food for the cells
+# in its strip and its own random numbers (see RandomStreams.Part).
+#
+# Each cycle, every part:
+# - grows its Food, updates the counters and finds the deaths and
+#   births of its animals (AnimalArrays.Age)
+# - sends a copy of its animals that are within HaloWidth() of the
+#   edge of the strip to the part next door ("halo" animals)
+# - shoots, eats and infects (AnimalArrays.Hunt) with its own
+#   animals and the halo animals from the parts next door.  The
+#   animals are sorted by Id first so every part that sees a pair of
+#   animals picks the same hunter for a target.  The halo is wide
+#   enough that everything that happens to the part's own animals
+#   is the same as if the part could see the whole world, and what
+#   happens to the halo animals is thrown away (their own part
+#   works it out as well).
+# - adds up the number of each type of animal in all of the parts
+#   (the random steps depend on it, see AnimalArrays.Move)
+# - forages and moves its own animals
+# - sends the animals that have moved out of its strip to the part
+#   they are now in
+#
+# The animals are sent through shared memory: each part has one
+# block of shared memory that it writes the animals it sends into
+# (one RECORD for each), and the parts read the animals that are
+# for them straight out of the blocks of the other parts.  The
+# block is replaced with a bigger one when it is full.  The parts
+# wait for each other with a Barrier, and the main process only
+# sends each worker a message to start each cycle (nothing is
+# pickled after the workers have started).  The totals for each
+# part (the number of each type of animal, the events, ...) are
+# put in a shared Control array so the main process can make the
+# statistics.
+#
+# With the halo animals, an animal sees and shoots, eats, infects,
+# chases or flees from the animals across the edge of its strip
+# just as it would in one process.  The results are only different
+# from a run in one process because each part draws its random
+# numbers (the random steps, and the Food and Ammo that grow) from
+# its own stream.  A run with the same seed and number of parts is
+# always the same.
+#
+# ParallelWorld can be used in place of a World in Headless.py
+# (see Model.NUM_WORKERS).  It can not be drawn or saved with
+# Checkpoint.py.
+#################################################################
+
+# Import standard Python libraries
+import math
+import multiprocessing
+import multiprocessing.shared_memory
+import os
+import traceback
+
+import numpy
+
+# Import our custom modules
+import AnimalArrays # module to keep the animals in NumPy arrays
+import Frames # module to share frames of the model with other processes
+import Kernels # module with the loops that are compiled with Numba
+import RandomStreams # module with the random numbers for a run
+import Scenario # module to load a model and create its world
+import World # module with the world the animals live in
+
+#################################################################
+# Global values
+#################################################################
+
+# The values for each animal that is sent to another part
+RECORD=numpy.dtype([("Id",numpy.int64),("To",numpy.int32),("CenterX",numpy.float64),("CenterY",numpy.float64),
+	("Type",numpy.int8),("BirthCounter",numpy.int32),("LifeCounter",numpy.int32),("Ammo",numpy.int32)])
+
+START_CAPACITY=1024 # number of records each part has room for to start with
+
+EVENT_NAMES=("Births","Deaths","Shots","Eaten","Infections") # events that are added up over the parts
+
+# The columns of the Control array (one row for each part).  The
+# events and then the number of each type of animal (at the end of
+# the cycle, and after hunting) come after these.
+GENERATION=0 # number of times the part has replaced its block of shared memory
+NUM_RECORDS=1 # number of records in the part's block
+CYCLE=2 # number of cycles the part has run
+AMMO=3 # Ammo carried by the animals in the part
+FULL_CELLS=4 # number of cells of Food/Ammo that are full
+NUM_CELLS=5 # number of cells of Food/Ammo in the part
+FIRST_EVENT=6
+
+#################################################################
+# Private function to get the first column of the counts in the
+# Control array
+#################################################################
+
+def CountColumn(NumTypes,AfterHunting=False):
+	Column=FIRST_EVENT+len(EVENT_NAMES)
+	if AfterHunting: Column=Column+NumTypes
+	return(Column)
+
+#################################################################
+# How far from the edge of its strip a part needs to see the
+# animals of the parts next door.  Each rule that kills (Shoots,
+# Eats, Infects) can change an animal because of the animals up to
+# twice its distance away (the hunter's targets, and their other
+# hunters), and after that the animals steer by the animals within
+# the largest Chases or Flees distance.
+# Inputs:
+#  Species - list of the Species in the model
+#################################################################
+
+def HaloWidth(Species):
+	Halo=0
+	Steering=0
+	for TheSpecies in Species:
+		for Rule in (TheSpecies.Shoots,TheSpecies.Eats,TheSpecies.Infects):
+			if Rule!=None: Halo=Halo+2*Rule[1]
+		for OtherType,Distance,Divisor in TheSpecies.Steering(): Steering=max(Steering,Distance)
+	return(Halo+Steering)
+
+#################################################################
+# Where each strip starts.  The strips are cut on the edges of the
+# cells of Food so each cell is in one part.
+# Inputs:
+#  NumParts - number of strips
+#  Width - width of the world in pixels
+#  CellSize - width of each cell of Food in pixels
+# Output:
+#  array with the left edge of each strip in pixels, followed by
+#  the width of the world
+#################################################################
+
+def StripEdges(NumParts,Width,CellSize):
+	Edges=[FirstColumn(Part,NumParts,Width,CellSize)*CellSize for Part in range(NumParts)]
+	return(numpy.array(Edges+[Width],dtype=numpy.float64))
+
+#################################################################
+# Private function to get the first column of cells of Food in a
+# strip (NumParts for the column after the last strip)
+#################################################################
+
+def FirstColumn(Part,NumParts,Width,CellSize):
+	NumColumns=int(math.ceil(Width/float(CellSize)))
+	return(Part*NumColumns//NumParts)
+
+#################################################################
+# Private function to get the model constants that are simple
+# values, so they can be set in the worker processes in the same
+# way as in the main process
+#################################################################
+
+def ModelConstants(Model):
+	Constants={}
+	for Name,Value in vars(Model).items():
+		if Name.startswith("_"): continue
+		if isinstance(Value,(bool,int,float,str,tuple,list,dict)) or (Value is None): Constants[Name]=Value
+	return(Constants)
+
+#################################################################
+# The Food in one strip.  Passes the locations of the animals to the
+# grid of Food with the left edge of the strip taken off.
+#################################################################
+
+class StripFood:
+	def __init__(self,TheFood,StartX,NumCells):
+		self.TheFood=TheFood
+		self.StartX=StartX
+		self.NumCells=NumCells
+		self.CellSize=TheFood.CellSize
+
+	def Update(self):
+		self.TheFood.Update()
+
+	def Forage(self,Xs,Ys):
+		return(self.TheFood.Forage(numpy.asarray(Xs)-self.StartX,Ys))
+
+	def NearestFull(self,Xs,Ys,Distance): # only the cells in the strip are looked at
+		TargetX,TargetY,Found=self.TheFood.NearestFull(numpy.asarray(Xs)-self.StartX,Ys,Distance)
+		return(TargetX+self.StartX,TargetY,Found)
+
+	def PercentCover(self):
+		return(self.TheFood.PercentCover())
+
+	def AllContent(self):
+		return(self.TheFood.AllContent())
+
+#################################################################
+# One part of the world.  This is made and run in a worker process.
+#################################################################
+
+class Part:
+	#################################################################
+	# Initialize the new object
+	# Inputs:
+	#  Model - the Model module (see Scenario.Load)
+	#  Number - the number of this part (0 for the left strip)
+	#  NumParts - the number of parts
+	#  Seed - master seed for the run
+	#  NumAnimals,Width,Height,CellSize - see Scenario.CreateWorld
+	#  Prefix - start of the names of the blocks of shared memory
+	#  Control - the shared Control array
+	#  TheBarrier - the Barrier the parts wait for each other at
+	#  Handle - FrameHandle to write a frame of the part into after
+	#   each cycle (None for no frames, see Frames.py)
+	#################################################################
+	def __init__(self,Model,Number,NumParts,Seed,NumAnimals,Width,Height,CellSize,Prefix,Control,TheBarrier,
+		Handle=None):
+		self.Number=Number
+		self.NumParts=NumParts
+		self.Prefix=Prefix
+		self.Control=Control
+		self.Barrier=TheBarrier
+		Kernels.USE_NUMBA=Model.USE_NUMBA
+
+		Starting=Model.StartingAnimals()
+		if NumAnimals!=None: Starting=Scenario.SplitAnimals(Starting,NumAnimals)
+		Species=[TheSpecies for TheSpecies,Number,Ammo in Starting]
+		self.NumTypes=max([TheSpecies.Type for TheSpecies in Species])+1
+		self.Halo=HaloWidth(Species)
+
+		self.Edges=StripEdges(NumParts,Width,CellSize)
+		self.StartX=self.Edges[Number]
+		self.EndX=self.Edges[Number+1]
+		self.Neighbours=[Other for Other in (Number-1,Number+1) if (Other>=0) and (Other<NumParts)]
+
+		# the Food for the cells in the strip (one part uses the same random numbers
+		# as a world in one process, so it gives the same results)
+		Random=RandomStreams.RandomStreams(Seed,Number if NumParts>1 else None)
+		NumRows=int(math.ceil(Height/float(CellSize)))
+		NumColumns=FirstColumn(Number+1,NumParts,Width,CellSize)-FirstColumn(Number,NumParts,Width,CellSize)
+		SpillPath=None
+		if Model.SPILL_PATH!=None: SpillPath=os.path.join(Model.SPILL_PATH,"Part"+format(Number))
+		TheFood=Scenario.CreateFood(Model,NumRows,NumColumns,Random,CellSize,SpillPath)
+		self.TheWorld=World.World(Width,Height,StripFood(TheFood,self.StartX,NumRows*NumColumns),0,Random)
+
+		# the animals start in the same places as in Scenario.CreateArrayWorld, and
+		# each part keeps the ones in its strip
+		Setup=RandomStreams.RandomStreams(Seed).Python("Setup")
+		TheAnimals=AnimalArrays.AnimalArrays(Random)
+		for TheSpecies in Species: TheAnimals.AddSpecies(TheSpecies)
+		Ids=[]
+		NextId=0
+		for TheSpecies,Count,Ammo in Starting:
+			CenterX=numpy.array([Setup.uniform(0,Width) for Index in range(Count)])
+			CenterY=numpy.array([Setup.uniform(0,Height) for Index in range(Count)])
+			Mine=(CenterX>=self.StartX)&(CenterX<self.EndX)
+			TheAnimals.Add(CenterX[Mine],CenterY[Mine],TheSpecies.Type,Ammo)
+			Ids.append(NextId+numpy.flatnonzero(Mine))
+			NextId=NextId+Count
+		self.TheWorld.TheAnimals=TheAnimals
+		self.Ids=numpy.concatenate(Ids).astype(numpy.int64)
+		self.FirstNewId=NextId # the new animals get Ids after the starting ones
+		self.NumNew=0
+
+		# the block of shared memory this part sends animals in, and the ones it has
+		# opened from the other parts (Number: (Generation,SharedMemory,Records))
+		self.Generation=-1
+		self.Memory=None
+		self.Records=None
+		self.Opened={}
+		self.NewBlock(START_CAPACITY)
+		self.WriteTotals()
+
+		self.Frames=None
+		if Handle!=None:
+			self.Frames=Frames.FrameWriter(Handle)
+			self.Frames.Write(self.TheWorld,self.Ids)
+
+	#################################################################
+	# Private function to replace the block of shared memory this
+	# part sends animals in with a new one
+	#################################################################
+	def NewBlock(self,Capacity):
+		Memory=multiprocessing.shared_memory.SharedMemory(BlockName(self.Prefix,self.Number,self.Generation+1),
+			True,Capacity*RECORD.itemsize)
+		if self.Memory!=None:
+			self.Records=None
+			self.Memory.close()
+			self.Memory.unlink()
+		self.Memory=Memory
+		self.Records=numpy.ndarray((Capacity,),RECORD,Memory.buf)
+		self.Generation=self.Generation+1
+		self.Control[self.Number,GENERATION]=self.Generation
+
+	#################################################################
+	# Private function to put copies of some of the animals in the
+	# shared block for the other parts to read
+	# Inputs:
+	#  Indexes - index of each animal to send
+	#  To - the part each animal is for (one value or an array)
+	#################################################################
+	def Send(self,Indexes,To):
+		if len(Indexes)>len(self.Records): self.NewBlock(max(len(Indexes),2*len(self.Records)))
+		TheAnimals=self.TheWorld.TheAnimals
+		Records=self.Records[:len(Indexes)]
+		Records["Id"]=self.Ids[Indexes]
+		Records["To"]=To
+		for Name in AnimalArrays.VALUE_NAMES: Records[Name]=getattr(TheAnimals,Name)[Indexes]
+		self.Control[self.Number,NUM_RECORDS]=len(Indexes)
+
+	#################################################################
+	# Private function to read the animals the other parts have sent
+	# to this part
+	# Inputs:
+	#  Parts - the parts to read from
+	# Output:
+	#  record array (a copy) with the animals
+	#################################################################
+	def Receive(self,Parts):
+		Received=[numpy.zeros(0,RECORD)]
+		for Other in Parts:
+			Generation=int(self.Control[Other,GENERATION])
+			Opened=self.Opened.get(Other)
+			if (Opened==None) or (Opened[0]!=Generation): # the part has a new block
+				if Opened!=None: Opened[1].close()
+				Memory=multiprocessing.shared_memory.SharedMemory(BlockName(self.Prefix,Other,Generation))
+				Opened=(Generation,Memory,numpy.ndarray((Memory.size//RECORD.itemsize,),RECORD,Memory.buf))
+				self.Opened[Other]=Opened
+			Records=Opened[2][:int(self.Control[Other,NUM_RECORDS])]
+			Received.append(Records[Records["To"]==self.Number])
+		return(numpy.concatenate(Received))
+
+	#################################################################
+	# Private function to get the Ids for new animals.  Each part
+	# hands out every NumParts'th Id so the Ids are never the same.
+	#################################################################
+	def NewIds(self,Count):
+		Ids=self.FirstNewId+(self.NumNew+numpy.arange(Count,dtype=numpy.int64))*self.NumParts+self.Number
+		self.NumNew=self.NumNew+Count
+		return(Ids)
+
+	#################################################################
+	# Private function to add new animals (see AnimalArrays.Update)
+	#################################################################
+	def AddNew(self,New,Mine=None):
+		TheAnimals=self.TheWorld.TheAnimals
+		for Parents,CenterX,CenterY,Type,Ammo in New:
+			if Mine is not None: # only add the animals made by this part's animals
+				Keep=Mine[Parents]
+				CenterX=CenterX[Keep]
+				CenterY=CenterY[Keep]
+				Ammo=Ammo[Keep]
+				if numpy.ndim(Type)>0: Type=Type[Keep]
+			TheAnimals.Add(CenterX,CenterY,Type,Ammo)
+			self.Ids=numpy.concatenate((self.Ids,self.NewIds(len(CenterX))))
+
+	#################################################################
+	# Run one cycle for the part (see the top of the file)
+	#################################################################
+	def Update(self):
+		TheWorld=self.TheWorld
+		TheAnimals=TheWorld.TheAnimals
+		TheWorld.Events={}
+		TheWorld.TheFood.Update()
+
+		Born=[] # the new animals from births
+		Alive=TheAnimals.Age(TheWorld,Born)
+
+		# send the animals near the edges to the parts next door
+		Indexes=[]
+		To=[]
+		for Other in self.Neighbours:
+			if Other<self.Number: Near=Alive&(TheAnimals.CenterX<self.StartX+self.Halo)
+			else: Near=Alive&(TheAnimals.CenterX>=self.EndX-self.Halo)
+			Indexes.append(numpy.flatnonzero(Near))
+			To.append(numpy.full(len(Indexes[-1]),Other,dtype=numpy.int32))
+		self.Send(numpy.concatenate(Indexes+[numpy.zeros(0,dtype=numpy.intp)]),numpy.concatenate(To+[numpy.zeros(0,dtype=numpy.int32)]))
+		self.Barrier.wait()
+		Halo=self.Receive(self.Neighbours)
+
+		# add the halo animals and sort everything by Id
+		NumOwned=len(TheAnimals)
+		TheAnimals.Extend(Halo)
+		self.Ids=numpy.concatenate((self.Ids,Halo["Id"]))
+		Owned=numpy.arange(len(TheAnimals))<NumOwned
+		Alive=numpy.concatenate((Alive,numpy.ones(len(Halo),dtype=bool)))
+		Order=numpy.argsort(self.Ids,kind="stable")
+		TheAnimals.Keep(Order)
+		self.Ids=self.Ids[Order]
+		Owned=Owned[Order]
+		Alive=Alive[Order]
+
+		Infected=[] # the new animals from infections
+		TheAnimals.Hunt(TheWorld,Alive,Infected,Owned)
+
+		# add up the animals that are left in all of the parts
+		Column=CountColumn(self.NumTypes,True)
+		self.Control[self.Number,Column:Column+self.NumTypes]=numpy.bincount(TheAnimals.Type[Alive&Owned],
+			minlength=self.NumTypes)[:self.NumTypes]
+		self.Barrier.wait()
+		Counts=self.Control[:,Column:Column+self.NumTypes].sum(axis=0).astype(numpy.int64)
+
+		TheAnimals.Feed(TheWorld,Alive&Owned)
+
+		# move the part's own animals (the halo animals are only used to steer by,
+		# and then dropped)
+		TheAnimals.Keep(Alive)
+		self.Ids=self.Ids[Alive]
+		Kept=Owned[Alive]
+		TheAnimals.Move(TheWorld,Counts,Kept)
+		TheAnimals.Keep(Kept)
+		self.Ids=self.Ids[Kept]
+
+		self.AddNew(Born)
+		self.AddNew(Infected,Owned)
+
+		# send the animals that have left the strip to the part they are in now
+		Parts=numpy.searchsorted(self.Edges[1:-1],TheAnimals.CenterX,"right").astype(numpy.int32)
+		Leaving=Parts!=self.Number
+		self.Send(numpy.flatnonzero(Leaving),Parts[Leaving])
+		TheAnimals.Keep(~Leaving)
+		self.Ids=self.Ids[~Leaving]
+		self.Barrier.wait()
+		Arrived=self.Receive([Other for Other in range(self.NumParts) if Other!=self.Number])
+		TheAnimals.Extend(Arrived)
+		self.Ids=numpy.concatenate((self.Ids,Arrived["Id"]))
+		self.Barrier.wait() # every part has read the animals before the blocks are used again
+
+		TheWorld.Cycle=TheWorld.Cycle+1
+		self.WriteTotals()
+		if self.Frames!=None: self.Frames.Write(TheWorld,self.Ids)
+
+	#################################################################
+	# Private function to put the totals for the part in the Control
+	# array
+	#################################################################
+	def WriteTotals(self):
+		TheWorld=self.TheWorld
+		Row=self.Control[self.Number]
+		Row[CYCLE]=TheWorld.Cycle
+		Row[AMMO]=TheWorld.TheAnimals.TotalAmmo()
+		Row[NUM_CELLS]=TheWorld.TheFood.NumCells
+		Row[FULL_CELLS]=int(round(TheWorld.TheFood.TheFood.FullCells()))
+		for Index,Name in enumerate(EVENT_NAMES): Row[FIRST_EVENT+Index]=TheWorld.Events.get(Name,0)
+		Column=CountColumn(self.NumTypes)
+		Row[Column:Column+self.NumTypes]=numpy.bincount(TheWorld.TheAnimals.Type,minlength=self.NumTypes)[:self.NumTypes]
+
+	#################################################################
+	# Close the shared memory
+	#################################################################
+	def Close(self):
+		if self.Frames!=None:
+			self.Frames.Close()
+			self.Frames=None
+		for Generation,Memory,Records in self.Opened.values(): Memory.close()
+		self.Opened={}
+		if self.Memory!=None:
+			self.Records=None
+			self.Memory.close()
+			self.Memory.unlink()
+			self.Memory=None
+
+#################################################################
+# Private function to get the name of a block of shared memory
+#################################################################
+
+def BlockName(Prefix,Number,Generation):
+	return(Prefix+"_"+format(Number)+"_"+format(Generation))
+
+#################################################################
+# Private function that runs in each worker process.  Makes the
+# part and runs a cycle each time the main process sends True,
+# until it sends None.  Sends back None when a cycle is done or the
+# error if something went wrong.
+#################################################################
+
+def Worker(Connection,ModelFolder,Constants,Number,NumParts,Seed,NumAnimals,Width,Height,CellSize,Prefix,NumColumns,
+	TheBarrier,Handle):
+	ControlMemory=None
+	ThePart=None
+	try:
+		Model=Scenario.Load(ModelFolder)
+		for Name,Value in Constants.items(): setattr(Model,Name,Value)
+
+		ControlMemory=multiprocessing.shared_memory.SharedMemory(Prefix)
+		Control=numpy.ndarray((NumParts,NumColumns),numpy.float64,ControlMemory.buf)
+		ThePart=Part(Model,Number,NumParts,Seed,NumAnimals,Width,Height,CellSize,Prefix,Control,TheBarrier,Handle)
+		Connection.send(None)
+		while Connection.recv()!=None:
+			ThePart.Update()
+			Connection.send(None)
+	except Exception:
+		TheBarrier.abort() # so the other parts do not wait for this one
+		Connection.send(traceback.format_exc())
+	finally:
+		if ThePart!=None: ThePart.Close()
+		Control=None
+		if ControlMemory!=None: ControlMemory.close()
+
+#################################################################
+# The totals of all of the parts, in place of TheAnimals and
+# TheFood for the statistics (see Model.Statistics)
+#################################################################
+
+class AnimalTotals:
+	def __init__(self,Control,NumTypes):
+		self.Control=Control
+		self.CountColumn=CountColumn(NumTypes)
+		self.NumTypes=NumTypes
+
+	def Count(self,Type):
+		return(int(self.Control[:,self.CountColumn+Type].sum()))
+
+	def TotalAmmo(self):
+		return(int(self.Control[:,AMMO].sum()))
+
+	def __len__(self):
+		return(int(self.Control[:,self.CountColumn:self.CountColumn+self.NumTypes].sum()))
+
+class FoodTotals:
+	def __init__(self,Control):
+		self.Control=Control
+
+	def PercentCover(self):
+		return(100.0*int(self.Control[:,FULL_CELLS].sum())/int(self.Control[:,NUM_CELLS].sum()))
+
+#################################################################
+# The class definition for the world in the main process
+#################################################################
+
+class ParallelWorld:
+	#################################################################
+	# Initialize the new object and start the worker processes
+	# Inputs:
+	#  Model - the Model module (see Scenario.Load)
+	#  NumParts - number of worker processes (strips of the world)
+	#  Seed,NumAnimals,Width,Height,CellSize - see Scenario.CreateWorld
+	#  ShareFrames - True to have each part write a frame after each cycle
+	#   that other processes can read with a
+	#   Frames.FrameReader(TheWorld.FrameHandles), "animals" to leave
+	#   the Food out of the frames
+	#################################################################
+	def __init__(self,Model,NumParts,Seed=None,NumAnimals=None,Width=None,Height=None,CellSize=None,ShareFrames=False):
+		if Width==None: Width=Model.WORLD_WIDTH
+		if Height==None: Height=Model.WORLD_HEIGHT
+		if CellSize==None: CellSize=Model.CELL_SIZE
+
+		Species=[TheSpecies for TheSpecies,Number,Ammo in Model.StartingAnimals()]
+		Halo=HaloWidth(Species)
+		if min(numpy.diff(StripEdges(NumParts,Width,CellSize)))<Halo:
+			raise ValueError("The world is too narrow for "+format(NumParts)+" parts, each part must be at least "+
+				format(Halo)+" pixels wide")
+
+		self.Width=Width
+		self.Height=Height
+		self.Random=RandomStreams.RandomStreams(Seed) # only used for the Seed, the parts have their own
+		self.Cycle=0
+		self.Events={}
+		self.Profiler=None # times each cycle if it is set (see Profiler.py)
+		self.Observers=[]
+
+		NumTypes=max([TheSpecies.Type for TheSpecies in Species])+1
+		NumColumns=CountColumn(NumTypes,True)+NumTypes
+		self.Prefix="ABM"+format(os.getpid())+"_"+os.urandom(4).hex()
+		self.ControlMemory=multiprocessing.shared_memory.SharedMemory(self.Prefix,True,NumParts*NumColumns*8)
+		self.Control=numpy.ndarray((NumParts,NumColumns),numpy.float64,self.ControlMemory.buf)
+		self.Control[:]=0
+		self.TheAnimals=AnimalTotals(self.Control,NumTypes)
+		self.TheFood=FoodTotals(self.Control)
+
+		# the handle for the frames of each part (made here so they can be given to the
+		# processes that read the frames)
+		self.FrameHandles=None
+		if ShareFrames:
+			NumRows=int(math.ceil(Height/float(CellSize)))
+			self.FrameHandles=[]
+			for Number in range(NumParts):
+				Column=FirstColumn(Number,NumParts,Width,CellSize)
+				self.FrameHandles.append(Frames.FrameHandle(Width,Height,CellSize,NumRows,
+					FirstColumn(Number+1,NumParts,Width,CellSize)-Column,Column,ShareFrames!="animals"))
+
+		TheBarrier=multiprocessing.Barrier(NumParts)
+		ModelFolder=os.path.dirname(os.path.abspath(Model.__file__))
+		self.Workers=[]
+		try:
+			for Number in range(NumParts):
+				Connection,WorkerConnection=multiprocessing.Pipe()
+				Process=multiprocessing.Process(target=Worker,args=(WorkerConnection,ModelFolder,ModelConstants(Model),
+					Number,NumParts,self.Random.Seed,NumAnimals,Width,Height,CellSize,self.Prefix,NumColumns,TheBarrier,
+					self.FrameHandles[Number] if self.FrameHandles!=None else None))
+				Process.daemon=True
+				Process.start()
+				WorkerConnection.close() # so we see the end of the pipe if the worker dies
+				self.Workers.append((Process,Connection))
+			self.Wait()
+		except:
+			self.Close()
+			raise
+
+	#################################################################
+	# Private function to wait for every worker to finish what it was
+	# told to do, and raise an error if any of them failed
+	#################################################################
+	def Wait(self):
+		Errors=[]
+		for Process,Connection in self.Workers:
+			try:
+				Error=Connection.recv()
+			except EOFError:
+				Error="The worker process died"
+			if Error!=None: Errors.append(Error)
+		if len(Errors)>0:
+			# the parts that were waiting for the one that failed just say the Barrier was broken
+			Errors.sort(key=lambda Error:"BrokenBarrierError" in Error)
+			raise RuntimeError("A part of the world failed:\n"+Errors[0])
+
+	#################################################################
+	# Add an observer to the world (see World.AddObserver)
+	#################################################################
+	def AddObserver(self,TheObserver):
+		self.Observers.append(TheObserver)
+		TheObserver.Update(self) # let the observer see the starting state
+
+	def RemoveObserver(self,TheObserver):
+		self.Observers.remove(TheObserver)
+
+	#################################################################
+	# Run one cycle of the model in all of the parts and tell the
+	# observers that it is done
+	#################################################################
+	def Update(self):
+		Profiler=self.Profiler
+		if Profiler!=None: StartTime=Profiler.Clock()
+		for Process,Connection in self.Workers: Connection.send(True)
+		self.Wait()
+		if Profiler!=None: Profiler.Add("Animals",StartTime)
+
+		self.Cycle=int(self.Control[0,CYCLE])
+		self.Events={}
+		for Index,Name in enumerate(EVENT_NAMES):
+			Count=int(self.Control[:,FIRST_EVENT+Index].sum())
+			if Count>0: self.Events[Name]=Count
+
+		if Profiler!=None: StartTime=Profiler.Clock()
+		for TheObserver in self.Observers:
+			TheObserver.Update(self)
+		if Profiler!=None:
+			Profiler.Add("Observers",StartTime)
+			Profiler.EndCycle(self.Cycle)
+
+	#################################################################
+	# Stop the worker processes and free the shared memory
+	#################################################################
+	def Close(self):
+		for Process,Connection in self.Workers:
+			try:
+				Connection.send(None)
+			except (IOError,OSError):
+				pass
+		for Process,Connection in self.Workers:
+			Process.join()
+			Connection.close()
+		self.Workers=[]
+		if self.ControlMemory!=None:
+			self.TheAnimals.Control=None
+			self.TheFood.Control=None
+			self.Control=None
+			self.ControlMemory.close()
+			self.ControlMemory.unlink()
+			self.ControlMemory=None
@@ -0,0 +1,119 @@
+#################################################################
+# Records where the time goes in each cycle of the model.
+#
+# A Profiler is turned on by putting it in TheWorld.Profiler (it is
+# None by default).  The world and the animals then time each phase
+# of a cycle and count how many times it was run and how many pairs
+# of animals it looked at (AnimalArrays only counts the pairs that
+# were close enough, as it finds them all at once):
+#  Index - rebuilding the spatial grid
+#  Veg - Food/Ammo growing back (Veg.Update)
+#  Animals - updating all of the animals, which is made up of:
+#   Shoot - looking for animals to shoot (HUMANS)
+#   Eat - looking for animals to eat (wolves, ZOMBIES)
+#   Forage - eating Food and picking up Ammo (sheep, HUMANS)
+#   Move - chasing, fleeing and random steps
+#  BirthsDeaths - adding and removing animals at the end of the cycle
+#  Observers - the display, statistics and checkpoints
+#  Redraw - Tkinter drawing a frame in the window (Test.py, which
+#   times it with its own Profiler as the model runs in another
+#   process)
+#
+# When there is no Profiler the model only checks that
+# TheWorld.Profiler is None, so it runs at full speed.
+#
+# The totals for the whole run are in Times, Calls and Pairs, and
+# Summary() gives them as a table.  If a TraceFile is given, the
+# totals for each cycle are also written to it as CSV rows:
+#  Cycle,Phase,Seconds,Calls,Pairs
+#################################################################
+
+import csv
+import time
+
+#################################################################
+# Global values for the class
+#################################################################
+
+# time.perf_counter is the most precise clock but is not in older Pythons
+if hasattr(time,"perf_counter"): Clock=time.perf_counter
+else: Clock=time.time
+
+#################################################################
+# The class definition
+#################################################################
+
+class Profiler:
+	#################################################################
+	# Initialize the new object
+	# Inputs:
+	#  TraceFile - CSV file to write the totals for each cycle to
+	#   (None for no file)
+	#################################################################
+	def __init__(self,TraceFile=None):
+		self.Clock=Clock
+
+		self.Times={} # seconds spent in each phase
+		self.Calls={} # number of times each phase was run
+		self.Pairs={} # number of pairs of animals each phase looked at
+		self.NumCycles=0
+
+		self.CycleTimes={} # the same for the cycle that is being run
+		self.CycleCalls={}
+		self.CyclePairs={}
+
+		self.TheFile=None
+		if TraceFile!=None:
+			self.TheFile=open(TraceFile,"w")
+			self.Writer=csv.writer(self.TheFile,lineterminator="\n")
+			self.Writer.writerow(["Cycle","Phase","Seconds","Calls","Pairs"])
+
+	#################################################################
+	# Add one run of a phase
+	# Inputs:
+	#  Phase - the name of the phase
+	#  StartTime - the value of Clock() when the phase started
+	#  Pairs - number of pairs of animals the phase looked at
+	#################################################################
+	def Add(self,Phase,StartTime,Pairs=0):
+		self.CycleTimes[Phase]=self.CycleTimes.get(Phase,0.0)+self.Clock()-StartTime
+		self.CycleCalls[Phase]=self.CycleCalls.get(Phase,0)+1
+		if Pairs>0: self.CyclePairs[Phase]=self.CyclePairs.get(Phase,0)+Pairs
+
+	#################################################################
+	# Add the phases of the cycle that has finished to the totals (and
+	# the trace file).  Called by the world at the end of each cycle.
+	#################################################################
+	def EndCycle(self,Cycle):
+		for Phase,Seconds in self.CycleTimes.items():
+			Calls=self.CycleCalls[Phase]
+			Pairs=self.CyclePairs.get(Phase,0)
+			self.Times[Phase]=self.Times.get(Phase,0.0)+Seconds
+			self.Calls[Phase]=self.Calls.get(Phase,0)+Calls
+			self.Pairs[Phase]=self.Pairs.get(Phase,0)+Pairs
+			if self.TheFile!=None: self.Writer.writerow([Cycle,Phase,Seconds,Calls,Pairs])
+		self.NumCycles=self.NumCycles+1
+		self.CycleTimes={}
+		self.CycleCalls={}
+		self.CyclePairs={}
+
+	#################################################################
+	# Get the totals for the run as a table (one line per phase, the
+	# slowest first)
+	#################################################################
+	def Summary(self):
+		Lines=["Phase".ljust(14)+"Seconds".rjust(10)+"Per cycle".rjust(12)+"Calls".rjust(12)+"Pairs".rjust(15)]
+		for Phase in sorted(self.Times.keys(),key=lambda Phase:-self.Times[Phase]):
+			PerCycle=self.Times[Phase]/max(1,self.NumCycles)
+			Lines.append(Phase.ljust(14)+format(self.Times[Phase],".3f").rjust(10)+format(PerCycle,".6f").rjust(12)+
+				format(self.Calls[Phase]).rjust(12)+format(self.Pairs[Phase]).rjust(15))
+		Lines.append(format(self.NumCycles)+" cycles")
+		return("\n".join(Lines))
+
+	#################################################################
+	# Close the trace file
+	#################################################################
+	def Close(self):
+		if self.TheFile!=None:
+			self.TheFile.close()
+			self.TheFile=None
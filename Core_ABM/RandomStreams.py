@@ -0,0 +1,114 @@
+#################################################################
+# The random numbers for one run of the model.
+#
+# Instead of everything drawing from Python's global "random"
+# module, each run has one RandomStreams object made from one
+# master seed.  It is split into independent streams, one for each
+# part of the model (STREAM_NAMES), so:
+# - the same seed always gives the same run, even when many runs
+#   are going at the same time in different processes
+# - changing how one part of the model uses random numbers (e.g.
+#   movement) does not change the numbers any other part gets
+#
+# Each stream can be used as a Python random.Random (for code that
+# draws one number at a time) or a NumPy Generator (for code that
+# draws arrays of numbers).  A part of the model should only use
+# one of the two for its stream.
+#
+# When the world is split between processes (see Parallel.py) each
+# part of the world gets its own RandomStreams from the same seed
+# with its number as Part, so the parts draw different numbers but
+# the run can still be repeated.
+#################################################################
+
+import random
+import numpy
+
+#################################################################
+# Global values for the class
+#################################################################
+
+# The streams, in the order they are split from the master seed.
+# New streams must be added at the end so the others do not change.
+STREAM_NAMES=(
+	"Setup", # starting locations of the animals
+	"Movement", # random steps of the animals
+	"Births", # anything random about new animals (nothing yet)
+	"Regrow", # starting cover and regrow times of the Food
+	"Ammo", # whether a cell that grows is Food or Ammo
+)
+
+#################################################################
+# The class definition
+#################################################################
+
+class RandomStreams:
+	#################################################################
+	# Initialize the new object
+	# Inputs:
+	#  Seed - master seed for the run (None to pick one; the seed
+	#   that was picked is saved in Seed so the run can be repeated)
+	#  Part - number of the part of the world the streams are for
+	#   (None for the whole world)
+	#################################################################
+	def __init__(self,Seed=None,Part=None):
+		SpawnKey=()
+		if Part!=None: SpawnKey=(Part,)
+		Sequence=numpy.random.SeedSequence(Seed,spawn_key=SpawnKey)
+		self.Seed=Sequence.entropy
+		self.Part=Part
+
+		self.Sequences={} # the seed sequence for each stream
+		for Name,Child in zip(STREAM_NAMES,Sequence.spawn(len(STREAM_NAMES))):
+			self.Sequences[Name]=Child
+
+		self.PythonStreams={}
+		self.NumPyStreams={}
+
+	#################################################################
+	# Get a stream as a Python random.Random
+	#################################################################
+	def Python(self,Name):
+		Stream=self.PythonStreams.get(Name)
+		if Stream==None:
+			State=self.Sequences[Name].generate_state(8) # 256 bits for the seed
+			Stream=random.Random(int.from_bytes(State.tobytes(),"little"))
+			self.PythonStreams[Name]=Stream
+		return(Stream)
+
+	#################################################################
+	# Get a stream as a NumPy Generator
+	#################################################################
+	def NumPy(self,Name):
+		Stream=self.NumPyStreams.get(Name)
+		if Stream is None:
+			Stream=numpy.random.Generator(numpy.random.PCG64(self.Sequences[Name]))
+			self.NumPyStreams[Name]=Stream
+		return(Stream)
+
+	#################################################################
+	# Get the state of every stream that has been used, so the run
+	# can be saved and carried on later (see Checkpoint.py)
+	# Output:
+	#  dictionary with the Seed and the state of each stream (only
+	#  lists, numbers and strings so it can be saved as JSON)
+	#################################################################
+	def GetState(self):
+		State={"Seed":self.Seed,"Python":{},"NumPy":{}}
+		for Name,Stream in self.PythonStreams.items():
+			Version,Internal,GaussNext=Stream.getstate()
+			State["Python"][Name]=[Version,list(Internal),GaussNext]
+		for Name,Stream in self.NumPyStreams.items():
+			State["NumPy"][Name]=Stream.bit_generator.state
+		return(State)
+
+	#################################################################
+	# Put the streams back the way they were when GetState() was
+	# called.  The RandomStreams must have been made with the same Seed.
+	#################################################################
+	def SetState(self,State):
+		if State["Seed"]!=self.Seed: raise ValueError("The random number state is for a different seed")
+		for Name,(Version,Internal,GaussNext) in State["Python"].items():
+			self.Python(Name).setstate((Version,tuple(Internal),GaussNext))
+		for Name,BitState in State["NumPy"].items():
+			self.NumPy(Name).bit_generator.state=BitState
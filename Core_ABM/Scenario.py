@@ -0,0 +1,202 @@
+#################################################################
+# Loads a model and creates its world.
+#
+# Every model uses the same engine (the modules in this folder).
+# A model is a folder with a Model.py in it (e.g. Original_ABM for
+# the sheep and wolves, Zombie_ABM for the HUMAN and ZOMBIES) that
+# sets up the Species and their rules and has these model constants
+# and functions:
+#  NAME - name of the model (e.g. "HUMAN/ZOMBIE")
+#  WORLD_WIDTH, WORLD_HEIGHT - size of the world in pixels
+#  CELL_SIZE - width and height of each cell of Food in pixels
+#  USE_TILES - True to keep the Food in tiles that are only created
+#   when they are used (see TiledVeg.py), for very large worlds
+#  MAX_TILES, SPILL_PATH - number of tiles to keep in memory (None
+#   for all of them) and the folder for the rest
+#  PERCENT_GRASS_COVER - starting cover of Food
+#  GRASS_REGROW_CYCLES - number of cycles for Food to regrow
+#  AMMO_CHANCE - 1 in AMMO_CHANCE cells that grow are Ammo (0 for none)
+#  USE_SPATIAL_GRID - True to keep the animals in a spatial grid
+#  BATCH_HUNTING - True for the AnimalClass objects to shoot, eat and
+#   infect all at once (see AnimalStore.py)
+#  USE_ARRAYS - True to keep the animals in NumPy arrays
+#  USE_NUMBA - True to use the compiled loops in Kernels.py if Numba
+#   is installed
+#  NUM_WORKERS - number of processes to split the world between
+#   (see Parallel.py), 1 to run it in one process
+#  PRINT_EVENTS - True to print deaths, shootings and infections
+#  STATS_FILE, CHECKPOINT_PATH, CHECKPOINT_EVERY, PROFILE,
+#   PROFILE_FILE - see Headless.py
+#  PARAMETER_GRID - the values to run for each constant in Batch.py
+#  COUNT_NAMES - names of the values from CountAnimals()
+#  CreateSpecies() - the Species, with their rules (see Animal.py)
+#  StartingAnimals() - list of (Species,Number,Ammo) for the
+#   animals the world starts with
+#  CountAnimals(TheWorld) - number of each type of animal
+#  Statistics(TheWorld) - list of (Name,Value) for the last cycle
+#   (see Stats.py)
+#
+# The scripts in this folder (Test.py, Headless.py, Batch.py and
+# Benchmark.py) are given the model folder on the command line, e.g.
+#  python Core_ABM/Headless.py Zombie_ABM 1000
+#################################################################
+
+import math
+import os
+import sys
+
+import Animal
+import Kernels
+import RandomStreams
+import TiledVeg
+import Veg
+import World
+
+#################################################################
+# Global values
+#################################################################
+
+# the folder the model folders are in (the one above this folder)
+ROOT_PATH=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+#################################################################
+# Load the Model.py of a model folder
+# Inputs:
+#  Folder - the model folder (as a path, or the name of a folder
+#   next to this one)
+# Output:
+#  the Model module
+#################################################################
+
+def Load(Folder):
+	if not os.path.isfile(os.path.join(Folder,"Model.py")): Folder=os.path.join(ROOT_PATH,Folder)
+	if not os.path.isfile(os.path.join(Folder,"Model.py")): raise ValueError("There is no Model.py in "+Folder)
+	Folder=os.path.abspath(Folder)
+
+	Model=sys.modules.get("Model")
+	if Model!=None: # only one model can be loaded in a process
+		if os.path.dirname(os.path.abspath(Model.__file__))!=Folder:
+			raise ValueError("A different model is already loaded from "+os.path.dirname(Model.__file__))
+		return(Model)
+
+	sys.path.insert(0,Folder)
+	import Model
+	return(Model)
+
+#################################################################
+# Private function to split a number of animals between the types
+# of animal in the same proportions as the model starts with
+#################################################################
+
+def SplitAnimals(Starting,NumAnimals):
+	Total=float(sum([Number for TheSpecies,Number,Ammo in Starting]))
+	Result=[]
+	Left=NumAnimals
+	for Index,(TheSpecies,Number,Ammo) in enumerate(Starting):
+		if Index==len(Starting)-1: Number=Left
+		else: Number=int(round(NumAnimals*Number/Total))
+		Left=Left-Number
+		Result.append((TheSpecies,Number,Ammo))
+	return(Result)
+
+#################################################################
+# Create the world with the grass and animals in it
+# Inputs:
+#  Model - the Model module (see Load)
+#  Seed - master seed for the random numbers, so a run can be
+#   repeated (None for a random seed, see TheWorld.Random.Seed)
+#  NumAnimals - number of animals to start with, split between the
+#   types in the same proportions as the model (None for the
+#   numbers in the model)
+#  Width,Height - size of the world in pixels (None for
+#   Model.WORLD_WIDTH and Model.WORLD_HEIGHT)
+#  CellSize - width and height of each cell of Food in pixels (None
+#   for Model.CELL_SIZE)
+#################################################################
+
+def CreateWorld(Model,Seed=None,NumAnimals=None,Width=None,Height=None,CellSize=None):
+	if Width==None: Width=Model.WORLD_WIDTH
+	if Height==None: Height=Model.WORLD_HEIGHT
+	if CellSize==None: CellSize=Model.CELL_SIZE
+	Kernels.USE_NUMBA=Model.USE_NUMBA
+
+	Random=RandomStreams.RandomStreams(Seed)
+	Setup=Random.Python("Setup") # random numbers for the starting locations
+
+	#Create the grid of grass, with enough cells to cover the world
+	NumRows=int(math.ceil(Height/float(CellSize)))
+	NumColumns=int(math.ceil(Width/float(CellSize)))
+	TheFood=CreateFood(Model,NumRows,NumColumns,Random,CellSize)
+
+	Starting=Model.StartingAnimals()
+	if NumAnimals!=None: Starting=SplitAnimals(Starting,NumAnimals)
+
+	if Model.USE_ARRAYS: return(CreateArrayWorld(Width,Height,TheFood,Random,Starting))
+
+	# The buckets must be at least as big as the longest distance an animal looks
+	IndexCellSize=0
+	if Model.USE_SPATIAL_GRID: IndexCellSize=max([TheSpecies.MaxDistance() for TheSpecies,Number,Ammo in Starting])
+
+	TheWorld=World.World(Width,Height,TheFood,IndexCellSize,Random)
+
+	# Add the animals of each type
+	TheAnimals=TheWorld.TheAnimals
+	TheAnimals.BatchHunting=Model.BATCH_HUNTING
+	for TheSpecies,Number,Ammo in Starting: TheAnimals.AddSpecies(TheSpecies)
+	for TheSpecies,Number,Ammo in Starting:
+		Count=0;
+		while Count<Number:
+			# Create a random location for the animal within the world
+			CenterX=Setup.uniform(0,Width)
+			CenterY=Setup.uniform(0,Height)
+
+			# Create the new animal and add it to the list of animals
+			NewAnimal=Animal.AnimalClass(TheWorld,CenterX,CenterY,TheSpecies,Ammo)
+			TheAnimals.Add(NewAnimal)
+
+			Count=Count+1
+
+	return(TheWorld)
+
+#################################################################
+# Create the grid of Food for the model (a Veg, or a TiledVeg if
+# Model.USE_TILES is set)
+# Inputs:
+#  Model - the Model module (see Load)
+#  NumRows,NumColumns - number of cells vertically and horizontally
+#  Random - the RandomStreams for the run
+#  CellSize - width and height of each cell in pixels
+#  SpillPath - folder for the tiles that do not fit in memory (None
+#   for Model.SPILL_PATH)
+#################################################################
+
+def CreateFood(Model,NumRows,NumColumns,Random,CellSize,SpillPath=None):
+	if SpillPath==None: SpillPath=Model.SPILL_PATH
+	if Model.USE_TILES:
+		return(TiledVeg.TiledVeg(Model.PERCENT_GRASS_COVER,Model.GRASS_REGROW_CYCLES,NumRows,NumColumns,Random,
+		    Model.AMMO_CHANCE,CellSize,TiledVeg.TILE_SIZE,Model.MAX_TILES,SpillPath))
+	return(Veg.Veg(Model.PERCENT_GRASS_COVER,Model.GRASS_REGROW_CYCLES,
+	    NumRows,NumColumns,Random,Model.AMMO_CHANCE,CellSize))
+
+#################################################################
+# Private function to create the world with the animals in NumPy
+# arrays
+#################################################################
+
+def CreateArrayWorld(Width,Height,TheFood,Random,Starting):
+	import AnimalArrays # only needed for this kind of world
+
+	Setup=Random.Python("Setup") # random numbers for the starting locations
+
+	TheWorld=World.World(Width,Height,TheFood,0,Random)
+
+	TheAnimals=AnimalArrays.AnimalArrays(Random)
+	for TheSpecies,Number,Ammo in Starting: TheAnimals.AddSpecies(TheSpecies)
+
+	# Add the animals of each type at random locations within the world
+	for TheSpecies,Number,Ammo in Starting:
+		TheAnimals.Add([Setup.uniform(0,Width) for Count in range(Number)],
+		    [Setup.uniform(0,Height) for Count in range(Number)],TheSpecies.Type,Ammo)
+
+	TheWorld.TheAnimals=TheAnimals
+	return(TheWorld)
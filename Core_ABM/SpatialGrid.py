@@ -0,0 +1,123 @@
+#################################################################
+# A uniform grid ("spatial hash") of the animals in the world.
+#
+# The world is cut into square buckets that are at least as big as
+# the largest interaction distance (shoot, eat, chase or run).  Any
+# animal that is close enough to interact with an animal at (X,Y)
+# must then be in the bucket that (X,Y) is in or in one of the 8
+# buckets around it, so an animal only has to look at those 9
+# buckets instead of every animal in the world.
+#
+# The grid is rebuilt at the start of each cycle (World.Update) and
+# kept up to date during the cycle as animals move, are born and
+# are removed.  Distances in the model are not measured across the
+# edges of the world, so the buckets do not wrap around either.
+#
+# The grid is only an index: the animals look at the same animals,
+# in the same order (see AnimalClass.Neighbors), and take the same
+# random steps as without it, so the results are the same.  An
+# animal that takes a step for every animal of another type (see
+# AnimalClass.Move) still looks at all of them.
+#################################################################
+
+import math
+
+#################################################################
+# The class definition
+#################################################################
+
+class SpatialGrid:
+	#################################################################
+	# Initialize the new object
+	# Inputs:
+	#  Width - horizontal size of the world in pixels
+	#  Height - vertical size of the world in pixels
+	#  CellSize - size of each bucket, must be >= the largest
+	#   distance that is used in a query
+	#################################################################
+	def __init__(self,Width,Height,CellSize):
+		self.CellSize=float(CellSize)
+		self.NumColumns=max(1,int(math.ceil(Width/self.CellSize)))
+		self.NumRows=max(1,int(math.ceil(Height/self.CellSize)))
+
+		self.Buckets={} # list of animals for each (Column,Row)
+		self.Keys={} # the (Column,Row) each animal is in
+		self.Counts={} # number of animals of each Type
+
+	#################################################################
+	# Private function to find the bucket for a location
+	#################################################################
+	def Key(self,X,Y):
+		Column=int(X/self.CellSize)
+		Row=int(Y/self.CellSize)
+		# keep animals that are right on the edge of the world in the grid
+		if Column<0: Column=0
+		if Column>=self.NumColumns: Column=self.NumColumns-1
+		if Row<0: Row=0
+		if Row>=self.NumRows: Row=self.NumRows-1
+		return((Column,Row))
+
+	#################################################################
+	# Throw away the buckets and put all of the animals back in
+	#################################################################
+	def Rebuild(self,TheAnimals):
+		self.Buckets={}
+		self.Keys={}
+		self.Counts={}
+		for TheAnimal in TheAnimals:
+			self.Add(TheAnimal)
+
+	def Add(self,TheAnimal):
+		Key=self.Key(TheAnimal.CenterX,TheAnimal.CenterY)
+		Bucket=self.Buckets.get(Key)
+		if Bucket==None:
+			Bucket=[]
+			self.Buckets[Key]=Bucket
+		Bucket.append(TheAnimal)
+		self.Keys[TheAnimal]=Key
+		self.Counts[TheAnimal.Type]=self.Counts.get(TheAnimal.Type,0)+1
+
+	def Remove(self,TheAnimal):
+		Key=self.Keys.pop(TheAnimal)
+		self.Buckets[Key].remove(TheAnimal)
+		self.Counts[TheAnimal.Type]=self.Counts[TheAnimal.Type]-1
+
+	#################################################################
+	# Move an animal to a new bucket if it has left its old one.
+	# Must be called after an animal's CenterX or CenterY changes.
+	#################################################################
+	def Move(self,TheAnimal):
+		Key=self.Key(TheAnimal.CenterX,TheAnimal.CenterY)
+		OldKey=self.Keys[TheAnimal]
+		if Key!=OldKey:
+			self.Buckets[OldKey].remove(TheAnimal)
+			Bucket=self.Buckets.get(Key)
+			if Bucket==None:
+				Bucket=[]
+				self.Buckets[Key]=Bucket
+			Bucket.append(TheAnimal)
+			self.Keys[TheAnimal]=Key
+
+	#################################################################
+	# Get the animals that may be within CellSize of a location
+	# Inputs:
+	#   X - Horizontal location in pixels
+	#   Y - vertical location in pixels
+	# Output:
+	#   a new list with the animals in the 9 buckets around (X,Y).
+	#   Callers still have to check the distance to each animal.
+	#################################################################
+	def Near(self,X,Y):
+		Column,Row=self.Key(X,Y)
+		Result=[]
+		for TheRow in (Row-1,Row,Row+1):
+			for TheColumn in (Column-1,Column,Column+1):
+				Bucket=self.Buckets.get((TheColumn,TheRow))
+				if Bucket: Result.extend(Bucket)
+		return(Result)
+
+	#################################################################
+	# Number of animals of a Type that are in the grid
+	#################################################################
+	def Count(self,Type):
+		return(self.Counts.get(Type,0))
@@ -0,0 +1,77 @@
+#################################################################
+# Writes the statistics for every cycle of a run to a CSV file.
+#
+# The writer is an observer of the world (see World.AddObserver),
+# so it is called at the end of every cycle.  It gets the
+# statistics for the cycle from the Statistics() function of the
+# model (e.g. the number of each type of animal, the births, deaths,
+# infections and shots in the cycle, the Ammo the animals are
+# carrying and the Food cover).
+# These are kept up to date by the model as things happen, so
+# nothing has to look at every animal to find them.
+#
+# The values are kept in one list for each column and written to
+# the file ChunkSize cycles at a time, so a long run can be looked
+# at while it is going without the file being written every cycle.
+# Close() must be called at the end of the run to write the last
+# chunk.
+#################################################################
+
+import csv
+
+#################################################################
+# Global values for the class
+#################################################################
+
+CHUNK_SIZE=100 # number of cycles to keep before writing them to the file
+
+#################################################################
+# The class definition
+#################################################################
+
+class StatsWriter:
+	#################################################################
+	# Initialize the new object
+	# Inputs:
+	#  FileName - the CSV file to write (replaced if it is there)
+	#  Statistics - function that gets the list of (Name,Value) for
+	#   the cycle from the world (Model.Statistics)
+	#  ChunkSize - number of cycles to keep before writing them
+	#################################################################
+	def __init__(self,FileName,Statistics,ChunkSize=CHUNK_SIZE):
+		self.Statistics=Statistics
+		self.ChunkSize=ChunkSize
+		self.TheFile=open(FileName,"w")
+		self.Writer=csv.writer(self.TheFile,lineterminator="\n")
+
+		self.Names=None # the names of the columns (from the first cycle)
+		self.Columns=None # list of values for each column that have not been written
+
+	#################################################################
+	# Add the statistics for the cycle that just finished
+	#################################################################
+	def Update(self,TheWorld):
+		Row=self.Statistics(TheWorld)
+		if self.Names==None:
+			self.Names=[Name for Name,Value in Row]
+			self.Columns=[[] for Name in self.Names]
+			self.Writer.writerow(self.Names)
+		for Column,(Name,Value) in zip(self.Columns,Row):
+			Column.append(Value)
+		if len(self.Columns[0])>=self.ChunkSize: self.Flush()
+
+	#################################################################
+	# Write the cycles that have not been written to the file
+	#################################################################
+	def Flush(self):
+		if self.Columns==None: return
+		self.Writer.writerows(zip(*self.Columns))
+		self.TheFile.flush()
+		for Column in self.Columns: del Column[:]
+
+	#################################################################
+	# Write the last cycles and close the file
+	#################################################################
+	def Close(self):
+		self.Flush()
+		self.TheFile.close()
@@ -0,0 +1,216 @@
+#################################################################
+# The simplest possible Spatially-Explicit-Individually Based Model (SEIBM)
+# This file and its associated modules (Animal.py and Veg.py) run a
+# model in a window.  The model (the grass, the animals and the rules
+# they follow) is set up by the Model.py in a model folder, e.g.
+# Original_ABM for the sheep and wolves or Zombie_ABM for the HUMAN
+# and ZOMBIES (see Scenario.py).
+#
+# Usage: python Test.py ModelFolder
+#  e.g. python Core_ABM/Test.py Zombie_ABM
+#
+# The model runs in its own process (see RunModel) as fast as it
+# can, and copies a frame of the world into shared memory at the
+# end of every cycle (see Frames.py).  The window (see Viewer) draws
+# the newest frame FRAMES_PER_SECOND times a second from a Tkinter
+# timer, and the frames that were written in between are never
+# drawn, so a slow cycle does not freeze the window and a slow
+# redraw does not hold up the model.
+#
+# The number of each type of animal is printed on every cycle.  To
+# run the model without a window use Headless.py.
+#
+# Author: Jim Graham
+# Modified by: Melissa Kimble
+# Modification Date: 4/21/2015
+#################################################################
+
+# Import standard Python libraries
+from tkinter import * # import the GUI library (windows and UI controls)
+import math
+import multiprocessing
+import sys
+
+# Import our custom modules
+import Animal # module with the class to create the animals
+import Display # module to draw the world on a canvas
+import Frames # module to share frames of the model with other processes
+import Stats # module to write the statistics for each cycle to a file
+import Profiler # module to time the phases of each cycle
+import Scenario # module to load a model and create its world
+
+#################################################################
+# Global values
+#################################################################
+
+FRAMES_PER_SECOND=30 # number of times a second the window is redrawn
+START_WAIT=0.1 # seconds to wait at a time for the model to write its first frame
+
+#################################################################
+# Run the model until it is stopped.  This is run in its own
+# process.
+# Inputs:
+#  ModelFolder - the model folder (see Scenario.Load)
+#  Handle - FrameHandle to write a frame into after each cycle
+#  Started - Event that is set when the first frame has been written
+#  Stop - Event that is set to stop the model
+#################################################################
+
+def RunModel(ModelFolder,Handle,Started,Stop):
+	Model=Scenario.Load(ModelFolder)
+	Animal.PRINT_EVENTS=Model.PRINT_EVENTS
+
+	# Create the grass and the animals
+	TheWorld=Scenario.CreateWorld(Model)
+
+	# Write a frame of the world for the window at the end of every cycle (adding
+	# the observer writes the world before the first cycle)
+	Writer=Frames.FrameWriter(Handle)
+	TheWorld.AddObserver(Writer)
+
+	# Write the statistics for each cycle to a file
+	TheStats=None
+	if Model.STATS_FILE!=None:
+		TheStats=Stats.StatsWriter(Model.STATS_FILE,Model.Statistics)
+		TheWorld.AddObserver(TheStats)
+
+	# Time each phase of the cycles (the summary is printed when the window is closed)
+	if Model.PROFILE: TheWorld.Profiler=Profiler.Profiler(Model.PROFILE_FILE)
+
+	try:
+		Started.set()
+		while not Stop.is_set():
+			# Update the grass and the animals (grows back, repoduce, feed, die)
+			TheWorld.Update()
+
+			# find the statistics
+			print(",".join([format(Value) for Value in Model.CountAnimals(TheWorld)]))
+	except KeyboardInterrupt:
+		pass
+	finally:
+		Writer.Close()
+		if TheStats!=None: TheStats.Close()
+		if TheWorld.Profiler!=None:
+			TheWorld.Profiler.Close()
+			print(TheWorld.Profiler.Summary())
+
+#################################################################
+# The window.  Draws the newest frame from the model on a timer
+# (see Tk.after) and stops the model when the window is closed.
+#################################################################
+
+class Viewer:
+	#################################################################
+	# Initialize the new object and start the timer
+	# Inputs:
+	#  MasterWindow - the Tk window
+	#  TheCanvas - the canvas to draw the world in
+	#  Handle - the FrameHandle the model writes into
+	#  Colors - fill color for each Type of animal
+	#  Worker - the Process the model runs in
+	#  Stop - Event to set to stop the model
+	#  FramesPerSecond - number of times a second to redraw
+	#  TheProfiler - Profiler to time the redraws with (None to not
+	#   time them)
+	#################################################################
+	def __init__(self,MasterWindow,TheCanvas,Handle,Colors,Worker,Stop,FramesPerSecond=FRAMES_PER_SECOND,
+		TheProfiler=None):
+		self.MasterWindow=MasterWindow
+		self.Handle=Handle
+		self.Worker=Worker
+		self.Stop=Stop
+		self.Delay=1.0/FramesPerSecond # seconds between redraws
+		self.Profiler=TheProfiler
+
+		self.Reader=Frames.FrameReader(Handle)
+		self.TheDisplay=Display.CanvasDisplay(TheCanvas,1,Colors)
+		self.LastCycle=-1 # the cycle that is on the screen
+		self.NumDrawn=0 # number of frames that have been drawn
+
+		MasterWindow.protocol("WM_DELETE_WINDOW",self.Close)
+		self.Timer=MasterWindow.after(0,self.Redraw)
+
+	#################################################################
+	# Private function to draw the newest frame (if there is a new
+	# one) and set the timer for the next one.  The time the drawing
+	# took is taken off of the wait, so the window is redrawn
+	# FramesPerSecond times a second if it can be.
+	#################################################################
+	def Redraw(self):
+		StartTime=Profiler.Clock()
+		TheFrame=self.Reader.Acquire(self.LastCycle)
+		if TheFrame!=None:
+			try:
+				self.TheDisplay.DrawFrame(TheFrame,self.Handle.CellSize)
+			finally:
+				self.Reader.Release(TheFrame)
+			self.MasterWindow.update_idletasks() # redraw
+			self.LastCycle=TheFrame.Cycle
+			self.NumDrawn=self.NumDrawn+1
+			if self.Profiler!=None:
+				self.Profiler.Add("Redraw",StartTime)
+				self.Profiler.EndCycle(self.LastCycle)
+		self.Timer=None
+		if not self.Worker.is_alive(): return # the model has stopped (the error has been printed)
+		Wait=self.Delay-(Profiler.Clock()-StartTime)
+		self.Timer=self.MasterWindow.after(max(1,int(round(1000*Wait))),self.Redraw)
+
+	#################################################################
+	# Stop the model and close the window
+	#################################################################
+	def Close(self):
+		if self.Timer!=None: self.MasterWindow.after_cancel(self.Timer)
+		self.Timer=None
+		self.Stop.set()
+		self.Reader.Close()
+		self.Worker.join()
+		self.MasterWindow.destroy()
+
+#################################################################
+# Main
+#################################################################
+
+if __name__=="__main__":
+	if len(sys.argv)<2:
+		print("Usage: python Test.py ModelFolder")
+		sys.exit(1)
+	Model=Scenario.Load(sys.argv[1])
+
+	# Setup the GUI with a modeless window
+	MasterWindow = Tk()
+	MasterWindow.title("SEIBM "+Model.NAME)
+	MasterWindow.resizable(0, 0)
+
+	# Create the TheCanvas widget for the blobs to move in
+	TheCanvas = Canvas(MasterWindow, width=Model.WORLD_WIDTH, height=Model.WORLD_HEIGHT, bd=0, highlightthickness=0)
+	TheCanvas.pack() # fit the window to its contents
+
+	# This is required to have the objects be correctly positioned in the window
+	MasterWindow.update() # fix geometry
+
+	# Start the model in its own process, and wait for its first frame
+	NumRows=int(math.ceil(Model.WORLD_HEIGHT/float(Model.CELL_SIZE)))
+	NumColumns=int(math.ceil(Model.WORLD_WIDTH/float(Model.CELL_SIZE)))
+	Handle=Frames.FrameHandle(Model.WORLD_WIDTH,Model.WORLD_HEIGHT,Model.CELL_SIZE,NumRows,NumColumns)
+	Started=multiprocessing.Event()
+	Stop=multiprocessing.Event()
+	Worker=multiprocessing.Process(target=RunModel,args=(sys.argv[1],Handle,Started,Stop))
+	Worker.start()
+	while not Started.wait(START_WAIT):
+		if not Worker.is_alive(): sys.exit(1) # the model could not be started (the error has been printed)
+
+	# Time the redraws (the summary is printed when the window is closed)
+	TheProfiler=None
+	if Model.PROFILE: TheProfiler=Profiler.Profiler()
+
+	Colors={}
+	for TheSpecies,Number,Ammo in Model.StartingAnimals(): Colors[TheSpecies.Type]=TheSpecies.FillColor
+	TheViewer=Viewer(MasterWindow,TheCanvas,Handle,Colors,Worker,Stop,FRAMES_PER_SECOND,TheProfiler)
+
+	try:
+		MasterWindow.mainloop()
+	except KeyboardInterrupt:
+		TheViewer.Close()
+
+	print("Drew "+format(TheViewer.NumDrawn)+" of "+format(TheViewer.LastCycle+1)+" frames")
+	if TheProfiler!=None: print(TheProfiler.Summary())
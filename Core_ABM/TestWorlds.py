@@ -0,0 +1,83 @@
+#################################################################
+# What the tests (test_*.py) share: the model they run, the
+# settings for a busy world, and running a world and comparing two
+# runs of it.  The BusyWorld fixture (see conftest.py) puts these
+# settings in the model for each test and puts the model back after
+# it.
+#
+# Only one model can be loaded in a process (see Scenario.Load), so
+# all of the tests use Zombie_ABM.
+#################################################################
+
+import AnimalArrays
+import AnimalStore
+import Scenario
+
+#################################################################
+# Global values
+#################################################################
+
+Model=Scenario.Load("Zombie_ABM")
+
+# A crowded world where the HUMAN shoot, the ZOMBIES infect and the
+# animals eat the Food and pick up Ammo, so every rule is run.  The
+# options that the tests switch between runs are here too, so they
+# are put back after each test.
+BUSY={
+	"NUM_HUMAN":80,
+	"NUM_ZOMBIES":40,
+	"Ammo":1,
+	"ZOMBIE_LIFE_CYCLES":20,
+	"PERCENT_GRASS_COVER":50,
+	"AMMO_CHANCE":3,
+	"NEAREST_TARGETS":0,
+	"BATCH_HUNTING":False,
+	"USE_SPATIAL_GRID":True,
+	"USE_ARRAYS":False,
+	"USE_NUMBA":True,
+	"USE_TILES":False,
+	"MAX_TILES":None,
+	"SPILL_PATH":None,
+}
+
+#################################################################
+# Everything about a world at the end of a cycle: the counts, the
+# events, every animal and what is in every cell of the grid
+#################################################################
+
+def Snapshot(TheWorld):
+	TheAnimals=TheWorld.TheAnimals
+	if isinstance(TheAnimals,AnimalStore.AnimalStore):
+		Animals=[(TheAnimal.Id,TheAnimal.Type,TheAnimal.CenterX,TheAnimal.CenterY,TheAnimal.Ammo,
+			TheAnimal.LifeCounter,TheAnimal.BirthCounter) for TheAnimal in TheAnimals]
+	else: # the animals are in arrays
+		Animals=[getattr(TheAnimals,Name).tolist() for Name in AnimalArrays.VALUE_NAMES]
+	return((Model.CountAnimals(TheWorld),dict(TheWorld.Events),Animals,TheWorld.TheFood.AllContent().tolist()))
+
+#################################################################
+# Run a world and get a Snapshot of it after each cycle
+#################################################################
+
+def RunWorld(TheWorld,NumCycles):
+	Cycles=[]
+	for Cycle in range(NumCycles):
+		TheWorld.Update()
+		Cycles.append(Snapshot(TheWorld))
+	return(Cycles)
+
+#################################################################
+# Check that two runs are the same after every cycle
+#################################################################
+
+def AssertSameRuns(First,Second):
+	assert len(First)==len(Second)
+	for Cycle in range(len(First)):
+		assert First[Cycle]==Second[Cycle], "cycle "+format(Cycle+1)
+
+#################################################################
+# Number of animals that were shot or infected in a run (to check
+# that the animals did interact)
+#################################################################
+
+def NumKills(Cycles):
+	return(sum([Events.get("Shots",0)+Events.get("Infections",0) for Counts,Events,Animals,Food in Cycles]))
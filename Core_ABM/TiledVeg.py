@@ -0,0 +1,489 @@
+#################################################################
+# A field of Food/Ammo for very large worlds.
+#
+# TiledVeg does the same job as Veg (see Veg.py) but only stores the
+# parts of the grid that animals have used.  The grid is cut into
+# square tiles of TileSize x TileSize cells and a tile is only
+# created the first time an animal eats (or looks for Food) in it.
+# Each tile has two small arrays with one value for each cell:
+#  Content - what is in the cell (TYPE_AMMO, TYPE_FOOD or EMPTY)
+#  Regrow - for empty cells, the number of cycles until the cell
+#   regrows, counted from the last cycle the tile was brought up to
+#   date (0 when the cell is full)
+#
+# The starting state of each cell, and whether a cell that grows is
+# Food or Ammo, come from a hash of the cell and the cycle instead of
+# a stream of random numbers.  A tile that has never been used does
+# not have to be stored: its cells are worked out when they are
+# first needed, and do not depend on the order the tiles are used
+# in.  A tile is also only brought up to date when it is used, so
+# Update() does not look at the cells at all.  It only adds the
+# number of cells that regrow in each cycle to the number of full
+# cells (for PercentCover).
+#
+# Nothing is worked out for a tile until it is created, so creating
+# the grid takes the same time for any size of world.  The full
+# cells are counted exactly for the tiles that have been created.
+# The cells of the tiles that have never been used have not been
+# eaten, so each one is full at the start or has regrown since, and
+# PercentCover adds the number of them that is expected to be full
+# (see UntouchedFull).
+#
+# If MaxTiles is set, only that many tiles are kept in memory and
+# the tiles that were used least recently are moved ("spilled") to
+# memory-mapped files in SpillPath until they are used again.  Each
+# run needs its own SpillPath.
+#
+# The results are not the same as Veg for the same seed.
+#################################################################
+
+import collections
+import os
+
+import numpy
+
+import RandomStreams
+import Veg
+
+#################################################################
+# Global values for the class
+#################################################################
+
+TILE_SIZE=64 # number of cells along each side of a tile
+
+# what each hash is used for (so each use gets different numbers)
+HASH_FULL=1 # whether a cell is full at the start
+HASH_REGROW=2 # the cycle an empty cell first regrows in
+HASH_AMMO=3 # whether a cell that grows is Food or Ammo
+
+# the constants of the SplitMix64 generator, used to mix the bits of the hash
+GOLDEN=numpy.uint64(0x9E3779B97F4A7C15)
+MASK=0xFFFFFFFFFFFFFFFF # the bits of a 64 bit number
+MIX1=numpy.uint64(0xBF58476D1CE4E5B9)
+MIX2=numpy.uint64(0x94D049BB133111EB)
+
+#################################################################
+# Private function to mix the bits of an array of 64 bit values
+#################################################################
+
+def Mix(Z):
+	Z=(Z^(Z>>numpy.uint64(30)))*MIX1
+	Z=(Z^(Z>>numpy.uint64(27)))*MIX2
+	return(Z^(Z>>numpy.uint64(31)))
+
+#################################################################
+# A random looking 64 bit number for each cell and cycle
+# Inputs:
+#  Key - the key for the run (any 64 bit number)
+#  Purpose - what the numbers are for (one of the HASH_ values)
+#  Cells - index of each cell in the flattened grid (array)
+#  Cycles - the cycle for each cell (array or one value)
+# Output:
+#  array of uint64 with the same shape as Cells
+#################################################################
+
+def Hash(Key,Purpose,Cells,Cycles):
+	Start=numpy.uint64((Key^(Purpose*int(GOLDEN)))&MASK)
+	Z=Mix(numpy.asarray(Cells,dtype=numpy.uint64)*GOLDEN+Start)
+	return(Mix(Z^(numpy.asarray(Cycles,dtype=numpy.uint64)*GOLDEN)))
+
+#################################################################
+# The class definition
+#################################################################
+
+class TiledVeg:
+	#################################################################
+	# Initialize the new object
+	# Inputs:
+	#  PercentFull - how much of the Food is initially available
+	#  RegrowCycles - number of cycles until the Food is regrown after being eaten
+	#  NumRows - number of cells of Food vertically
+	#  NumColumns - number of cells of Food horizontally
+	#  Random - the RandomStreams for the run (None for a random seed)
+	#  AmmoChance - 1 in AmmoChance cells that grow will be ammo (0 for no ammo)
+	#  CellSize - width and height of each cell in pixels
+	#  TileSize - number of cells along each side of a tile
+	#  MaxTiles - number of tiles to keep in memory (None for all of them)
+	#  SpillPath - folder for the tiles that are not kept in memory
+	#################################################################
+	def __init__(self,PercentFull,RegrowCycles,NumRows,NumColumns,Random=None,AmmoChance=Veg.AMMO_CHANCE,
+		CellSize=Veg.CELL_SIZE,TileSize=TILE_SIZE,MaxTiles=None,SpillPath=None):
+		if RegrowCycles>=numpy.iinfo(numpy.int16).max: raise ValueError("RegrowCycles is too large for a tiled grid")
+		if (MaxTiles!=None) and (SpillPath==None): raise ValueError("A SpillPath is needed to limit the number of tiles")
+
+		self.PercentFull=PercentFull
+		self.RegrowCycles=RegrowCycles
+		self.AmmoChance=AmmoChance
+		self.CellSize=CellSize
+
+		self.NumRows=NumRows
+		self.NumColumns=NumColumns
+		self.TileSize=TileSize
+		self.NumTileRows=-(-NumRows//TileSize) # rounded up
+		self.NumTileColumns=-(-NumColumns//TileSize)
+
+		self.MaxTiles=MaxTiles
+		self.SpillPath=SpillPath
+
+		if Random==None: Random=RandomStreams.RandomStreams()
+		self.Key=int(Random.NumPy("Regrow").integers(0,2**63)) # the key for all of the hashes
+
+		self.Cycle=0 # number of times Update() has been called
+		self.NumFull=0 # number of cells with Food/Ammo in them in the tiles that have been created
+		self.NumUntouched=NumRows*NumColumns # number of cells in the tiles that have never been created
+
+		self.Tiles=collections.OrderedDict() # [Content,Regrow,Cycle] for each tile in memory, least recently used first
+		self.Spilled={} # the Cycle for each tile that is in the spill files
+		self.SpillContent=None # the spill files (created when the first tile is spilled)
+		self.SpillRegrow=None
+
+		# number of cells in the tiles that have been created that regrow in each of the
+		# next RegrowCycles+1 cycles
+		self.RegrowCounts=numpy.zeros(RegrowCycles+2,dtype=numpy.int64)
+
+	#################################################################
+	# Private function to find the starting state of cells
+	# Inputs:
+	#  Cells - index of each cell in the flattened grid (array)
+	# Output:
+	#  (Full,RegrowAt) arrays: whether each cell is full at the start,
+	#  and the cycle it first regrows in if it is not
+	#################################################################
+	def StartState(self,Cells):
+		Random=Hash(self.Key,HASH_FULL,Cells,0)>>numpy.uint64(11) # 53 bits
+		Full=Random.astype(numpy.float64)*(1.0/2**53)<self.PercentFull/100.0
+		if self.RegrowCycles>0:
+			RegrowAt=1+(Hash(self.Key,HASH_REGROW,Cells,0)%numpy.uint64(self.RegrowCycles)).astype(numpy.int64)
+		else:
+			RegrowAt=numpy.ones(numpy.shape(Cells),dtype=numpy.int64)
+		return(Full,RegrowAt)
+
+	#################################################################
+	# Private function to find what grows in cells
+	# Inputs:
+	#  Cells - index of each cell in the flattened grid (array)
+	#  Cycles - the cycle each cell grows in (array or one value)
+	# Output:
+	#  array with TYPE_AMMO or TYPE_FOOD for each cell
+	#################################################################
+	def GrowContent(self,Cells,Cycles):
+		if self.AmmoChance==0: return(numpy.full(numpy.shape(Cells),Veg.TYPE_FOOD,dtype=numpy.uint8))
+		IsAmmo=(Hash(self.Key,HASH_AMMO,Cells,Cycles)%numpy.uint64(self.AmmoChance))==0
+		return(numpy.where(IsAmmo,Veg.TYPE_AMMO,Veg.TYPE_FOOD).astype(numpy.uint8))
+
+	#################################################################
+	# Private function to find the cells in a tile
+	# Output:
+	#  (Cells,Inside) TileSize x TileSize arrays with the index of each
+	#  cell in the flattened grid and whether it is inside the grid
+	#  (the tiles on the right and bottom edges can stick out)
+	#################################################################
+	def TileCells(self,Tile):
+		TileRow,TileColumn=divmod(Tile,self.NumTileColumns)
+		Rows=TileRow*self.TileSize+numpy.arange(self.TileSize)
+		Columns=TileColumn*self.TileSize+numpy.arange(self.TileSize)
+		Inside=(Rows[:,None]<self.NumRows)&(Columns[None,:]<self.NumColumns)
+		Cells=Rows[:,None]*self.NumColumns+Columns[None,:]
+		return(Cells,Inside)
+
+	#################################################################
+	# Private function to create a tile that has never been used, as
+	# it is in this cycle
+	# Output:
+	#  [Content,Regrow,Cycle] for the tile
+	#################################################################
+	def NewTile(self,Tile):
+		Cells,Inside=self.TileCells(Tile)
+		Full,RegrowAt=self.StartState(Cells)
+		Grown=Inside&(Full|(RegrowAt<=self.Cycle))
+		Content=numpy.full(Cells.shape,Veg.EMPTY,dtype=numpy.uint8)
+		Content[Grown]=self.GrowContent(Cells[Grown],numpy.where(Full,0,RegrowAt)[Grown])
+		Regrow=numpy.where(Inside&~Grown,RegrowAt-self.Cycle,0).astype(numpy.int16)
+		return([Content,Regrow,self.Cycle])
+
+	#################################################################
+	# Private function to add a tile that has just been created (see
+	# NewTile) to the counts of the full cells and of the cells that
+	# regrow in each cycle
+	#################################################################
+	def CountTile(self,Tile,Info):
+		Content,Regrow,Cycle=Info
+		Cells,Inside=self.TileCells(Tile)
+		self.NumUntouched=self.NumUntouched-int(numpy.count_nonzero(Inside))
+		self.NumFull=self.NumFull+int(numpy.count_nonzero(Content!=Veg.EMPTY))
+		RegrowAt=Cycle+Regrow[Regrow>0].astype(numpy.int64)
+		self.RegrowCounts+=numpy.bincount(RegrowAt%len(self.RegrowCounts),minlength=len(self.RegrowCounts))
+
+	#################################################################
+	# Private function to bring a tile up to this cycle: the cells
+	# that have regrown since it was last used are filled
+	#################################################################
+	def CatchUp(self,Tile,Info):
+		Content,Regrow,Cycle=Info
+		Elapsed=self.Cycle-Cycle
+		Due=(Regrow>0)&(Regrow<=Elapsed)
+		if Due.any():
+			Cells,Inside=self.TileCells(Tile)
+			Content[Due]=self.GrowContent(Cells[Due],Cycle+Regrow[Due].astype(numpy.int64))
+		Info[1]=numpy.maximum(Regrow.astype(numpy.int64)-Elapsed,0).astype(numpy.int16)
+		Info[2]=self.Cycle
+
+	#################################################################
+	# Private function to get a tile to use in this cycle, creating it
+	# or reading it back from the spill files if it is not in memory
+	# Output:
+	#  [Content,Regrow,Cycle] for the tile (changes to the arrays are
+	#  kept)
+	#################################################################
+	def GetTile(self,Tile):
+		Info=self.Tiles.get(Tile)
+		if Info!=None:
+			self.Tiles.move_to_end(Tile)
+		else:
+			if Tile in self.Spilled:
+				Info=[numpy.array(self.SpillContent[Tile]),numpy.array(self.SpillRegrow[Tile]),self.Spilled.pop(Tile)]
+			else:
+				Info=self.NewTile(Tile)
+				self.CountTile(Tile,Info)
+			self.Tiles[Tile]=Info
+			if (self.MaxTiles!=None) and (len(self.Tiles)>self.MaxTiles): self.Spill()
+		if Info[2]!=self.Cycle: self.CatchUp(Tile,Info)
+		return(Info)
+
+	#################################################################
+	# Private function to move the tile that was used least recently
+	# to the spill files
+	#################################################################
+	def Spill(self):
+		if self.SpillContent is None:
+			if not os.path.isdir(self.SpillPath): os.makedirs(self.SpillPath)
+			Shape=(self.NumTileRows*self.NumTileColumns,self.TileSize,self.TileSize)
+			self.SpillContent=numpy.memmap(os.path.join(self.SpillPath,"Content.dat"),dtype=numpy.uint8,mode="w+",shape=Shape)
+			self.SpillRegrow=numpy.memmap(os.path.join(self.SpillPath,"Regrow.dat"),dtype=numpy.int16,mode="w+",shape=Shape)
+		Tile,Info=self.Tiles.popitem(last=False)
+		self.SpillContent[Tile]=Info[0]
+		self.SpillRegrow[Tile]=Info[1]
+		self.Spilled[Tile]=Info[2]
+
+	#################################################################
+	# Private function to find the tile and the cell in the tile that
+	# the coordinates are in
+	# Output:
+	#  ([Content,Regrow,Cycle],Row,Column) for the tile
+	#################################################################
+	def Locate(self,X,Y):
+		Row=int(Y/self.CellSize)
+		Column=int(X/self.CellSize)
+		TileRow,Row=divmod(Row,self.TileSize)
+		TileColumn,Column=divmod(Column,self.TileSize)
+		return(self.GetTile(TileRow*self.NumTileColumns+TileColumn),Row,Column)
+
+	#################################################################
+	# Private function to empty one cell after its Food/Ammo is eaten
+	#################################################################
+	def Consume(self,Info,Row,Column):
+		Info[0][Row,Column]=Veg.EMPTY
+		Info[1][Row,Column]=self.RegrowCycles+1 # the cell is empty for RegrowCycles updates
+		self.RegrowCounts[(self.Cycle+self.RegrowCycles+1)%len(self.RegrowCounts)]+=1
+		self.NumFull=self.NumFull-1
+
+	#################################################################
+	# Takes whatever is in the cell at the specified location (see
+	# Veg.Take)
+	#################################################################
+	def Take(self,X,Y):
+		Info,Row,Column=self.Locate(X,Y)
+		Content=int(Info[0][Row,Column])
+		if Content!=Veg.EMPTY: self.Consume(Info,Row,Column)
+		return(Content)
+
+	#################################################################
+	# Allows the consumption of Food at the specified location if
+	# there is Food in the cell (see Veg.EatFood)
+	#################################################################
+	def EatFood(self,X,Y):
+		Info,Row,Column=self.Locate(X,Y)
+		if Info[0][Row,Column]!=Veg.TYPE_FOOD: return(False)
+		self.Consume(Info,Row,Column)
+		return(True)
+
+	#################################################################
+	# The same as EatFood() for Ammo
+	#################################################################
+	def UseAmmo(self,X,Y):
+		Info,Row,Column=self.Locate(X,Y)
+		if Info[0][Row,Column]!=Veg.TYPE_AMMO: return(False)
+		self.Consume(Info,Row,Column)
+		return(True)
+
+	#################################################################
+	# Lets a group of animals take what is in their cells, one after
+	# the other (see Veg.Forage).  The animals are handled one tile at
+	# a time.
+	# Inputs:
+	#   Xs - Horizontal location of each animal in pixels (array)
+	#   Ys - vertical location of each animal in pixels (array)
+	# Output:
+	#   array with what each animal took (TYPE_FOOD, TYPE_AMMO or
+	#   EMPTY)
+	#################################################################
+	def Forage(self,Xs,Ys):
+		Rows=(numpy.asarray(Ys)/self.CellSize).astype(numpy.intp)
+		Columns=(numpy.asarray(Xs)/self.CellSize).astype(numpy.intp)
+		Tiles=(Rows//self.TileSize)*self.NumTileColumns+Columns//self.TileSize
+		Taken=numpy.full(len(Tiles),Veg.EMPTY,dtype=numpy.uint8)
+		if len(Tiles)==0: return(Taken)
+
+		# the animals in each tile, in the order they were given
+		Order=numpy.argsort(Tiles,kind="stable")
+		Starts=numpy.flatnonzero(numpy.diff(Tiles[Order]))+1
+		for Animals in numpy.split(Order,Starts):
+			Info=self.GetTile(int(Tiles[Animals[0]]))
+			TileRows=Rows[Animals]%self.TileSize
+			TileColumns=Columns[Animals]%self.TileSize
+			Content=Info[0][TileRows,TileColumns]
+
+			# the first animal on each cell that has something in it
+			Candidates=numpy.flatnonzero(Content!=Veg.EMPTY)
+			Unused,FirstIndex=numpy.unique((TileRows*self.TileSize+TileColumns)[Candidates],return_index=True)
+			First=Candidates[FirstIndex]
+			Taken[Animals[First]]=Content[First]
+
+			# consume the Food/Ammo in those cells
+			Info[0][TileRows[First],TileColumns[First]]=Veg.EMPTY
+			Info[1][TileRows[First],TileColumns[First]]=self.RegrowCycles+1
+			self.RegrowCounts[(self.Cycle+self.RegrowCycles+1)%len(self.RegrowCounts)]+=len(First)
+			self.NumFull=self.NumFull-len(First)
+		return(Taken)
+
+	#################################################################
+	# Private function to get what is in some cells (see
+	# Veg.FindNearestFull), one tile at a time
+	# Inputs:
+	#  Rows,Columns - the row and column of each cell (arrays)
+	#################################################################
+	def ContentAt(self,Rows,Columns):
+		Tiles=(Rows//self.TileSize)*self.NumTileColumns+Columns//self.TileSize
+		Result=numpy.empty(len(Tiles),dtype=numpy.uint8)
+		if len(Tiles)==0: return(Result)
+		Order=numpy.argsort(Tiles,kind="stable")
+		Starts=numpy.flatnonzero(numpy.diff(Tiles[Order]))+1
+		for Cells in numpy.split(Order,Starts):
+			Info=self.GetTile(int(Tiles[Cells[0]]))
+			Result[Cells]=Info[0][Rows[Cells]%self.TileSize,Columns[Cells]%self.TileSize]
+		return(Result)
+
+	#################################################################
+	# Finds the nearest cell with Food or Ammo in it to each of a group
+	# of animals (see Veg.NearestFull).  There is no count of the full
+	# cells in each block, so every animal looks at the cells near it,
+	# and the tiles that are looked at are created if they have not
+	# been used.
+	#################################################################
+	def NearestFull(self,Xs,Ys,Distance):
+		return(Veg.FindNearestFull(Xs,Ys,Distance,self.CellSize,self.NumRows,self.NumColumns,self.ContentAt))
+
+	#################################################################
+	# Private function to get the number of cells in the tiles that
+	# have never been created that are expected to be full.  Each
+	# cell is full at the start with a chance of PercentFull, and an
+	# empty one regrows in a cycle from 1 to RegrowCycles (all as
+	# likely), and stays full as nothing has eaten it.
+	#################################################################
+	def UntouchedFull(self):
+		if self.NumUntouched==0: return(0.0)
+		if self.RegrowCycles>0: Regrown=min(self.Cycle,self.RegrowCycles)/float(self.RegrowCycles)
+		else: Regrown=min(self.Cycle,1)
+		Full=self.PercentFull/100.0
+		return(self.NumUntouched*(Full+(1.0-Full)*Regrown))
+
+	#################################################################
+	# Number of cells that have Food/Ammo in them (the tiles that
+	# have never been used add the number that is expected to be full)
+	#################################################################
+	def FullCells(self):
+		return(self.NumFull+self.UntouchedFull())
+
+	#################################################################
+	# Percent of the cells that have Food/Ammo in them
+	#################################################################
+	def PercentCover(self):
+		return(100.0*self.FullCells()/(self.NumRows*self.NumColumns))
+
+	#################################################################
+	# What is in every cell of the grid (e.g. to draw it).  This
+	# makes an array for the whole grid, so it is only for grids that
+	# are small enough to draw.  Tiles that are not in memory are not
+	# created or read back in.
+	# Output:
+	#  NumRows x NumColumns array with TYPE_AMMO, TYPE_FOOD or EMPTY
+	#################################################################
+	def AllContent(self):
+		Result=numpy.empty((self.NumTileRows*self.TileSize,self.NumTileColumns*self.TileSize),dtype=numpy.uint8)
+		for Tile in range(self.NumTileRows*self.NumTileColumns):
+			Info=self.Tiles.get(Tile)
+			if Info!=None:
+				if Info[2]!=self.Cycle: self.CatchUp(Tile,Info)
+			elif Tile in self.Spilled:
+				Info=[numpy.array(self.SpillContent[Tile]),numpy.array(self.SpillRegrow[Tile]),self.Spilled[Tile]]
+				self.CatchUp(Tile,Info)
+			else:
+				Info=self.NewTile(Tile)
+			TileRow,TileColumn=divmod(Tile,self.NumTileColumns)
+			Result[TileRow*self.TileSize:(TileRow+1)*self.TileSize,TileColumn*self.TileSize:(TileColumn+1)*self.TileSize]=Info[0]
+		return(Result[:self.NumRows,:self.NumColumns])
+
+	#################################################################
+	# The tiles that have been used, to save them (see Checkpoint.py)
+	# Output:
+	#  dictionary of arrays: TileIndex, TileContent, TileRegrow,
+	#  TileCycle (one entry for each tile) and RegrowCounts
+	#################################################################
+	def TileArrays(self):
+		Indexes=sorted(list(self.Tiles.keys())+list(self.Spilled.keys()))
+		Content=numpy.zeros((len(Indexes),self.TileSize,self.TileSize),dtype=numpy.uint8)
+		Regrow=numpy.zeros((len(Indexes),self.TileSize,self.TileSize),dtype=numpy.int16)
+		Cycles=numpy.zeros(len(Indexes),dtype=numpy.int64)
+		for Index,Tile in enumerate(Indexes):
+			if Tile in self.Tiles:
+				Content[Index],Regrow[Index],Cycles[Index]=self.Tiles[Tile]
+			else:
+				Content[Index]=self.SpillContent[Tile]
+				Regrow[Index]=self.SpillRegrow[Tile]
+				Cycles[Index]=self.Spilled[Tile]
+		return({"TileIndex":numpy.array(Indexes,dtype=numpy.int64),"TileContent":Content,"TileRegrow":Regrow,
+			"TileCycle":Cycles,"RegrowCounts":self.RegrowCounts})
+
+	#################################################################
+	# Put the grid back the way it was saved (see Checkpoint.py)
+	# Inputs:
+	#  Key - the key for the hashes when the grid was saved
+	#  Cycle - the value of Cycle when the grid was saved
+	#  NumFull - the number of full cells in the tiles that had been
+	#   created when the grid was saved
+	#  Arrays - dictionary of arrays from TileArrays()
+	#################################################################
+	def Restore(self,Key,Cycle,NumFull,Arrays):
+		self.Key=Key
+		self.Cycle=Cycle
+		self.NumFull=NumFull
+		self.RegrowCounts=numpy.array(Arrays["RegrowCounts"],dtype=numpy.int64)
+
+		self.Tiles=collections.OrderedDict()
+		self.Spilled={}
+		self.NumUntouched=self.NumRows*self.NumColumns
+		for Index,Tile in enumerate(Arrays["TileIndex"].tolist()):
+			self.Tiles[Tile]=[numpy.array(Arrays["TileContent"][Index]),numpy.array(Arrays["TileRegrow"][Index]),
+				int(Arrays["TileCycle"][Index])]
+			self.NumUntouched=self.NumUntouched-int(numpy.count_nonzero(self.TileCells(Tile)[1]))
+			if (self.MaxTiles!=None) and (len(self.Tiles)>self.MaxTiles): self.Spill()
+
+	#################################################################
+	# Update the number of full cells with the cells that regrow in
+	# this cycle (the tiles catch up when they are next used)
+	#################################################################
+	def Update(self):
+		self.Cycle=self.Cycle+1
+		Slot=self.Cycle%len(self.RegrowCounts)
+		self.NumFull=self.NumFull+int(self.RegrowCounts[Slot])
+		self.RegrowCounts[Slot]=0
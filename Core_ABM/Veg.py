@@ -0,0 +1,423 @@
+#################################################################
+# A tiny class to create a field of Food for animals to eat.
+# Author: Jim Graham
+# Modified by: Melissa Kimble
+# Modified Date: 4/21/2015
+#
+# The class simulates "Food/Ammo", or any veg/ammo that is available for
+# consumption by animals that forage.  The Food/Ammo is in a grid of cells
+# and can either be present or not.  The grid is kept in two NumPy
+# arrays with one value for each cell:
+#  Content - what is in the cell (TYPE_AMMO, TYPE_FOOD or EMPTY)
+#  RegrowAt - for empty cells, the cycle (see Cycle) in which the
+#   Food "regrows"
+# Drawing the cells is left to the display (see Display.py).
+#
+# Each cell has its own Content, so eating only consumes a cell with
+# Food in it and picking up Ammo only consumes a cell with Ammo in
+# it.  An animal that forages takes whatever is in its cell with
+# one lookup (Take, or Forage for a group of animals).
+#
+# Instead of counting down every empty cell on every cycle, each
+# empty cell is put in a "timing wheel": a list with one bucket for
+# each of the next RegrowCycles+1 cycles.  When Food/Ammo is eaten
+# its cell is added to the bucket for the cycle it regrows in, and
+# Update() only looks at the cells in the bucket for this cycle.
+#
+# The number of full cells in each block of BLOCK_SIZE x BLOCK_SIZE
+# cells is kept up to date as cells grow and are eaten (BlockFull),
+# so NearestFull() can find the animals with nothing near them
+# without looking at the cells when animals look for the nearest
+# Food or Ammo (see Animal.Species.Seeks).
+#
+# A grid that never grows Ammo (AmmoChance=0) is a field of grass
+# (the sheep/wolf model).
+#################################################################
+
+import numpy
+
+import RandomStreams
+
+#################################################################
+# Global values for the class
+#################################################################
+
+CELL_SIZE=10 # width and height of each cell of Food, in pixels
+
+NUM_ROWS=50 # Number of cells of Food vertically
+NUM_COLUMNS=50 # Number of cells of Food horizontally
+
+EMPTY=0 # definition for a cell with nothing in it (regrowing)
+TYPE_AMMO=1 # definition for  ammo item (e.g. bullets)
+TYPE_FOOD=2 # definition for a vegetation (e.g. Food)
+
+AMMO_CHANCE=100 # 1 in AMMO_CHANCE cells that grow will be ammo, the rest are Food (0 for no ammo)
+
+BLOCK_SIZE=8 # number of cells along each side of a block in the count of full cells
+
+#################################################################
+# Find the nearest full cell (Food or Ammo) to each of a group of
+# animals, for Veg and TiledVeg.  The cells around the animals are
+# looked at in the order of how close they can be (the same offset
+# of rows and columns for every animal at once), and an animal stops
+# looking when the cell it has found is closer than the next cells
+# could be.  If the grid has a count of the full cells in each block
+# of cells, the animals with no full cells within reach are found
+# first (with a summed-area table of the counts) and do not look at
+# all.  Only the cells within reach are looked at, so the time does
+# not grow with the size of the grid.
+# Inputs:
+#  Xs,Ys - location of each animal in pixels (arrays)
+#  Distance - how far away (in pixels) the middle of a cell can be
+#  CellSize - width and height of each cell in pixels
+#  NumRows,NumColumns - number of cells in the grid
+#  ContentAt - function that is given arrays of rows and columns and
+#   returns what is in each of those cells
+#  BlockFull - number of full cells in each block of BLOCK_SIZE x
+#   BLOCK_SIZE cells (None if the grid does not count them)
+# Output:
+#  (TargetX,TargetY,Found) arrays with the middle of the nearest full
+#  cell to each animal, and False in Found if there is none in reach
+#################################################################
+
+def FindNearestFull(Xs,Ys,Distance,CellSize,NumRows,NumColumns,ContentAt,BlockFull=None):
+	Xs=numpy.asarray(Xs,dtype=numpy.float64)
+	Ys=numpy.asarray(Ys,dtype=numpy.float64)
+	TargetX=numpy.zeros(len(Xs))
+	TargetY=numpy.zeros(len(Xs))
+	Found=numpy.zeros(len(Xs),dtype=bool)
+	Rows=numpy.minimum((Ys/CellSize).astype(numpy.intp),NumRows-1)
+	Columns=numpy.minimum((Xs/CellSize).astype(numpy.intp),NumColumns-1)
+	Reach=int(Distance/CellSize)+1 # number of cells away a cell in reach can be
+
+	# the animals that have a full cell in the blocks within reach
+	Looking=numpy.arange(len(Xs))
+	if BlockFull is not None:
+		Table=numpy.zeros((BlockFull.shape[0]+1,BlockFull.shape[1]+1),dtype=numpy.int64)
+		Table[1:,1:]=BlockFull.cumsum(0).cumsum(1)
+		Top=numpy.maximum(Rows-Reach,0)//BLOCK_SIZE
+		Bottom=numpy.minimum(Rows+Reach,NumRows-1)//BLOCK_SIZE+1
+		Left=numpy.maximum(Columns-Reach,0)//BLOCK_SIZE
+		Right=numpy.minimum(Columns+Reach,NumColumns-1)//BLOCK_SIZE+1
+		NumFull=Table[Bottom,Right]-Table[Top,Right]-Table[Bottom,Left]+Table[Top,Left]
+		Looking=Looking[NumFull>0]
+
+	# the offsets to the cells in reach, nearest first (by the closest any
+	# point in the animal's cell can be to the middle of the other cell)
+	Offsets=numpy.arange(-Reach,Reach+1)
+	OffsetRows,OffsetColumns=[Values.ravel() for Values in numpy.meshgrid(Offsets,Offsets,indexing="ij")]
+	Closest=CellSize*numpy.hypot(numpy.maximum(abs(OffsetRows)-0.5,0),numpy.maximum(abs(OffsetColumns)-0.5,0))
+	Order=numpy.argsort(Closest,kind="stable")
+	Order=Order[Closest[Order]<=Distance]
+
+	Best=numpy.full(len(Xs),Distance*Distance,dtype=numpy.float64) # squared distance to the nearest cell found
+	for Index,Offset in enumerate(Order):
+		if len(Looking)==0: break
+		CellRows=Rows[Looking]+OffsetRows[Offset]
+		CellColumns=Columns[Looking]+OffsetColumns[Offset]
+		Inside=(CellRows>=0)&(CellRows<NumRows)&(CellColumns>=0)&(CellColumns<NumColumns)
+		Animals=Looking[Inside]
+		CellRows=CellRows[Inside]
+		CellColumns=CellColumns[Inside]
+		Full=ContentAt(CellRows,CellColumns)!=EMPTY
+		Animals=Animals[Full]
+		CellX=(CellColumns[Full]+0.5)*CellSize
+		CellY=(CellRows[Full]+0.5)*CellSize
+		Squared=(CellX-Xs[Animals])**2+(CellY-Ys[Animals])**2
+		Closer=(Squared<Best[Animals])|((Squared==Best[Animals])&~Found[Animals])
+		Animals=Animals[Closer]
+		Best[Animals]=Squared[Closer]
+		TargetX[Animals]=CellX[Closer]
+		TargetY[Animals]=CellY[Closer]
+		Found[Animals]=True
+
+		# stop looking when none of the cells that are left can be closer
+		if Index+1<len(Order):
+			Looking=Looking[~Found[Looking]|(Best[Looking]>Closest[Order[Index+1]]**2)]
+	return(TargetX,TargetY,Found)
+
+#################################################################
+# The class definition
+#################################################################
+
+class Veg:
+	#################################################################
+	# Private function to fill cells with Food or Ammo
+	# Inputs:
+	#  Cells - index of each cell that grows in the flattened grid,
+	#   in row order
+	# Randomly select a number between 1 and AmmoChance for each cell;
+	# if it is 1, AMMO will spawn, else = food.
+	#################################################################
+	def AddFoodOrAmmo(self,Cells):
+		if len(Cells)==0: return
+		if self.AmmoChance>0:
+			IsAmmo=self.AmmoRandom.integers(1,self.AmmoChance+1,len(Cells))==1
+			NewContent=numpy.where(IsAmmo,TYPE_AMMO,TYPE_FOOD).astype(numpy.uint8)
+		else:
+			NewContent=numpy.full(len(Cells),TYPE_FOOD,dtype=numpy.uint8)
+		self.Content.ravel()[Cells]=NewContent
+		self.RegrowAt.ravel()[Cells]=0
+		self.NumFull=self.NumFull+len(Cells)
+		numpy.add.at(self.BlockFull.ravel(),self.BlockOf(Cells),1)
+
+	#################################################################
+	# Private function to find the block of the count of full cells
+	# (BlockFull) that each cell is in
+	# Inputs:
+	#  Cells - index of each cell in the flattened grid (array)
+	# Output:
+	#  index of each block in the flattened BlockFull
+	#################################################################
+	def BlockOf(self,Cells):
+		Rows,Columns=numpy.divmod(Cells,self.Content.shape[1])
+		return((Rows//BLOCK_SIZE)*self.BlockFull.shape[1]+Columns//BLOCK_SIZE)
+
+	#################################################################
+	# Private function to empty cells and schedule them to regrow
+	# Inputs:
+	#  Cells - index of each cell in the flattened grid (array)
+	#  RegrowAt - the cycle each cell regrows in (array or one value)
+	#################################################################
+	def Schedule(self,Cells,RegrowAt):
+		self.Content.ravel()[Cells]=EMPTY
+		self.RegrowAt.ravel()[Cells]=RegrowAt
+		RegrowAt=numpy.broadcast_to(RegrowAt,numpy.shape(Cells))
+		for Cycle in numpy.unique(RegrowAt):
+			self.Wheel[Cycle%len(self.Wheel)].append(Cells[RegrowAt==Cycle])
+
+	#################################################################
+	# Private function to empty one cell after its Food/Ammo is eaten
+	#################################################################
+	def Consume(self,Row,Column):
+		Cell=Row*self.Content.shape[1]+Column
+		RegrowAt=self.Cycle+self.RegrowCycles+1 # the cell is empty for RegrowCycles updates
+		self.Content[Row,Column]=EMPTY
+		self.RegrowAt[Row,Column]=RegrowAt
+		self.Wheel[RegrowAt%len(self.Wheel)].append(Cell)
+		self.NumFull=self.NumFull-1
+		self.BlockFull[Row//BLOCK_SIZE,Column//BLOCK_SIZE]-=1
+
+	#################################################################
+	# Initialize the new object
+	# Inputs:
+	#  PercentFull - how much of the Food is initially available
+	#  RegrowCycles - number of cycles until the Food is regrown after being eaten
+	#  NumRows - number of cells of Food vertically
+	#  NumColumns - number of cells of Food horizontally
+	#  Random - the RandomStreams for the run (None for a random seed)
+	#  AmmoChance - 1 in AmmoChance cells that grow will be ammo (0 for no ammo)
+	#  CellSize - width and height of each cell in pixels
+	#################################################################
+	def __init__(self,PercentFull,RegrowCycles,NumRows=NUM_ROWS,NumColumns=NUM_COLUMNS,Random=None,
+		AmmoChance=AMMO_CHANCE,CellSize=CELL_SIZE):
+		self.Setup(RegrowCycles,NumRows,NumColumns,Random,AmmoChance,CellSize)
+
+		# Create the arrays to hold what is in each cell and the cycle it regrows in
+		self.Content=numpy.zeros((NumRows,NumColumns),dtype=numpy.uint8)
+		self.RegrowAt=numpy.zeros((NumRows,NumColumns),dtype=numpy.int32)
+
+		# Set a random regrow duration (0 to RegrowCycles-1 cycles after the first update)
+		RegrowAt=1
+		if RegrowCycles>0: RegrowAt=1+self.RegrowRandom.integers(0,RegrowCycles,NumRows*NumColumns)
+
+		# Setup the initial Food state based on percent cover
+		ProportionFull=PercentFull/100.0 # compute proportion based on the percent cover
+		Full=self.RegrowRandom.random(NumRows*NumColumns)<ProportionFull
+		self.Schedule(numpy.flatnonzero(~Full),numpy.broadcast_to(RegrowAt,Full.shape)[~Full])
+		self.AddFoodOrAmmo(numpy.flatnonzero(Full))
+
+	#################################################################
+	# Create a grid from the arrays of a saved grid (see Checkpoint.py)
+	# instead of a random start
+	# Inputs:
+	#  RegrowCycles - number of cycles until the Food is regrown after being eaten
+	#  Cycle - the value of Cycle when the grid was saved
+	#  Content - what is in each cell (used as it is, not copied)
+	#  RegrowAt - the cycle each empty cell regrows in (not copied)
+	#  Random, AmmoChance, CellSize - the same as for a new grid
+	# Output:
+	#  the new Veg
+	#################################################################
+	@classmethod
+	def FromArrays(cls,RegrowCycles,Cycle,Content,RegrowAt,Random=None,AmmoChance=AMMO_CHANCE,CellSize=CELL_SIZE):
+		TheFood=cls.__new__(cls)
+		TheFood.Setup(RegrowCycles,Content.shape[0],Content.shape[1],Random,AmmoChance,CellSize)
+		TheFood.Restore(Cycle,Content,RegrowAt)
+		return(TheFood)
+
+	#################################################################
+	# Private function to set up everything but the cells, for a new
+	# grid or one that is restored (see FromArrays)
+	#################################################################
+	def Setup(self,RegrowCycles,NumRows,NumColumns,Random,AmmoChance,CellSize):
+		self.RegrowCycles=RegrowCycles;
+		self.AmmoChance=AmmoChance
+		self.CellSize=CellSize
+
+		if Random==None: Random=RandomStreams.RandomStreams()
+		self.RegrowRandom=Random.NumPy("Regrow") # random numbers for the starting cover and regrow times
+		self.AmmoRandom=Random.NumPy("Ammo") # random numbers for picking Food or Ammo
+
+		self.Cycle=0 # number of times Update() has been called
+		self.NumFull=0 # number of cells with Food/Ammo in them
+
+		# the number of full cells in each block of cells (see NearestFull)
+		self.BlockFull=numpy.zeros((-(-NumRows//BLOCK_SIZE),-(-NumColumns//BLOCK_SIZE)),dtype=numpy.int32)
+
+		# one bucket (list of cells) for each cycle that a cell can be waiting to regrow
+		self.Wheel=[[] for i in range(RegrowCycles+2)]
+
+	#################################################################
+	# Private function to find the row and column the coordinates are in
+	#################################################################
+	def Cell(self,X,Y):
+		Row=int(Y/self.CellSize)
+		Column=int(X/self.CellSize)
+		return(Row,Column)
+
+	#################################################################
+	# Takes whatever is in the cell at the specified location (Food or
+	# Ammo) and leaves the cell to regrow
+	# Inputs:
+	#   X - Horizontal location in pixels
+	#   Y - vertical location in pixels
+	# Output:
+	#   what was taken: TYPE_FOOD, TYPE_AMMO or EMPTY if the cell was
+	#   regrowing and there was nothing to take
+	#################################################################
+	def Take(self,X,Y):
+		Row,Column=self.Cell(X,Y)
+		Content=int(self.Content[Row,Column])
+		if Content!=EMPTY: self.Consume(Row,Column) # Set the number of cycles to regrow
+		return(Content)
+
+	#################################################################
+	# Allows the consumption of Food at the specified location if
+	# there is Food in the cell
+	# Inputs:
+	#   X - Horizontal location in pixels
+	#   Y - vertical location in pixels
+	# Output:
+	#   True if Food was consumed
+	#   False if there was no Food (the cell is regrowing or has Ammo)
+	#################################################################
+	def EatFood(self,X,Y):
+		Row,Column=self.Cell(X,Y)
+		if self.Content[Row,Column]!=TYPE_FOOD: return(False)
+		self.Consume(Row,Column)
+		return(True)
+
+	#################################################################
+	# The same as EatFood() for Ammo
+	#################################################################
+	def UseAmmo(self,X,Y):
+		Row,Column=self.Cell(X,Y)
+		if self.Content[Row,Column]!=TYPE_AMMO: return(False)
+		self.Consume(Row,Column)
+		return(True)
+
+	#################################################################
+	# Lets a group of animals take what is in their cells, one after
+	# the other, the same way as calling Take() for each animal in
+	# turn: only the first animal on a cell finds anything there.
+	# Inputs:
+	#   Xs - Horizontal location of each animal in pixels (array)
+	#   Ys - vertical location of each animal in pixels (array)
+	# Output:
+	#   array with what each animal took (TYPE_FOOD, TYPE_AMMO or
+	#   EMPTY)
+	#################################################################
+	def Forage(self,Xs,Ys):
+		Rows=(numpy.asarray(Ys)/self.CellSize).astype(numpy.intp)
+		Columns=(numpy.asarray(Xs)/self.CellSize).astype(numpy.intp)
+		Cells=Rows*self.Content.shape[1]+Columns
+		Content=self.Content.ravel()[Cells]
+
+		# find the first animal on each cell that has something in it
+		Candidates=numpy.flatnonzero(Content!=EMPTY)
+		Unused,FirstIndex=numpy.unique(Cells[Candidates],return_index=True)
+		First=Candidates[FirstIndex]
+		Taken=numpy.full(len(Cells),EMPTY,dtype=numpy.uint8)
+		Taken[First]=Content[First]
+
+		# consume the Food/Ammo in those cells
+		self.Schedule(Cells[First],self.Cycle+self.RegrowCycles+1)
+		self.NumFull=self.NumFull-len(First)
+		numpy.subtract.at(self.BlockFull.ravel(),self.BlockOf(Cells[First]),1)
+		return(Taken)
+
+	#################################################################
+	# Private function to get what is in some cells (see
+	# FindNearestFull)
+	#################################################################
+	def ContentAt(self,Rows,Columns):
+		return(self.Content[Rows,Columns])
+
+	#################################################################
+	# Finds the nearest cell with Food or Ammo in it to each of a group
+	# of animals
+	# Inputs:
+	#   Xs - Horizontal location of each animal in pixels (array)
+	#   Ys - vertical location of each animal in pixels (array)
+	#   Distance - how far away (in pixels) the middle of a cell can be
+	# Output:
+	#   (TargetX,TargetY,Found) arrays with the middle of the nearest
+	#   cell to each animal, and False in Found if there is none
+	#################################################################
+	def NearestFull(self,Xs,Ys,Distance):
+		return(FindNearestFull(Xs,Ys,Distance,self.CellSize,self.Content.shape[0],self.Content.shape[1],
+			self.ContentAt,self.BlockFull))
+
+	#################################################################
+	# Percent of the cells that have Food/Ammo in them
+	#################################################################
+	def PercentCover(self):
+		return(100.0*self.NumFull/self.Content.size)
+
+	#################################################################
+	# Number of cells that have Food/Ammo in them
+	#################################################################
+	def FullCells(self):
+		return(self.NumFull)
+
+	#################################################################
+	# What is in every cell of the grid (e.g. to draw it)
+	# Output:
+	#  NumRows x NumColumns array with TYPE_AMMO, TYPE_FOOD or EMPTY
+	#################################################################
+	def AllContent(self):
+		return(self.Content)
+
+	#################################################################
+	# Put the grid back the way it was saved (see FromArrays)
+	# Inputs:
+	#  Cycle - the value of Cycle when the grid was saved
+	#  Content - what is in each cell (used as it is, not copied)
+	#  RegrowAt - the cycle each empty cell regrows in (not copied)
+	#################################################################
+	def Restore(self,Cycle,Content,RegrowAt):
+		self.Cycle=Cycle
+		self.Content=Content
+		self.RegrowAt=RegrowAt
+
+		# put the empty cells back in the timing wheel
+		self.Wheel=[[] for i in range(self.RegrowCycles+2)]
+		Empty=numpy.flatnonzero(Content.ravel()==EMPTY)
+		self.Schedule(Empty,RegrowAt.ravel()[Empty])
+		self.NumFull=Content.size-len(Empty)
+		self.BlockFull[:]=0
+		numpy.add.at(self.BlockFull.ravel(),self.BlockOf(numpy.flatnonzero(Content.ravel()!=EMPTY)),1)
+
+	#################################################################
+	# Update the state of the cells that regrow in this cycle.
+	# Randomly select a number between 1 and 100; if it is 1, AMMO will spawn, else = food.
+	#################################################################
+	def Update(self):
+		self.Cycle=self.Cycle+1
+		Slot=self.Cycle%len(self.Wheel)
+		Bucket=self.Wheel[Slot]
+		if len(Bucket)==0: return
+		self.Wheel[Slot]=[]
+		Cells=numpy.sort(numpy.concatenate([numpy.ravel(Item) for Item in Bucket]))
+		self.AddFoodOrAmmo(Cells)
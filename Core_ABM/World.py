@@ -0,0 +1,160 @@
+#################################################################
+# The world the animals live in (the same for every model).
+#
+# The world holds all of the model state in plain Python objects:
+# the bounds of the world, the grid of Food/Ammo and the list of
+# living animals.  Nothing in here knows about Tkinter, so a model
+# can be run without a display (see Headless.py).  Anything that
+# wants to watch the model (e.g. the canvas in Display.py) is added
+# as an "observer" and is called once at the end of every cycle.
+#
+# The world is a torus: an animal that moves off of one edge comes
+# back on at the other edge (see Wrap).  The size of the world and
+# of the Food cells are set when the world is created (see
+# Scenario.CreateWorld), so nothing in the model depends on the size
+# of the window.
+#
+# The world can also keep a spatial grid of the animals (see
+# SpatialGrid.py) so animals only look at the animals near them
+# when shooting, eating, chasing and fleeing.
+#
+# TheAnimals is normally an AnimalStore of AnimalClass objects (see
+# AnimalStore.py), but it can also be an AnimalArrays object that
+# keeps all of the animals in NumPy arrays and updates them all at
+# once (see AnimalArrays.py).
+#################################################################
+
+import numpy
+
+import AnimalStore
+import Kernels
+import RandomStreams
+import SpatialGrid
+
+#################################################################
+# The class definition
+#################################################################
+
+class World:
+	#################################################################
+	# Initialize the new object
+	# Inputs:
+	#  Width - horizontal size of the world in pixels
+	#  Height - vertical size of the world in pixels
+	#  TheFood - the grid of Food/Ammo (a Veg object)
+	#  IndexCellSize - size of the buckets in the spatial grid, must be
+	#   at least the largest interaction distance (0 for no grid)
+	#  Random - the RandomStreams for the run (None for a random seed)
+	#################################################################
+	def __init__(self,Width,Height,TheFood,IndexCellSize=0,Random=None):
+		self.Width=Width
+		self.Height=Height
+		self.MaxX=Width-1 # where an animal that moves off of the left edge comes back on
+		self.MaxY=Height-1 # where an animal that moves off of the top edge comes back on
+
+		self.TheFood=TheFood
+
+		if Random==None: Random=RandomStreams.RandomStreams()
+		self.Random=Random # all of the random numbers for the run come from here
+		self.TheAnimals=AnimalStore.AnimalStore() # the living animals
+
+		self.TheIndex=None # spatial grid of the animals
+		if IndexCellSize>0: self.TheIndex=SpatialGrid.SpatialGrid(Width,Height,IndexCellSize)
+
+		self.Cycle=0 # number of cycles that have been run
+		self.Events={} # number of times each event (e.g. "Births") happened in the last cycle
+		self.Profiler=None # times the phases of each cycle if it is set (see Profiler.py)
+		self.Observers=[] # objects that are told when a cycle has finished
+
+	#################################################################
+	# Add an observer to the world.  The observer must have an
+	# Update(TheWorld) function that is called after each cycle.
+	#################################################################
+	def AddObserver(self,TheObserver):
+		self.Observers.append(TheObserver)
+		TheObserver.Update(self) # let the observer see the starting state
+
+	def RemoveObserver(self,TheObserver):
+		self.Observers.remove(TheObserver)
+
+	#################################################################
+	# Put a location that has moved off of the world back on at the
+	# other edge.  This is the only place the edges of the world are
+	# handled.
+	# Inputs:
+	#  X - horizontal location in pixels
+	#  Y - vertical location in pixels
+	# Output:
+	#  (X,Y) inside the world
+	#################################################################
+	def Wrap(self,X,Y):
+		if X<0: X=self.MaxX
+		elif X>=self.Width: X=0
+		if Y<0: Y=self.MaxY
+		elif Y>=self.Height: Y=0
+		return(X,Y)
+
+	#################################################################
+	# The same as Wrap() for arrays of locations (with a compiled loop
+	# if Numba is installed, see Kernels.py)
+	# Inputs:
+	#  X - horizontal locations in pixels (array)
+	#  Y - vertical locations in pixels (array)
+	# Output:
+	#  (X,Y) new arrays inside the world
+	#################################################################
+	def WrapArrays(self,X,Y):
+		if Kernels.Active():
+			NewX=Kernels.Wrap(X,self.Width,self.MaxX)
+			NewY=Kernels.Wrap(Y,self.Height,self.MaxY)
+			if (NewX is not None) and (NewY is not None): return(NewX,NewY)
+		X=numpy.where(X<0,self.MaxX,numpy.where(X>=self.Width,0,X))
+		Y=numpy.where(Y<0,self.MaxY,numpy.where(Y>=self.Height,0,Y))
+		return(X,Y)
+
+	#################################################################
+	# Count something that happened in this cycle (see Events)
+	# Inputs:
+	#  Name - name of the event (e.g. "Births", "Shots")
+	#  Count - number of times it happened
+	#################################################################
+	def CountEvent(self,Name,Count=1):
+		self.Events[Name]=self.Events.get(Name,0)+Count
+
+	#################################################################
+	# Run one cycle of the model
+	# - Rebuild the spatial grid (if there is one)
+	# - Update the Food/Ammo (grows back)
+	# - Update the animals (repoduce, feed, die), then add the
+	#   animals that were born and remove the ones that died
+	# - Tell the observers that the cycle is done
+	# Each phase is timed if there is a Profiler.
+	#################################################################
+	def Update(self):
+		Profiler=self.Profiler
+		self.Events={}
+		if self.TheIndex!=None:
+			if Profiler!=None: StartTime=Profiler.Clock()
+			self.TheIndex.Rebuild(self.TheAnimals)
+			if Profiler!=None: Profiler.Add("Index",StartTime)
+
+		if Profiler!=None: StartTime=Profiler.Clock()
+		self.TheFood.Update()
+		if Profiler!=None: Profiler.Add("Veg",StartTime)
+
+		if Profiler!=None: StartTime=Profiler.Clock()
+		self.TheAnimals.Update(self)
+		if Profiler!=None: Profiler.Add("Animals",StartTime)
+		if isinstance(self.TheAnimals,AnimalStore.AnimalStore):
+			if Profiler!=None: StartTime=Profiler.Clock()
+			self.TheAnimals.ApplyChanges()
+			if Profiler!=None: Profiler.Add("BirthsDeaths",StartTime)
+
+		self.Cycle=self.Cycle+1
+
+		if Profiler!=None: StartTime=Profiler.Clock()
+		for TheObserver in self.Observers:
+			TheObserver.Update(self)
+		if Profiler!=None:
+			Profiler.Add("Observers",StartTime)
+			Profiler.EndCycle(self.Cycle)
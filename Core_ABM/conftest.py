@@ -0,0 +1,23 @@
+#################################################################
+# The fixtures that the tests (test_*.py) share (see TestWorlds.py)
+#################################################################
+
+import pytest
+
+import Animal
+import TestWorlds
+
+#################################################################
+# Puts the settings for a busy world (TestWorlds.BUSY) in the model
+# and turns off printing the events.  Returns a function that
+# changes more of the model's constants, e.g.
+# BusyWorld(USE_TILES=True).  Everything is put back after the test.
+#################################################################
+
+@pytest.fixture
+def BusyWorld(monkeypatch):
+	monkeypatch.setattr(Animal,"PRINT_EVENTS",False)
+	def Set(**Values):
+		for Name,Value in Values.items(): monkeypatch.setattr(TestWorlds.Model,Name,Value)
+	Set(**TestWorlds.BUSY)
+	return(Set)
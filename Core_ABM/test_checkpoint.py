@@ -0,0 +1,48 @@
+#################################################################
+# Checks that a world that is saved and loaded again (see
+# Checkpoint.py) carries on with exactly the same results, and that
+# the Species of the world are saved even when they have no animals.
+#
+# Run with: python -m pytest Core_ABM
+#################################################################
+
+import numpy
+import pytest
+
+import Checkpoint
+import Scenario
+from TestWorlds import Model,RunWorld,AssertSameRuns
+
+#################################################################
+# Global values
+#################################################################
+
+NUM_CYCLES=20 # cycles to run each world for
+
+#################################################################
+# Private function to save a world and load it again
+#################################################################
+
+def SaveAndLoad(TheWorld,Folder):
+	Path=str(Folder/"Checkpoint")
+	Checkpoint.Save(TheWorld,Path)
+	return(Checkpoint.Load(Path))
+
+@pytest.mark.parametrize("Arrays",(False,True))
+def test_round_trip(BusyWorld,tmp_path,Arrays):
+	BusyWorld(USE_ARRAYS=Arrays)
+	TheWorld=Scenario.CreateWorld(Model,1)
+	RunWorld(TheWorld,10)
+	Loaded=SaveAndLoad(TheWorld,tmp_path)
+	assert Loaded.Cycle==TheWorld.Cycle
+	assert numpy.array_equal(Loaded.TheFood.AllContent(),TheWorld.TheFood.AllContent())
+	assert Loaded.TheFood.NumFull==TheWorld.TheFood.NumFull
+	AssertSameRuns(RunWorld(Loaded,NUM_CYCLES),RunWorld(TheWorld,NUM_CYCLES))
+
+@pytest.mark.parametrize("Arrays",(False,True))
+def test_species_without_animals_are_saved(BusyWorld,tmp_path,Arrays):
+	BusyWorld(USE_ARRAYS=Arrays,NUM_ZOMBIES=0)
+	Loaded=SaveAndLoad(Scenario.CreateWorld(Model,1),tmp_path)
+	assert Model.CountAnimals(Loaded)==(Model.NUM_HUMAN,0)
+	assert [(TheSpecies.Type,TheSpecies.Name,TheSpecies.Infects) for TheSpecies in Loaded.TheAnimals.AllSpecies()]==\
+		[(TheSpecies.Type,TheSpecies.Name,TheSpecies.Infects) for TheSpecies in Model.CreateSpecies()]
@@ -0,0 +1,123 @@
+#################################################################
+# Checks that the compiled loops in Kernels.py give exactly the same
+# results as the NumPy code they replace.  The loops themselves are
+# checked without Numba too (they are plain Python until they are
+# compiled); the runs with the compiled loops are skipped if Numba
+# is not installed.
+#
+# Run with: python -m pytest Core_ABM
+#################################################################
+
+import numpy
+import pytest
+
+import AnimalArrays
+import Kernels
+import Scenario
+from TestWorlds import Model,RunWorld,AssertSameRuns,NumKills
+
+#################################################################
+# Global values
+#################################################################
+
+NUM_CYCLES=20 # cycles to run each world for
+WIDTH=500 # size of the world for the pairs
+HEIGHT=400
+
+#################################################################
+# Private function to get random locations in the world
+#################################################################
+
+def Locations(Random,Number):
+	return(Random.uniform(0,WIDTH,Number),Random.uniform(0,HEIGHT,Number))
+
+#################################################################
+# Private function to find the pairs with the NumPy code
+#################################################################
+
+def NumPyPairs(monkeypatch,X1,Y1,X2,Y2,Distance):
+	monkeypatch.setattr(Kernels,"USE_NUMBA",False)
+	Pairs=AnimalArrays.FindPairs(X1,Y1,X2,Y2,Distance,WIDTH,HEIGHT)
+	monkeypatch.setattr(Kernels,"USE_NUMBA",True)
+	return(Pairs)
+
+#################################################################
+# Private function to run a world of animals in arrays with or
+# without the compiled loops
+#################################################################
+
+def RunWithNumba(Seed,UseNumba):
+	Model.USE_NUMBA=UseNumba
+	TheWorld=Scenario.CreateWorld(Model,Seed,4000,1000,1000,10)
+	assert Kernels.Active()==(UseNumba and (Kernels.numba is not None))
+	return(RunWorld(TheWorld,NUM_CYCLES))
+
+@pytest.fixture
+def ArrayWorld(BusyWorld,monkeypatch):
+	monkeypatch.setattr(Kernels,"USE_NUMBA",Kernels.USE_NUMBA) # put back if the loops could not be compiled
+	BusyWorld(USE_ARRAYS=True)
+	return(BusyWorld)
+
+#################################################################
+# The loops (compiled or not) against the NumPy code
+#################################################################
+
+@pytest.mark.parametrize("Number",(0,1,50,2000))
+@pytest.mark.parametrize("Distance",(3,10,25.5))
+def test_pairs_loop_matches_numpy(monkeypatch,Number,Distance):
+	Random=numpy.random.default_rng(Number)
+	X1,Y1=Locations(Random,Number)
+	X2,Y2=Locations(Random,Number+7)
+	I,J=NumPyPairs(monkeypatch,X1,Y1,X2,Y2,Distance)
+
+	# the same set up as AnimalArrays.FindPairs
+	NumColumns=int(numpy.ceil(WIDTH/float(Distance)))
+	NumRows=int(numpy.ceil(HEIGHT/float(Distance)))
+	Cell2=(Y2/Distance).astype(numpy.intp)*NumColumns+(X2/Distance).astype(numpy.intp)
+	Order=numpy.argsort(Cell2,kind="stable")
+	LoopI,LoopJ=Kernels.FindPairs(X1,Y1,(Y1/Distance).astype(numpy.intp),(X1/Distance).astype(numpy.intp),
+		X2,Y2,Cell2[Order],Order,NumRows,NumColumns,Distance)
+	assert numpy.array_equal(LoopI,I) and numpy.array_equal(LoopJ,J)
+
+def test_step_and_wrap_loops_match_numpy():
+	Random=numpy.random.default_rng(1)
+	X,Y=Locations(Random,1000)
+	Moved=numpy.flatnonzero(Random.random(1000)<0.7)
+	StepX,StepY=Random.normal(0,20,1000),Random.normal(0,20,1000)
+	Spread=Random.uniform(1,30,len(Moved))
+	NormalX,NormalY=Random.standard_normal(len(Moved)),Random.standard_normal(len(Moved))
+
+	LoopX,LoopY=X.copy(),Y.copy()
+	assert Kernels.Step(LoopX,LoopY,Moved,StepX,StepY,Spread,NormalX,NormalY)
+	X[Moved]+=StepX[Moved]+NormalX*Spread
+	Y[Moved]+=StepY[Moved]+NormalY*Spread
+	assert numpy.array_equal(LoopX,X) and numpy.array_equal(LoopY,Y)
+
+	assert numpy.array_equal(Kernels.Wrap(X,WIDTH,WIDTH-1),numpy.where(X<0,WIDTH-1,numpy.where(X>=WIDTH,0,X)))
+
+#################################################################
+# Whole runs of the arrays with and without the compiled loops
+#################################################################
+
+@pytest.mark.parametrize("Seed",(1,2))
+def test_compiled_run_matches_numpy(ArrayWorld,Seed):
+	pytest.importorskip("numba")
+	WithNumba=RunWithNumba(Seed,True)
+	assert NumKills(WithNumba)>0
+	AssertSameRuns(WithNumba,RunWithNumba(Seed,False))
+
+def test_fallback_when_compiling_fails(ArrayWorld,monkeypatch,capsys):
+	numba=pytest.importorskip("numba")
+	def CanNotCompile(*Values):
+		raise numba.core.errors.TypingError("can not compile")
+	for Name in ("PairsLoop","StepLoop","WrapLoop"): monkeypatch.setattr(Kernels,Name,CanNotCompile)
+	Failed=RunWithNumba(1,True)
+	assert not Kernels.Active()
+	assert "using NumPy instead" in capsys.readouterr().out
+	AssertSameRuns(Failed,RunWithNumba(1,False))
+
+def test_without_numba(ArrayWorld,monkeypatch):
+	monkeypatch.setattr(Kernels,"numba",None)
+	Missing=RunWithNumba(1,True)
+	assert not Kernels.Active()
+	AssertSameRuns(Missing,RunWithNumba(1,False))
@@ -0,0 +1,51 @@
+#################################################################
+# Checks that the spatial grid (see SpatialGrid.py) only changes
+# how fast the model runs: the same seeded world is run with and
+# without the grid, and the animals, counts and events must be the
+# same after every cycle.
+#
+# Run with: python -m pytest Core_ABM
+#################################################################
+
+import pytest
+
+import Scenario
+from TestWorlds import Model,RunWorld,AssertSameRuns,NumKills
+
+#################################################################
+# Global values
+#################################################################
+
+NUM_CYCLES=30 # cycles to run each world for
+SEEDS=(1,2,3)
+
+#################################################################
+# Private function to run a world with or without the grid
+#################################################################
+
+def RunWithGrid(Seed,UseGrid):
+	Model.USE_SPATIAL_GRID=UseGrid
+	TheWorld=Scenario.CreateWorld(Model,Seed)
+	assert (TheWorld.TheIndex!=None)==UseGrid
+	return(RunWorld(TheWorld,NUM_CYCLES))
+
+#################################################################
+# A small busy world, with the animals close enough together that
+# every rule that uses the grid is run
+#################################################################
+
+@pytest.fixture
+def Crowded(BusyWorld):
+	BusyWorld(DistanceToShoot=15,DISTANCE_TO_EAT=10,WORLD_WIDTH=200,WORLD_HEIGHT=200)
+	return(BusyWorld)
+
+@pytest.mark.parametrize("Seed",SEEDS)
+def test_grid_gives_same_results(Crowded,Seed):
+	WithGrid=RunWithGrid(Seed,True)
+	assert NumKills(WithGrid)>0
+	AssertSameRuns(WithGrid,RunWithGrid(Seed,False))
+
+@pytest.mark.parametrize("Seed",SEEDS)
+def test_grid_gives_same_results_nearest(Crowded,Seed):
+	Crowded(NEAREST_TARGETS=3)
+	AssertSameRuns(RunWithGrid(Seed,True),RunWithGrid(Seed,False))
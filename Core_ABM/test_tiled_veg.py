@@ -0,0 +1,114 @@
+#################################################################
+# Checks for the tiled grid of Food/Ammo (see TiledVeg.py): moving
+# tiles to the spill files, taking Food/Ammo for a group of animals
+# at once, saving and loading the tiles and counting the full cells
+# must not change the results.
+#
+# Run with: python -m pytest Core_ABM
+#################################################################
+
+import numpy
+import pytest
+
+import Checkpoint
+import RandomStreams
+import Scenario
+import TiledVeg
+import Veg
+from TestWorlds import Model,RunWorld,AssertSameRuns
+
+#################################################################
+# Global values
+#################################################################
+
+NUM_CYCLES=30 # cycles to run each world for
+NUM_ROWS=50 # size of the grids that are used on their own
+NUM_COLUMNS=70
+TILE_SIZE=16 # small tiles so the grids have a lot of them
+
+#################################################################
+# Private function to make a grid on its own
+#################################################################
+
+def NewGrid(Seed,PercentFull=50,RegrowCycles=5,MaxTiles=None,SpillPath=None):
+	return(TiledVeg.TiledVeg(PercentFull,RegrowCycles,NUM_ROWS,NUM_COLUMNS,RandomStreams.RandomStreams(Seed),3,
+		Veg.CELL_SIZE,TILE_SIZE,MaxTiles,SpillPath))
+
+def Locations(Random,Number):
+	return(Random.uniform(0,NUM_COLUMNS*Veg.CELL_SIZE,Number),Random.uniform(0,NUM_ROWS*Veg.CELL_SIZE,Number))
+
+#################################################################
+# A busy world with its Food in small tiles, so the animals use a
+# lot of tiles
+#################################################################
+
+@pytest.fixture
+def Tiled(BusyWorld,monkeypatch):
+	monkeypatch.setattr(TiledVeg,"TILE_SIZE",TILE_SIZE)
+	BusyWorld(USE_TILES=True)
+	return(BusyWorld)
+
+@pytest.mark.parametrize("Seed",(1,2))
+def test_spill_gives_same_results(Tiled,tmp_path,Seed):
+	InMemory=RunWorld(Scenario.CreateWorld(Model,Seed),NUM_CYCLES)
+	Tiled(MAX_TILES=2,SPILL_PATH=str(tmp_path))
+	TheWorld=Scenario.CreateWorld(Model,Seed)
+	Spilled=RunWorld(TheWorld,NUM_CYCLES)
+	assert len(TheWorld.TheFood.Spilled)>0
+	AssertSameRuns(InMemory,Spilled)
+
+@pytest.mark.parametrize("Seed",(1,2))
+def test_checkpoint_round_trip(Tiled,tmp_path,Seed):
+	TheWorld=Scenario.CreateWorld(Model,Seed)
+	RunWorld(TheWorld,10)
+	Path=str(tmp_path/"Checkpoint")
+	Checkpoint.Save(TheWorld,Path)
+	Loaded=Checkpoint.Load(Path)
+	assert Loaded.TheFood.PercentCover()==TheWorld.TheFood.PercentCover()
+	AssertSameRuns(RunWorld(Loaded,NUM_CYCLES),RunWorld(TheWorld,NUM_CYCLES))
+
+#################################################################
+# The grid on its own
+#################################################################
+
+@pytest.mark.parametrize("Seed",(1,2,3))
+def test_forage_matches_one_at_a_time(Seed):
+	Together=NewGrid(Seed)
+	Taking=NewGrid(Seed)
+	Eating=NewGrid(Seed)
+	Random=numpy.random.default_rng(Seed)
+	Found=set()
+	for Cycle in range(NUM_CYCLES):
+		Xs,Ys=Locations(Random,200)
+		Taken=Together.Forage(Xs,Ys).tolist()
+		assert Taken==[Taking.Take(X,Y) for X,Y in zip(Xs,Ys)]
+		OneAtATime=[]
+		for X,Y in zip(Xs,Ys):
+			if Eating.EatFood(X,Y): OneAtATime.append(Veg.TYPE_FOOD)
+			elif Eating.UseAmmo(X,Y): OneAtATime.append(Veg.TYPE_AMMO)
+			else: OneAtATime.append(Veg.EMPTY)
+		assert Taken==OneAtATime
+		Found.update(Taken)
+		for Grid in (Together,Taking,Eating): Grid.Update()
+		assert numpy.array_equal(Together.AllContent(),Taking.AllContent())
+		assert numpy.array_equal(Together.AllContent(),Eating.AllContent())
+		assert Together.NumFull==Taking.NumFull==Eating.NumFull
+	assert Found=={Veg.TYPE_FOOD,Veg.TYPE_AMMO,Veg.EMPTY}
+
+@pytest.mark.parametrize("RegrowCycles",(0,1,5))
+def test_full_cells_are_counted(RegrowCycles):
+	Grid=NewGrid(1,RegrowCycles=RegrowCycles)
+	for Tile in range(Grid.NumTileRows*Grid.NumTileColumns): Grid.GetTile(Tile)
+	assert Grid.NumUntouched==0
+	Random=numpy.random.default_rng(1)
+	for Cycle in range(NUM_CYCLES):
+		Grid.Forage(*Locations(Random,100))
+		assert Grid.FullCells()==numpy.count_nonzero(Grid.AllContent()!=Veg.EMPTY)
+		Grid.Update()
+
+def test_grid_is_created_without_looking_at_the_cells():
+	Grid=TiledVeg.TiledVeg(30,10,10**6,10**6,RandomStreams.RandomStreams(1))
+	assert Grid.NumFull==0 and len(Grid.Tiles)==0
+	assert Grid.PercentCover()==pytest.approx(30)
+	for Cycle in range(10): Grid.Update()
+	assert Grid.PercentCover()==pytest.approx(100)
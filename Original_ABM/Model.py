@@ -0,0 +1,177 @@
+#################################################################
+# The sheep/wolf model.
+# This file sets up the model for the engine in Core_ABM (see
+# Core_ABM/Scenario.py).  It is a three trophic level spatial
+# model.  "Veg" is the vegetation or grass.
+# Animals are Sheep and Wolves where the sheep feed on the grass and
+# the wolves feed on the sheep.
+#
+# The model beings with:
+# - Certain percent cover of grass
+# - Specified number of sheep
+# - Specified number of wolves
+#
+# The model repeats in an infinite number of "cycles".  Each cycle
+# repesents about a month for the default setup but this is really
+# arbitrary and can have different meanings.  On each cycle the
+# model is updated as follows:
+# - If a patch of grass is empty and enough cycles has passed, the
+#   grass will reappear and be available for eating
+# - If a sheep is close enough to grass, it will eat it
+# - If a sheep has gone a specified number of cycles without eating,
+#   it will die
+# - if a sheep has gone a specified number of cycles from their last
+#   birth, they will birth another sheep
+# - If a wolf is within a specified distance from a sheep, it will eat it
+# - If a wolf has gone a specified number of cycles from their last
+#   birth, they will birth another wolf
+#
+# This model technically models just the female sheep (or other herbivore)
+# and wolves (predator).  It could also be interpreted as modeling
+# flocks of sheep and packs of wolves.  The model could be modified in
+# a variety of ways to model other species and in different ways.
+#
+# To run the model in a window: python Core_ABM/Test.py Original_ABM
+# To run the model without a window: python Core_ABM/Headless.py Original_ABM
+#
+# Author: Jim Graham
+# Date: 4/2/2015
+#################################################################
+
+# Import our custom modules
+import Animal # module with the class to create prey and predators
+
+#################################################################
+# Model constants (modify these to see different model effects)
+#################################################################
+
+NAME="Sheep/Wolf" # name of the model (for the window and the results)
+
+TYPE_PREY=1 # definition for a prey item (e.g. sheep)
+TYPE_PREDATOR=2 # definition for a predator (e.g. wolf)
+
+WORLD_WIDTH=500 # width of the world, in pixels
+WORLD_HEIGHT=500 # height of the world, in pixels
+CELL_SIZE=10 # width and height of each patch of grass, in pixels
+
+PERCENT_GRASS_COVER=50 # Starting cover of grass (50)
+GRASS_REGROW_CYCLES=10 # Number of cycles to regrow one patch of grass (100)
+AMMO_CHANCE=0 # no Ammo in this model
+
+# Keep the grass in tiles that are only created when an animal first uses them (see
+# TiledVeg.py), for worlds too big to hold every patch.  Up to MAX_TILES tiles are kept
+# in memory and the rest are moved to files in SPILL_PATH (None to keep them all).
+USE_TILES=False
+MAX_TILES=None
+SPILL_PATH=None
+
+NUM_SHEEP=100 # number of sheep to start with
+SHEEP_BIRTH_CYCLES=20 # number of cycles before each sheep repoduces
+SHEEP_LIFE_CYCLES=20 # number of cycles until sheep dies if they cannot find food
+SHEEP_DISTANCE_TO_MOVE=5 # distance sheep can move in each cycle, in pixels.
+
+NUM_WOLVES=5 # starting number of wolves
+WOLF_BIRTH_CYCLES=20 # number of cycles before each wolf repoduces
+WOLF_LIFE_CYCLES=20 # number of cycles before each wolf dies if they cannot find a sheep to eat
+DISTANCE_TO_EAT=25 # how close a predator needs to be to a prey item to consume it, in pixels
+WOLF_DISTANCE_TO_MOVE=20 # distance wolf can move in each cycle, in pixels
+
+# Use a spatial grid so the wolves only look at the sheep near them instead of every
+# animal in the world (see SpatialGrid.py).  The results are the same with or without it.
+USE_SPATIAL_GRID=True
+
+# True for every wolf to eat at the same time, after all of the animals have aged, instead
+# of one animal at a time in the order they are updated (see AnimalStore.py and
+# Animal.HuntAll).  The AnimalArrays are always updated this way.
+BATCH_HUNTING=False
+
+# Keep all of the animals in NumPy arrays and update them all at once instead of
+# one AnimalClass object at a time (see AnimalArrays.py).  This is much faster for
+# large numbers of animals but can only be run headless.
+USE_ARRAYS=False
+
+# Use loops compiled with Numba, if it is installed, to find the animals within reach
+# and move the animals in NumPy arrays (see Kernels.py).  The results are the same with
+# or without Numba.
+USE_NUMBA=True
+
+# Split the world into this many strips, each run by its own process with the animals
+# in NumPy arrays (see Parallel.py).  Only used by Headless.py.
+NUM_WORKERS=1
+
+PRINT_EVENTS=False # print deaths in Test.py
+
+# Write the statistics for every cycle to this CSV file (see Stats.py), None for no file
+STATS_FILE=None
+
+# Save the whole model to this folder every CHECKPOINT_EVERY cycles (see Checkpoint.py),
+# None for no checkpoints.  Headless.py carries on from the checkpoint if it is there.
+CHECKPOINT_PATH=None
+CHECKPOINT_EVERY=100
+
+# Time each phase of every cycle and print where the time went at the end of the run
+# (see Profiler.py).  The times for each cycle are also written to PROFILE_FILE if it is set.
+PROFILE=False
+PROFILE_FILE=None
+
+# Model constants and the values to run for each in Batch.py
+PARAMETER_GRID={
+	"NUM_SHEEP":[50,100],
+	"NUM_WOLVES":[5],
+	"DISTANCE_TO_EAT":[15,25],
+	"GRASS_REGROW_CYCLES":[10],
+}
+
+COUNT_NAMES=("NumSheep","NumWolves") # names of the values from CountAnimals()
+
+#################################################################
+# Create the Species for the sheep and the wolves from the model
+# constants.  Every animal of a type shares the same Species.
+# Output:
+#  (SHEEP,WOLF) Species objects
+#################################################################
+
+def CreateSpecies():
+	# sheep eat the grass
+	SHEEP=Animal.Species(TYPE_PREY,"Sheep","Orange",SHEEP_BIRTH_CYCLES,SHEEP_LIFE_CYCLES,SHEEP_DISTANCE_TO_MOVE)
+	SHEEP.Dies=True
+	SHEEP.Reproduces=True
+	SHEEP.Forages=True
+
+	# wolves eat the sheep
+	WOLF=Animal.Species(TYPE_PREDATOR,"Wolf","Red",WOLF_BIRTH_CYCLES,WOLF_LIFE_CYCLES,WOLF_DISTANCE_TO_MOVE)
+	WOLF.Dies=True
+	WOLF.Reproduces=True
+	WOLF.Eats=(TYPE_PREY,DISTANCE_TO_EAT)
+
+	return(SHEEP,WOLF)
+
+#################################################################
+# The animals the world starts with
+# Output:
+#  list of (Species,Number,Ammo) for each type of animal
+#################################################################
+
+def StartingAnimals():
+	SHEEP,WOLF=CreateSpecies()
+	return([(SHEEP,NUM_SHEEP,0),(WOLF,NUM_WOLVES,0)])
+
+#################################################################
+# Count the number of sheep and wolves that are alive
+#################################################################
+
+def CountAnimals(TheWorld):
+	return(TheWorld.TheAnimals.Count(TYPE_PREY),TheWorld.TheAnimals.Count(TYPE_PREDATOR))
+
+#################################################################
+# The statistics for the last cycle (see Stats.py)
+# Output:
+#  list of (Name,Value) for the cycle
+#################################################################
+
+def Statistics(TheWorld):
+	NumSheep,NumWolves=CountAnimals(TheWorld)
+	Events=TheWorld.Events
+	return([("Cycle",TheWorld.Cycle),("NumSheep",NumSheep),("NumWolves",NumWolves),
+		("Births",Events.get("Births",0)),("Deaths",Events.get("Deaths",0)),("Eaten",Events.get("Eaten",0)),
+		("GrassCover",TheWorld.TheFood.PercentCover())])
@@ -0,0 +1,204 @@
+#################################################################
+# The HUMAN/ZOMBIE model.
+# This file sets up the model for the engine in Core_ABM (see
+# Core_ABM/Scenario.py).  "Veg" is the vegetation (food) and ammo.
+# Animals are humans and if there is a zombie where the human feeds on the food (green),
+# the ZOMBIES feed on the HUMAN and turns it into a zombie.
+#
+# The human starts out with 0 Ammo, but there is a 1/100 chance that Ammo will spawn (light grey)
+# if the human picks up the Ammo, they can use it to shoot the Zombie, but each time they shoot they
+# reduce their Ammo by 1. They cannot shoot if they have no ammo.
+#
+# The model beings with:
+# - Certain percent cover of grass
+# - Specified number of HUMAN
+# - Specified number of ZOMBIES
+# - Specified amount of AMMO
+#
+# The model repeats in an infinite number of "cycles".  Each cycle
+# repesents about a month for the default setup but this is really
+# arbitrary and can have different meanings.  On each cycle the
+# model is updated as follows:
+# - If a patch of grass is empty and enough cycles has passed, the
+#   grass will reappear and be available for eating
+# - If a HUMAN is close enough to food or ammo, it will eat it
+# - If a HUMAN has gone a specified number of cycles without eating,
+#   it will die
+# - if a HUMAN has gone a specified number of cycles from their last
+#   birth, they will birth another HUMAN
+# - if a HUMAN is within a specified distance from a ZOMBIE, it will shoot it if it has ammo
+# - If a ZOMBIE is within a specified distance from a HUMAN, it will eat it and turn the human into a ZOMBIE
+# - ZOMBIES do not die unless a human shoots it, and ZOMBIES do not give birth
+#
+# This model technically models just the female HUMAN (or other herbivore)
+# and ZOMBIES (ZOMBIE).  It could also be interpreted as modeling
+# flocks of HUMAN and packs of ZOMBIES.  The model could be modified in
+# a variety of ways to model other species and in different ways.
+#
+# To run the model in a window: python Core_ABM/Test.py Zombie_ABM
+# To run the model without a window: python Core_ABM/Headless.py Zombie_ABM
+#
+# Author: Jim Graham
+# Modified by: Melissa Kimble
+# Modification Date: 4/21/2015
+#################################################################
+
+# Import our custom modules
+import Animal # module with the class to create HUMAN and ZOMBIEs
+
+#################################################################
+# Model constants (modify these to see different model effects)
+#################################################################
+
+NAME="HUMAN/ZOMBIE" # name of the model (for the window and the results)
+
+TYPE_HUMAN=1 # definition for  HUMAN item (e.g. sheep)
+TYPE_ZOMBIE=2 # definition for a ZOMBIE (e.g. wolf)
+
+WORLD_WIDTH=500 # width of the world, in pixels
+WORLD_HEIGHT=500 # height of the world, in pixels
+CELL_SIZE=10 # width and height of each patch of grass, in pixels
+
+PERCENT_GRASS_COVER=100 # Starting cover of grass (50)
+GRASS_REGROW_CYCLES=25 # Number of cycles to regrow one patch of grass (100)
+AMMO_CHANCE=100 # 1 in AMMO_CHANCE patches that grow back are Ammo instead of grass
+
+# Keep the grass in tiles that are only created when an animal first uses them (see
+# TiledVeg.py), for worlds too big to hold every patch.  Up to MAX_TILES tiles are kept
+# in memory and the rest are moved to files in SPILL_PATH (None to keep them all).
+USE_TILES=False
+MAX_TILES=None
+SPILL_PATH=None
+
+NUM_HUMAN=5 # number of HUMAN to start with
+HUMAN_BIRTH_CYCLES=50 # number of cycles before each HUMAN repoduces
+HUMAN_LIFE_CYCLES=20 # number of cycles until HUMAN dies if they cannot find food
+HUMAN_DISTANCE_TO_MOVE=5 # distance HUMAN can move in each cycle, in pixels.
+DistanceToRun=7
+Ammo=0
+DistanceToShoot=10
+
+NUM_ZOMBIES=10 # starting number of ZOMBIES
+ZOMBIE_BIRTH_CYCLES=1 # number of cycles before each ZOMBIE repoduces
+ZOMBIE_LIFE_CYCLES=1 # number of cycles before each ZOMBIE dies if they cannot find a HUMAN to eat
+DISTANCE_TO_EAT=5 # how close a ZOMBIE needs to be to a HUMAN item to consume it, in pixels
+ZOMBIE_DISTANCE_TO_MOVE=3 # distance ZOMBIE can move in each cycle, in pixels
+DistanceToChase=20
+
+# 0 for a ZOMBIE (HUMAN) to take a step for every HUMAN (ZOMBIE) in the world when it
+# chases (runs), or the number of nearest HUMAN (ZOMBIES) within reach to take one
+# step from (see Animal.MoveToNearest).  With 0 the distance moved grows with the number
+# of animals.
+NEAREST_TARGETS=0
+
+# 0 for a HUMAN to only find food and ammo by stepping on them by chance, or the distance
+# in pixels it looks for the nearest patch with food or ammo in it when its own patch is
+# empty, and takes a step towards it (see Animal.Seek).
+SEEK_DISTANCE=0
+
+# Use a spatial grid so animals only look at the animals near them when shooting and
+# eating instead of every animal in the world (see SpatialGrid.py).  The results are
+# the same with or without it.
+USE_SPATIAL_GRID=True
+
+# True for every HUMAN to shoot and every ZOMBIE to infect at the same time, after all of
+# them have aged, instead of one animal at a time in the order they are updated (see
+# AnimalStore.py and Animal.HuntAll).  The AnimalArrays are always updated this way.
+BATCH_HUNTING=False
+
+# Keep all of the animals in NumPy arrays and update them all at once instead of
+# one AnimalClass object at a time (see AnimalArrays.py).  This is much faster for
+# large numbers of animals but can only be run headless.
+USE_ARRAYS=False
+
+# Use loops compiled with Numba, if it is installed, to find the animals within reach
+# and move the animals in NumPy arrays (see Kernels.py).  The results are the same with
+# or without Numba.
+USE_NUMBA=True
+
+# Split the world into this many strips, each run by its own process with the animals
+# in NumPy arrays (see Parallel.py).  Only used by Headless.py.
+NUM_WORKERS=1
+
+PRINT_EVENTS=True # print deaths, shootings and infections in Test.py
+
+# Write the statistics for every cycle to this CSV file (see Stats.py), None for no file
+STATS_FILE=None
+
+# Save the whole model to this folder every CHECKPOINT_EVERY cycles (see Checkpoint.py),
+# None for no checkpoints.  Headless.py carries on from the checkpoint if it is there.
+CHECKPOINT_PATH=None
+CHECKPOINT_EVERY=100
+
+# Time each phase of every cycle and print where the time went at the end of the run
+# (see Profiler.py).  The times for each cycle are also written to PROFILE_FILE if it is set.
+PROFILE=False
+PROFILE_FILE=None
+
+# Model constants and the values to run for each in Batch.py
+PARAMETER_GRID={
+	"NUM_HUMAN":[5,20],
+	"NUM_ZOMBIES":[10],
+	"DistanceToShoot":[10,20],
+	"DistanceToChase":[20],
+	"GRASS_REGROW_CYCLES":[25],
+}
+
+COUNT_NAMES=("NumHUMAN","NumZOMBIES") # names of the values from CountAnimals()
+
+#################################################################
+# Create the Species for the HUMAN and the ZOMBIEs from the model
+# constants.  Every animal of a type shares the same Species.
+# Output:
+#  (HUMAN,ZOMBIE) Species objects
+#################################################################
+
+def CreateSpecies():
+	# HUMAN eat food, pick up ammo, shoot ZOMBIEs and run away from them
+	HUMAN=Animal.Species(TYPE_HUMAN,"HUMAN","Red",HUMAN_BIRTH_CYCLES,HUMAN_LIFE_CYCLES,HUMAN_DISTANCE_TO_MOVE)
+	HUMAN.Dies=True
+	HUMAN.Reproduces=True
+	HUMAN.Forages=True
+	HUMAN.Shoots=(TYPE_ZOMBIE,DistanceToShoot)
+	HUMAN.Flees=(TYPE_ZOMBIE,DistanceToRun)
+	HUMAN.NearestTargets=NEAREST_TARGETS
+	HUMAN.Seeks=SEEK_DISTANCE
+
+	# ZOMBIEs never die of hunger or give birth, they turn the HUMAN they eat into ZOMBIEs
+	ZOMBIE=Animal.Species(TYPE_ZOMBIE,"ZOMBIE","Black",ZOMBIE_BIRTH_CYCLES,ZOMBIE_LIFE_CYCLES,ZOMBIE_DISTANCE_TO_MOVE)
+	ZOMBIE.Infects=(TYPE_HUMAN,DISTANCE_TO_EAT)
+	ZOMBIE.Chases=(TYPE_HUMAN,DistanceToChase)
+	ZOMBIE.NearestTargets=NEAREST_TARGETS
+
+	return(HUMAN,ZOMBIE)
+
+#################################################################
+# The animals the world starts with
+# Output:
+#  list of (Species,Number,Ammo) for each type of animal
+#################################################################
+
+def StartingAnimals():
+	HUMAN,ZOMBIE=CreateSpecies()
+	return([(HUMAN,NUM_HUMAN,Ammo),(ZOMBIE,NUM_ZOMBIES,0)])
+
+#################################################################
+# Count the number of HUMAN and ZOMBIEs that are alive
+#################################################################
+
+def CountAnimals(TheWorld):
+	return(TheWorld.TheAnimals.Count(TYPE_HUMAN),TheWorld.TheAnimals.Count(TYPE_ZOMBIE))
+
+#################################################################
+# The statistics for the last cycle (see Stats.py)
+# Output:
+#  list of (Name,Value) for the cycle
+#################################################################
+
+def Statistics(TheWorld):
+	NumHUMAN,NumZOMBIES=CountAnimals(TheWorld)
+	Events=TheWorld.Events
+	return([("Cycle",TheWorld.Cycle),("NumHUMAN",NumHUMAN),("NumZOMBIES",NumZOMBIES),
+		("Births",Events.get("Births",0)),("Deaths",Events.get("Deaths",0)),
+		("Infections",Events.get("Infections",0)),("Shots",Events.get("Shots",0)),
+		("Ammo",TheWorld.TheAnimals.TotalAmmo()),("FoodCover",TheWorld.TheFood.PercentCover())])